@@ -5,13 +5,18 @@ from pydantic import field_validator
 
 class Settings(BaseSettings):
     # Server settings
+    host: str = "0.0.0.0"
     port: int = 8000
     debug: bool = False
+    production: bool = False  # Multi-worker server (app.server); otherwise one process with auto-reload
+    workers: int = 0  # Production worker processes; 0 uses one per CPU
+    graceful_shutdown_seconds: int = 30  # Time in-flight requests get to finish on shutdown
 
     # Supabase settings
     supabase_url: str = "https://placeholder.supabase.co"
     supabase_key: str = "placeholder_key"
     supabase_service_role_key: Optional[str] = None
+    supabase_max_workers: int = 8  # Threads running blocking Supabase queries
 
     # OpenAI settings (not used in simplified version)
     openai_api_key: str = ""
@@ -23,10 +28,49 @@ class Settings(BaseSettings):
     jwt_secret_key: str = ""
     jwt_algorithm: str = "HS256"
     jwt_expiration_hours: int = 24 * 7  # 7 days
+    token_cache_size: int = 10000  # Verified tokens remembered; 0 disables the cache
+    token_cache_ttl_seconds: int = 300  # Re-verify cached tokens at least this often
+
+    # Password hashing
+    bcrypt_rounds: int = 12  # Cost factor; each +1 doubles the hashing time
+    password_hash_workers: int = 2  # Threads running bcrypt off the event loop
 
     # CORS settings
     allowed_origins: str = "http://localhost:3000,http://127.0.0.1:3000,http://localhost:8000,https://ai-career-guidance-eight.vercel.app,https://ai-career-guidance-4zqo.onrender.com"
 
+    # Storage backend: "supabase", "memory" or "sqlite" (default: supabase if configured, else memory)
+    storage_backend: Optional[str] = None
+    sqlite_path: str = "career_guidance.db"
+
+    # In-memory storage (used when Supabase is not configured)
+    memory_max_profiles: int = 10000
+    memory_max_chat_messages: int = 100  # Per user
+    memory_storage_path: Optional[str] = None  # Append-only log; None keeps data in memory only
+    memory_compact_min_records: int = 100000  # Log size (records) before it is compacted at runtime
+
+    # Guidance result cache
+    guidance_cache_size: int = 1024
+    guidance_cache_ttl_seconds: int = 3600
+
+    # Batch guidance (POST /api/guidance/batch)
+    guidance_batch_workers: int = 0  # Worker processes per host, split between server workers; 0 uses the CPU count
+    guidance_batch_chunk_size: int = 32  # Profiles sent to a worker per task
+    guidance_batch_max_profiles: int = 10000  # Per request
+
+    # Background analysis queue
+    analysis_workers: int = 2
+    analysis_max_attempts: int = 3
+    analysis_retry_delay_seconds: float = 1.0
+
+    # Metrics (GET /metrics, Prometheus format)
+    metrics_enabled: bool = True
+
+    # Per-request profiling (off unless a token or a sample rate is set)
+    profiling_token: Optional[str] = None  # Requests sending it in X-Profile-Token or ?profile= are profiled
+    profiling_sample_every: int = 0  # Also profile 1 in N requests; 0 disables sampling
+    profiling_dir: str = "profiles"
+    profiling_keep: int = 200  # Newest profiles kept on disk
+
     # Rate limiting
     rate_limit_requests: int = 100
     rate_limit_window: int = 900000  # 15 minutes in milliseconds
@@ -47,9 +91,3 @@ supabase_configured = (
     len(settings.supabase_key) > 10 and
     not settings.supabase_url.startswith("https://your-")  # Check for placeholder patterns
 )
-
-if supabase_configured:
-    print("Supabase is configured - using database storage")
-else:
-    print("Using in-memory storage (data won't persist between restarts)")
-    print("Database tables not set up - running in demo mode")
\ No newline at end of file
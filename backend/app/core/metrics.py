@@ -0,0 +1,207 @@
+"""
+Request and stage timing, exposed in Prometheus text format on /metrics.
+
+MetricsMiddleware records a latency histogram per route template. Code inside
+handlers times its stages with `with metrics.stage("name"):`: storage queries,
+each guidance generator and response serialization. Observing a value is a
+bisect and three additions under a lock, so instrumentation can stay on in
+production.
+
+Metrics are kept per process: with several workers, each serves its own
+numbers.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Samples of a collector: {((label, value), ...): sample}
+Collector = Callable[[], Dict[Tuple[Tuple[str, str], ...], float]]
+
+# Upper bounds in seconds, from a cache hit to a slow Supabase round trip
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """Cumulative-bucket histogram of durations"""
+
+    __slots__ = ("buckets", "counts", "total", "count", "_lock")
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # Last slot is +Inf
+        self.total = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        index = bisect_left(self.buckets, seconds)
+        with self._lock:
+            self.counts[index] += 1
+            self.total += seconds
+            self.count += 1
+
+    def snapshot(self) -> Tuple[List[int], float, int]:
+        """(cumulative bucket counts, sum, count)"""
+        with self._lock:
+            counts, total, count = list(self.counts), self.total, self.count
+        cumulative, running = [], 0
+        for value in counts:
+            running += value
+            cumulative.append(running)
+        return cumulative, total, count
+
+
+class StageTimer:
+    """Context manager that adds the time spent inside it to a histogram"""
+
+    __slots__ = ("histogram", "started")
+
+    def __init__(self, histogram: Histogram):
+        self.histogram = histogram
+
+    def __enter__(self) -> "StageTimer":
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> bool:
+        self.histogram.observe(time.perf_counter() - self.started)
+        return False
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(pairs: Iterable[Tuple[str, str]]) -> str:
+    return ",".join(f'{name}="{_escape(str(value))}"' for name, value in pairs)
+
+
+class Metrics:
+    """Registry of request and stage histograms plus collectors read at scrape time"""
+
+    def __init__(self):
+        self.started = time.time()
+        self._requests: Dict[Tuple[str, str], Histogram] = {}
+        self._responses: Dict[Tuple[str, str, int], int] = {}
+        self._stages: Dict[str, Histogram] = {}
+        self._collectors: List[Tuple[str, str, str, Collector]] = []
+        self._lock = threading.Lock()
+
+    def _histogram(self, table: Dict, key) -> Histogram:
+        histogram = table.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = table.setdefault(key, Histogram())
+        return histogram
+
+    def observe_request(self, method: str, route: str, status: int, seconds: float) -> None:
+        self._histogram(self._requests, (method, route)).observe(seconds)
+        key = (method, route, status)
+        with self._lock:
+            self._responses[key] = self._responses.get(key, 0) + 1
+
+    def stage(self, name: str) -> StageTimer:
+        """Time a block: `with metrics.stage("supabase"): ...`"""
+        return StageTimer(self._histogram(self._stages, name))
+
+    def register_collector(self, name: str, metric_type: str, help_text: str, collect: Collector) -> None:
+        """Add a metric family ("gauge" or "counter") whose samples are read at scrape time.
+
+        collect() returns {((label, value), ...): sample}; it is how existing
+        stats (caches, conditional requests) are exported without double counting.
+        """
+        self._collectors.append((name, metric_type, help_text, collect))
+
+    @staticmethod
+    def _render_histogram(lines: List[str], name: str, labels: str, histogram: Histogram) -> None:
+        cumulative, total, count = histogram.snapshot()
+        prefix = f"{labels}," if labels else ""
+        for bound, value in zip(histogram.buckets, cumulative):
+            lines.append(f'{name}_bucket{{{prefix}le="{bound}"}} {value}')
+        lines.append(f'{name}_bucket{{{prefix}le="+Inf"}} {cumulative[-1]}')
+        lines.append(f"{name}_sum{{{labels}}} {total}")
+        lines.append(f"{name}_count{{{labels}}} {count}")
+
+    def render(self) -> str:
+        """All metrics in Prometheus text exposition format"""
+        with self._lock:
+            requests = sorted(self._requests.items())
+            responses = sorted(self._responses.items())
+            stages = sorted(self._stages.items())
+
+        lines = [
+            "# HELP http_request_duration_seconds Time from request start to the end of the response",
+            "# TYPE http_request_duration_seconds histogram"
+        ]
+        for (method, route), histogram in requests:
+            self._render_histogram(lines, "http_request_duration_seconds", _labels((("method", method), ("route", route))), histogram)
+
+        lines += ["# HELP http_responses_total Responses by route and status", "# TYPE http_responses_total counter"]
+        for (method, route, status), count in responses:
+            lines.append(f"http_responses_total{{{_labels((('method', method), ('route', route), ('status', status)))}}} {count}")
+
+        lines += ["# HELP app_stage_duration_seconds Time spent in a stage of request handling", "# TYPE app_stage_duration_seconds histogram"]
+        for stage, histogram in stages:
+            self._render_histogram(lines, "app_stage_duration_seconds", _labels((("stage", stage),)), histogram)
+
+        for name, metric_type, help_text, collect in self._collectors:
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {metric_type}"]
+            try:
+                samples = collect()
+            except Exception as e:
+                print(f"Metrics collector {name} failed: {e}")
+                continue
+            for labels, value in samples.items():
+                lines.append(f"{name}{{{_labels(labels)}}} {value}")
+
+        lines += [
+            "# HELP process_start_time_seconds Start time of the process since unix epoch",
+            "# TYPE process_start_time_seconds gauge",
+            f"process_start_time_seconds {self.started}"
+        ]
+        return "\n".join(lines) + "\n"
+
+
+def route_label(scope: Scope) -> str:
+    """Route template for a request (never the raw path, which would explode the label set)"""
+    route = scope.get("route")
+    if route is None:
+        return "unmatched"
+    # Newer FastAPI keeps the router prefix on the effective route context
+    context = scope.get("fastapi", {}).get("effective_route_context")
+    return getattr(context, "path", None) or getattr(route, "path_format", None) or route.path
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording the latency and status of every HTTP request"""
+
+    def __init__(self, app: ASGIApp, registry: Optional[Metrics] = None):
+        self.app = app
+        self.registry = registry or metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            self.registry.observe_request(scope["method"], route_label(scope), status, time.perf_counter() - started)
+
+
+# Global instance
+metrics = Metrics()
@@ -0,0 +1,40 @@
+"""
+Password hashing off the event loop.
+
+bcrypt is deliberately slow (hundreds of milliseconds at the default cost), so
+hashing and verification run on a small dedicated thread pool. bcrypt releases
+the GIL while hashing, so the event loop keeps serving other requests.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import bcrypt
+
+from app.core.config import settings
+
+# Bounded so a registration burst queues up instead of starving the CPU
+password_executor = ThreadPoolExecutor(
+    max_workers=settings.password_hash_workers,
+    thread_name_prefix="bcrypt"
+)
+
+def _hash(password: str) -> str:
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(settings.bcrypt_rounds)).decode('utf-8')
+
+def _verify(password: str, hashed_password: str) -> bool:
+    try:
+        return bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
+    except ValueError:
+        # Malformed stored hash
+        return False
+
+async def hash_password(password: str) -> str:
+    """Hash a password with bcrypt on the password pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(password_executor, _hash, password)
+
+async def verify_password(password: str, hashed_password: str) -> bool:
+    """Check a password against a bcrypt hash on the password pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(password_executor, _verify, password, hashed_password)
@@ -0,0 +1,211 @@
+"""
+Opt-in per-request profiling.
+
+A request is profiled with cProfile when it carries the admin profiling token
+(`X-Profile-Token` header or `?profile=` query parameter), or when it is one
+of every `profiling_sample_every` requests. The profile is saved in
+`profiling_dir` twice: as collapsed stacks (.folded, one "a;b;c microseconds"
+line per stack, for flamegraph.pl, speedscope or inferno) and as a pstats dump
+(.prof, for snakeviz or `python -m pstats`). The response names the files in
+an `X-Profile` header. With `X-Profile-Output: inline` the folded profile is
+returned as the response body instead.
+
+ProfilingMiddleware is only installed when a token or a sample rate is
+configured, so with profiling off requests pay nothing.
+
+cProfile sees the event loop thread only, while the request is in flight:
+coroutines of other requests interleaved with it are included, and work in
+thread pools (storage queries, password hashing) shows up as waiting. One
+request is profiled at a time per process; requests arriving meanwhile run
+unprofiled.
+"""
+
+import cProfile
+import hmac
+import itertools
+import os
+import pstats
+import re
+import time
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import route_label
+
+TOKEN_HEADER = b"x-profile-token"
+OUTPUT_HEADER = b"x-profile-output"
+QUERY_PARAMETER = "profile"
+
+# pstats function key: (filename, line, function name)
+FunctionKey = Tuple[str, int, str]
+
+
+def function_label(key: FunctionKey) -> str:
+    filename, line, name = key
+    if filename == "~":
+        label = name  # Built-in, e.g. "<method 'sort' of 'list' objects>"
+    else:
+        # Shorten to the package path: .../site-packages/fastapi/routing.py -> fastapi/routing.py
+        parts = filename.replace("\\", "/").split("/")
+        for marker in ("site-packages", "backend", "lib"):
+            if marker in parts:
+                parts = parts[len(parts) - parts[::-1].index(marker):]
+                break
+        label = f"{name} ({'/'.join(parts[-3:])}:{line})"
+    return label.replace(";", ",")
+
+
+def collapse(stats: pstats.Stats, max_depth: int = 64) -> List[str]:
+    """Collapsed stacks ("a;b;c microseconds") from cProfile's call graph.
+
+    cProfile keeps caller/callee totals rather than whole stacks, so a
+    function's time is split between its callers in proportion to the time
+    each call edge accounts for, as flameprof does. Recursion is cut at the
+    first repeated function.
+    """
+    entries: Dict[FunctionKey, tuple] = stats.stats  # key -> (cc, nc, self, cumulative, callers)
+    callees: Dict[FunctionKey, List[Tuple[FunctionKey, float]]] = {}
+    for key, (_, _, _, _, callers) in entries.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, []).append((key, edge[3]))
+
+    totals: Dict[str, float] = {}
+
+    def walk(key: FunctionKey, share: float, path: List[str], seen: frozenset) -> None:
+        _, _, self_time, cumulative, _ = entries[key]
+        path = path + [function_label(key)]
+        scale = share / cumulative if cumulative else 0.0
+        if self_time * scale > 0:
+            stack = ";".join(path)
+            totals[stack] = totals.get(stack, 0.0) + self_time * scale
+        if len(path) >= max_depth:
+            return
+        for callee, edge_time in callees.get(key, ()):
+            if callee not in seen and edge_time * scale > 0:
+                walk(callee, edge_time * scale, path, seen | {callee})
+
+    roots = [key for key, entry in entries.items() if not entry[4]]
+    for root in roots:
+        walk(root, entries[root][3], [], frozenset([root]))
+
+    return [f"{stack} {round(seconds * 1e6)}" for stack, seconds in sorted(totals.items()) if seconds >= 5e-7]
+
+
+class RequestProfiler:
+    """Decides which requests to profile and writes their profiles"""
+
+    def __init__(self, token: Optional[str], sample_every: int, directory: str, keep: int):
+        self.token = token.encode() if token else None
+        self.sample_every = sample_every
+        self.directory = directory
+        self.keep = keep
+        self.active = False
+        self.profiled = 0
+        self._requests = itertools.count(1)
+
+    def requested(self, scope: Scope) -> Tuple[bool, bool]:
+        """(profile this request, return the profile inline)"""
+        if self.token is None:
+            return False, False
+        supplied = None
+        inline = False
+        for name, value in scope["headers"]:
+            if name == TOKEN_HEADER:
+                supplied = value
+            elif name == OUTPUT_HEADER:
+                inline = value.lower() == b"inline"
+        if supplied is None and QUERY_PARAMETER.encode() in scope["query_string"]:
+            query = dict(parse_qsl(scope["query_string"].decode("latin-1")))
+            supplied = query.get(QUERY_PARAMETER, "").encode()
+        if supplied is not None and hmac.compare_digest(supplied, self.token):
+            return True, inline
+        return False, False
+
+    def sampled(self) -> bool:
+        return self.sample_every > 0 and next(self._requests) % self.sample_every == 0
+
+    def profile_name(self, scope: Scope, status: int) -> str:
+        """Base name of a profile's files, e.g. 20260118-101502-4242-7-get-api_dashboard-200"""
+        self.profiled += 1
+        route = re.sub(r"[^A-Za-z0-9]+", "_", route_label(scope)).strip("_") or "root"
+        return f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{self.profiled}-{scope['method'].lower()}-{route}-{status}"
+
+    def save(self, profile: cProfile.Profile, name: str) -> List[str]:
+        """Write the .folded and .prof files; returns the folded lines"""
+        stats = pstats.Stats(profile)
+        folded = collapse(stats)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(os.path.join(self.directory, f"{name}.folded"), "w", encoding="utf-8") as f:
+                f.write("\n".join(folded) + "\n")
+            stats.dump_stats(os.path.join(self.directory, f"{name}.prof"))
+            self._prune()
+        except OSError as e:
+            print(f"Error saving profile {name}: {e}")
+        return folded
+
+    def _prune(self) -> None:
+        """Keep only the newest `keep` profiles"""
+        paths = [os.path.join(self.directory, entry) for entry in os.listdir(self.directory) if entry.endswith((".folded", ".prof"))]
+        paths.sort(key=os.path.getmtime)
+        for stale in paths[:max(0, len(paths) - self.keep * 2)]:
+            try:
+                os.remove(stale)
+            except OSError:
+                pass
+
+
+class ProfilingMiddleware:
+    """ASGI middleware profiling requests that ask for it, or a sample of all requests"""
+
+    def __init__(self, app: ASGIApp, profiler: RequestProfiler):
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        requested, inline = self.profiler.requested(scope)
+        if not (requested or self.profiler.sampled()) or self.profiler.active:
+            await self.app(scope, receive, send)
+            return
+
+        self.profiler.active = True
+        profile = cProfile.Profile()
+        name = ""
+
+        async def send_profiled(message: Message) -> None:
+            nonlocal name
+            if message["type"] == "http.response.start":
+                # The route is matched by now, and the status known
+                name = self.profiler.profile_name(scope, message["status"])
+                message = {**message, "headers": [*message.get("headers", []), (b"x-profile", name.encode())]}
+            if not inline:
+                await send(message)
+
+        try:
+            profile.enable()
+            try:
+                await self.app(scope, receive, send_profiled)
+            finally:
+                profile.disable()
+        finally:
+            self.profiler.active = False
+
+        folded = self.profiler.save(profile, name or self.profiler.profile_name(scope, 500))
+        if inline:
+            body = ("\n".join(folded) + "\n").encode()
+            await send({
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", b"text/plain; charset=utf-8"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"x-profile", name.encode())
+                ]
+            })
+            await send({"type": "http.response.body", "body": body})
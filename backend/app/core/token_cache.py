@@ -0,0 +1,93 @@
+"""
+Cache of verified JWTs.
+
+A dashboard session sends the same bearer token on every request, so after the
+first full verification the token's digest is mapped to (user_id, exp). Entries
+never outlive the token's own expiry and are evicted LRU. Only successfully
+verified tokens are cached.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from app.core.config import settings
+
+
+def token_digest(token: str) -> bytes:
+    """Fixed-size key for a token, so raw tokens are not kept in memory"""
+    return hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+
+
+class TokenCache:
+    """Thread-safe LRU map of token digest -> (user_id, expires_at) with hit/miss counters"""
+
+    def __init__(self, max_entries: int = 10000, max_ttl_seconds: float = 300):
+        self.max_entries = max_entries
+        # Upper bound on how long a verified token is trusted without re-checking
+        self.max_ttl_seconds = max_ttl_seconds
+        self._entries: "OrderedDict[bytes, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, token: str) -> Optional[str]:
+        """Get the user ID of a verified, unexpired token, or None"""
+        key = token_digest(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            user_id, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return user_id
+
+    def set(self, token: str, user_id: str, exp: Optional[float] = None) -> None:
+        """Remember a verified token until its exp claim (capped at max_ttl_seconds)"""
+        if self.max_entries <= 0:
+            return
+        expires_at = time.time() + self.max_ttl_seconds
+        if exp is not None:
+            expires_at = min(expires_at, float(exp))
+        key = token_digest(token)
+        with self._lock:
+            self._entries[key] = (user_id, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Cache counters"""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations
+            }
+
+
+# Global instance
+token_cache = TokenCache(
+    max_entries=settings.token_cache_size,
+    max_ttl_seconds=settings.token_cache_ttl_seconds
+)
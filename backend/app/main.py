@@ -1,7 +1,7 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-import uvicorn
+from fastapi.responses import JSONResponse, PlainTextResponse
 import os
 from dotenv import load_dotenv
 
@@ -12,7 +12,31 @@ load_dotenv()
 from app.core.config import settings
 
 # Import routers
-from app.routers import auth, profile, dashboard, chat
+from app.routers import auth, profile, dashboard, chat, catalog, guidance
+from app.services.analysis_queue import analysis_queue
+from app.storage import storage
+from app.services.guidance_cache import guidance_cache
+from app.services.guidance_batch import shutdown_batch_executor
+from app.core.token_cache import token_cache
+from app.utils.responses import conditional_stats
+from app.core.metrics import metrics, MetricsMiddleware
+from app.core.profiling import ProfilingMiddleware, RequestProfiler
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start background workers on startup; drain them, stop the batch pool and close storage on shutdown"""
+    if storage.name == "supabase":
+        print("Supabase is configured - using database storage")
+    elif storage.name == "memory":
+        print("Using in-memory storage (data won't persist between restarts)")
+        print("Database tables not set up - running in demo mode")
+    else:
+        print(f"Using {storage.name} storage")
+    analysis_queue.start()
+    yield
+    await analysis_queue.stop()
+    shutdown_batch_executor()
+    await storage.close()
 
 # Create FastAPI app
 app = FastAPI(
@@ -20,7 +44,8 @@ app = FastAPI(
     description="AI-powered personalized learning, career guidance, and resume readiness platform",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # CORS middleware
@@ -39,11 +64,29 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Opt-in request profiling; not installed at all when off
+if settings.profiling_token or settings.profiling_sample_every > 0:
+    app.add_middleware(
+        ProfilingMiddleware,
+        profiler=RequestProfiler(
+            settings.profiling_token,
+            settings.profiling_sample_every,
+            settings.profiling_dir,
+            settings.profiling_keep
+        )
+    )
+
+# Request timing for /metrics (outermost, so it sees the whole response time)
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+
 # Include routers
 app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
 app.include_router(profile.router, prefix="/api/profile", tags=["Profile Management"])
 app.include_router(dashboard.router, prefix="/api/dashboard", tags=["Dashboard"])
 app.include_router(chat.router, prefix="/api/chat", tags=["Chat"])
+app.include_router(catalog.router, prefix="/api/catalog", tags=["Catalog"])
+app.include_router(guidance.router, prefix="/api/guidance", tags=["Guidance"])
 
 # Health check endpoint
 @app.get("/health")
@@ -52,9 +95,44 @@ async def health_check():
         "success": True,
         "message": "AI Career Guidance Platform API is running",
         "version": "1.0.0",
-        "status": "healthy"
+        "status": "healthy",
+        "caches": {
+            "guidance": guidance_cache.stats(),
+            "tokens": token_cache.stats()
+        },
+        "conditional_requests": conditional_stats.stats()
     }
 
+def cache_sizes():
+    return {
+        (("cache", name),): stats["size"]
+        for name, stats in (("guidance", guidance_cache.stats()), ("tokens", token_cache.stats()))
+    }
+
+def cache_events():
+    return {
+        (("cache", name), ("event", event)): stats[event]
+        for name, stats in (("guidance", guidance_cache.stats()), ("tokens", token_cache.stats()))
+        for event in ("hits", "misses", "evictions", "expirations")
+    }
+
+def conditional_requests():
+    return {
+        (("route", route), ("result", result)): counts[key]
+        for route, counts in conditional_stats.stats().items()
+        for result, key in (("all", "requests"), ("not_modified", "not_modified"))
+    }
+
+metrics.register_collector("app_cache_entries", "gauge", "Entries in each in-process cache", cache_sizes)
+metrics.register_collector("app_cache_events_total", "counter", "Cache hits, misses, evictions and expirations", cache_events)
+metrics.register_collector("app_conditional_requests_total", "counter", "Conditional GETs, and how many were answered 304", conditional_requests)
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics_endpoint():
+    if not settings.metrics_enabled:
+        return PlainTextResponse("Metrics are disabled\n", status_code=404)
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
 # Global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
@@ -69,10 +147,17 @@ async def global_exception_handler(request: Request, exc: Exception):
 
 if __name__ == "__main__":
     port = int(os.getenv("PORT", 8000))
-    uvicorn.run(
-        "app.main:app",
-        host="0.0.0.0",
-        port=port,
-        reload=True,
-        log_level="info"
-    )
\ No newline at end of file
+    if settings.production:
+        from app.server import serve
+
+        serve(port=port)
+    else:
+        import uvicorn
+
+        uvicorn.run(
+            "app.main:app",
+            host="0.0.0.0",
+            port=port,
+            reload=True,
+            log_level="info"
+        )
\ No newline at end of file
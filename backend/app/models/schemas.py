@@ -75,6 +75,13 @@ class ResumeGuidance(BaseModel):
     keyword_suggestions: List[str]
     ats_friendly_tips: List[str]
 
+# Batch guidance models
+class ProfileAnalysis(BaseModel):
+    career_recommendations: CareerRecommendation
+    skill_gap_analysis: SkillGapAnalysis
+    job_recommendations: List[JobRecommendation]
+    resume_guidance: ResumeGuidance
+
 # Dashboard models
 class DashboardData(BaseModel):
     user_profile: Optional[UserProfileResponse] = None
@@ -3,17 +3,19 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from app.models.schemas import (
     UserCreate, UserResponse, LoginRequest, TokenResponse, APIResponse
 )
-from app.utils.supabase_client import supabase
-import jwt
+from app.utils.supabase_client import get_supabase, execute_async
 from datetime import datetime, timedelta
 from app.core.config import settings
-import bcrypt
+from app.core.passwords import hash_password, verify_password
+from app.core.token_cache import token_cache
 
 router = APIRouter()
 security = HTTPBearer()
 
 def create_access_token(data: dict) -> str:
     """Create JWT access token"""
+    # PyJWT pulls in cryptography, so it is imported on first use rather than at startup
+    import jwt
     to_encode = data.copy()
     expire = datetime.utcnow() + timedelta(hours=settings.jwt_expiration_hours)
     to_encode.update({"exp": expire})
@@ -22,6 +24,12 @@ def create_access_token(data: dict) -> str:
 
 def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)) -> str:
     """Verify JWT token and return user ID"""
+    # Tokens already verified (and not yet expired) skip signature verification
+    user_id = token_cache.get(credentials.credentials)
+    if user_id is not None:
+        return user_id
+
+    import jwt
     try:
         payload = jwt.decode(
             credentials.credentials,
@@ -31,6 +39,7 @@ def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security))
         user_id: str = payload.get("sub")
         if user_id is None:
             raise HTTPException(status_code=401, detail="Invalid authentication credentials")
+        token_cache.set(credentials.credentials, user_id, payload.get("exp"))
         return user_id
     except jwt.PyJWTError:
         raise HTTPException(status_code=401, detail="Invalid authentication credentials")
@@ -40,21 +49,22 @@ async def register(user_data: UserCreate):
     """Register a new user"""
     try:
         # Check if user already exists
-        existing_user = supabase.table('users').select('id').eq('email', user_data.email).execute()
+        existing_user = await execute_async(get_supabase().table('users').select('id').eq('email', user_data.email))
         if existing_user.data:
             raise HTTPException(status_code=400, detail="User with this email already exists")
 
         # Hash password
-        hashed_password = bcrypt.hashpw(user_data.password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+        hashed_password = await hash_password(user_data.password)
 
         # Create user in Supabase Auth (simplified - in production you'd use Supabase Auth)
         # For now, we'll store directly in our users table
         user_record = {
             "email": user_data.email,
             "name": user_data.name,
+            "password_hash": hashed_password
         }
 
-        result = supabase.table('users').insert(user_record).execute()
+        result = await execute_async(get_supabase().table('users').insert(user_record))
 
         if not result.data:
             raise HTTPException(status_code=400, detail="Failed to create user")
@@ -80,20 +90,42 @@ async def register(user_data: UserCreate):
         print(f"Registration error: {e}")
         raise HTTPException(status_code=500, detail="Server error during registration")
 
+async def set_first_password(user: dict, password: str) -> dict:
+    """Store the password of an account created before passwords were stored.
+
+    Such accounts were logged in by email alone, so the first login sets
+    their password. The update only applies while no hash is stored, so of
+    two concurrent first logins the loser is checked against the winner's hash.
+    """
+    hashed_password = await hash_password(password)
+    result = await execute_async(
+        get_supabase().table('users').update({"password_hash": hashed_password})
+        .eq('id', user["id"]).is_('password_hash', 'null')
+    )
+    if result.data:
+        return result.data[0]
+
+    current = await execute_async(get_supabase().table('users').select('*').eq('id', user["id"]))
+    if not current.data or not await verify_password(password, current.data[0].get("password_hash") or ""):
+        raise HTTPException(status_code=401, detail="Invalid credentials")
+    return current.data[0]
+
 @router.post("/login", response_model=APIResponse)
 async def login(login_data: LoginRequest):
     """Login user"""
     try:
         # Get user from database
-        user_result = supabase.table('users').select('*').eq('email', login_data.email).execute()
+        user_result = await execute_async(get_supabase().table('users').select('*').eq('email', login_data.email))
 
         if not user_result.data:
             raise HTTPException(status_code=401, detail="Invalid credentials")
 
         user = user_result.data[0]
 
-        # In a real application, you'd verify the password against the stored hash
-        # For this demo, we'll skip password verification since we're not storing passwords
+        if not user.get("password_hash"):
+            user = await set_first_password(user, login_data.password)
+        elif not await verify_password(login_data.password, user["password_hash"]):
+            raise HTTPException(status_code=401, detail="Invalid credentials")
 
         # Create access token
         access_token = create_access_token({"sub": user["id"]})
@@ -118,7 +150,7 @@ async def login(login_data: LoginRequest):
 async def get_current_user(user_id: str = Depends(verify_token)):
     """Get current user information"""
     try:
-        user_result = supabase.table('users').select('*').eq('id', user_id).execute()
+        user_result = await execute_async(get_supabase().table('users').select('*').eq('id', user_id))
 
         if not user_result.data:
             raise HTTPException(status_code=404, detail="User not found")
@@ -0,0 +1,51 @@
+from fastapi import APIRouter, HTTPException, Request, Response
+from app.models.schemas import APIResponse
+from app.services.guidance_catalog import GuidanceCatalog, get_catalog, on_catalog_reload
+from app.utils.responses import make_etag, etag_matches, not_modified, conditional_stats
+from typing import Optional, Tuple
+
+router = APIRouter()
+
+# (ETag, body) of the serialized catalog; rebuilt after a catalog reload
+_rendered: Optional[Tuple[str, bytes]] = None
+
+def render_catalog() -> Tuple[str, bytes]:
+    """Serialize the catalog once and derive its ETag from the content"""
+    global _rendered
+    if _rendered is None:
+        catalog = get_catalog()
+        body = APIResponse(
+            success=True,
+            data={
+                "skill_categories": catalog.skill_categories,
+                "skill_topics": catalog.skill_topics,
+                "learning_resources": catalog.learning_resources
+            }
+        ).model_dump_json().encode("utf-8")
+        etag = make_etag(body)
+        _rendered = (etag, body)
+    return _rendered
+
+def _clear_rendered(catalog: GuidanceCatalog):
+    global _rendered
+    _rendered = None
+
+on_catalog_reload(_clear_rendered)
+
+@router.get("/", response_model=APIResponse)
+async def get_guidance_catalog(request: Request):
+    """Get the static skill catalog (categories, topics and learning resources)"""
+    try:
+        etag, body = render_catalog()
+        headers = {"ETag": etag, "Cache-Control": "public, max-age=3600"}
+
+        if etag_matches(request, etag):
+            conditional_stats.record("catalog", True)
+            return not_modified(headers)
+        conditional_stats.record("catalog", False)
+
+        return Response(content=body, media_type="application/json", headers=headers)
+
+    except Exception as e:
+        print(f"Catalog error: {e}")
+        raise HTTPException(status_code=500, detail="Server error retrieving catalog")
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, HTTPException, Depends
+from app.utils.responses import json_response
 from app.models.schemas import ChatRequest, APIResponse
 from app.services.openai_service import openai_service
-from app.utils.supabase_client import supabase
 from typing import Dict, Any
 
 router = APIRouter()
@@ -32,13 +32,13 @@ async def chat_with_assistant(
         else:
             response = "Thank you for sharing. Your information has been saved. Continue building your career step by step."
 
-        return APIResponse(
+        return json_response(APIResponse(
             success=True,
             data={
                 "message": response,
                 "timestamp": "2024-01-15T10:00:00Z"
             }
-        )
+        ))
 
     except Exception as e:
         print(f"Chat error: {e}")
@@ -50,14 +50,14 @@ async def get_chat_history(user_id: str = Depends(get_current_user_id)):
     try:
         # In a production app, you'd store chat history in the database
         # For now, return empty history
-        return APIResponse(
+        return json_response(APIResponse(
             success=True,
             data={
                 "messages": [],
                 "total": 0
             },
             message="Chat history feature coming soon"
-        )
+        ))
 
     except Exception as e:
         print(f"Chat history error: {e}")
@@ -74,10 +74,10 @@ async def submit_chat_feedback(
         # For now, just log it
         print(f"Chat feedback from user {user_id}: {feedback_data}")
 
-        return APIResponse(
+        return json_response(APIResponse(
             success=True,
             message="Feedback submitted successfully"
-        )
+        ))
 
     except Exception as e:
         print(f"Chat feedback error: {e}")
@@ -1,110 +1,175 @@
-from fastapi import APIRouter, HTTPException, Depends
-from app.utils.supabase_client import supabase
-from app.utils.memory_storage import memory_storage
+from fastapi import APIRouter, HTTPException, Depends, Request
+from app.storage import storage
 from app.services.career_guidance import career_guidance_service
-from app.core.config import supabase_configured
+from app.services.guidance_cache import cached_guidance_service
 from app.core.auth import get_current_user_id
-from app.models.schemas import APIResponse, DashboardData, UserProfileResponse
+from app.utils.responses import json_response, make_etag, etag_matches, not_modified, conditional_stats
+from app.services.guidance_catalog import get_catalog
+from app.models.schemas import (
+    APIResponse, DashboardData, UserProfileResponse,
+    CareerRecommendation, SkillGapAnalysis, JobRecommendation, ResumeGuidance
+)
+from typing import Dict, Any, Optional
+import json
 
 router = APIRouter(tags=["dashboard"])
 
+def apply_stored_analysis(dashboard_data: DashboardData, stored: Dict[str, Any], profile_data: Dict[str, Any]):
+    """Fill dashboard data from stored analysis rows"""
+    career_data = stored.get('career_recommendations')
+    if career_data:
+        certifications = career_data.get('certifications')
+        if certifications is None:
+            # Stored before certifications were; they follow from the profile
+            certifications = cached_guidance_service.generate_career_recommendations(profile_data).certifications
+        dashboard_data.career_recommendations = CareerRecommendation(
+            career_path=career_data['career_path'],
+            short_term_goals=career_data['short_term_goals'],
+            long_term_goals=career_data['long_term_goals'],
+            industry_trends=career_data['industry_trends'],
+            salary_potential=career_data['salary_potential'],
+            certifications=certifications
+        )
+
+    skill_data = stored.get('skill_gap_analysis')
+    if skill_data:
+        # Catalog entries aren't stored with the analysis; look them up again
+        skill_categories, learning_resources, skill_topics = career_guidance_service.skill_catalog_slices(
+            list(skill_data['missing_skills']) + list(skill_data['recommended_skills'])
+        )
+        dashboard_data.skill_gap_analysis = SkillGapAnalysis(
+            missing_skills=skill_data['missing_skills'],
+            recommended_skills=skill_data['recommended_skills'],
+            skill_priority=skill_data['skill_priority'],
+            time_to_acquire=skill_data['time_to_acquire'],
+            skill_categories=skill_categories,
+            learning_resources=learning_resources,
+            skill_topics=skill_topics
+        )
+
+    job_rows = stored.get('job_recommendations')
+    if job_rows:
+        links = {}
+        if any(job.get('apply_link') is None or job.get('linkedin_link') is None for job in job_rows):
+            # Stored before links were; take them from the catalog jobs the generator picks
+            links = {
+                (job.title, job.company): job
+                for job in cached_guidance_service.generate_job_recommendations(profile_data)
+            }
+        dashboard_data.job_recommendations = [
+            JobRecommendation(
+                title=job['title'],
+                company=job['company'],
+                location=job['location'],
+                salary_range=job['salary_range'],
+                match_score=job['match_score'],
+                required_skills=job['required_skills'],
+                description=job['description'],
+                apply_link=job.get('apply_link') or stored_link(links, job, 'apply_link'),
+                linkedin_link=job.get('linkedin_link') or stored_link(links, job, 'linkedin_link')
+            ) for job in job_rows
+        ]
+
+    resume_data = stored.get('resume_guidance')
+    if resume_data:
+        dashboard_data.resume_guidance = ResumeGuidance(
+            strengths=resume_data['strengths'],
+            areas_for_improvement=resume_data['areas_for_improvement'],
+            suggested_sections=resume_data['suggested_sections'],
+            keyword_suggestions=resume_data['keyword_suggestions'],
+            ats_friendly_tips=resume_data['ats_friendly_tips']
+        )
+
+def stored_link(links: Dict[tuple, JobRecommendation], job: Dict[str, Any], field: str) -> str:
+    """A link missing from a stored job row, from the matching generated job ('#' like the generator)"""
+    generated = links.get((job['title'], job['company']))
+    return getattr(generated, field) if generated is not None else '#'
+
+def stored_analysis_current(stored: Dict[str, Any], profile_data: Dict[str, Any]) -> bool:
+    """Whether stored analysis rows were generated from the current profile.
+
+    They are missing while the background analysis of a new profile is
+    pending, and out of date while that of a resubmitted one is. Rows saved
+    before profile versions were stored are taken as current.
+    """
+    rows = [stored.get('career_recommendations'), stored.get('skill_gap_analysis'), stored.get('resume_guidance')]
+    if not all(rows):
+        return False
+    for row in rows:
+        if row.get('profile_id') is not None and str(row['profile_id']) != str(profile_data['id']):
+            return False
+        if row.get('profile_version') is not None and row['profile_version'] != profile_data['updated_at']:
+            return False
+    return True
+
+def apply_generated_analysis(dashboard_data: DashboardData, profile_data: Dict[str, Any]):
+    """Fill dashboard data with freshly generated analysis"""
+    dashboard_data.career_recommendations = cached_guidance_service.generate_career_recommendations(profile_data)
+    dashboard_data.skill_gap_analysis = cached_guidance_service.analyze_skill_gaps(profile_data)
+    dashboard_data.job_recommendations = cached_guidance_service.generate_job_recommendations(profile_data)
+    dashboard_data.resume_guidance = cached_guidance_service.generate_resume_guidance(profile_data)
+
+def dashboard_etag(user_id: str, profile_data: Optional[Dict[str, Any]], analysis: Optional[Dict[str, Any]]) -> str:
+    """ETag for everything the dashboard is built from.
+
+    Generated analysis depends only on the profile and the catalog; stored
+    analysis can change without the profile changing, so it is hashed too.
+    """
+    if not profile_data:
+        return make_etag(user_id, None)
+    analysis_digest = None
+    if analysis is not None:
+        analysis_digest = make_etag(json.dumps(analysis, sort_keys=True, default=str))
+    return make_etag(user_id, profile_data['id'], profile_data['updated_at'], get_catalog().version, analysis_digest)
+
 @router.get("/", response_model=APIResponse)
-async def get_dashboard_data(user_id: str = Depends(get_current_user_id)):
+async def get_dashboard_data(request: Request, user_id: str = Depends(get_current_user_id)):
     """Get user's dashboard data with career guidance"""
     try:
         dashboard_data = DashboardData(has_profile=False)
 
-        # Get user profile
-        profile_data = None
-        if supabase_configured:
-            # Use Supabase
-            profile_result = supabase.table('user_profiles').select('*').eq('user_id', user_id).execute()
-            if profile_result.data:
-                profile_data = profile_result.data[0]
-        else:
-            # Use memory storage
-            profile_data = memory_storage.get_user_profile(user_id)
+        # Get user profile and any stored analysis - one round-trip where the backend supports it
+        stored = await storage.get_dashboard(user_id)
+        profile_data = stored['user_profile']
+
+        # Unchanged since the client's copy: skip generation and serialization
+        etag = dashboard_etag(user_id, profile_data, stored['analysis'])
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if etag_matches(request, etag):
+            conditional_stats.record("dashboard", True)
+            return not_modified(headers)
+        conditional_stats.record("dashboard", False)
 
         if profile_data:
             dashboard_data.user_profile = UserProfileResponse(**profile_data)
             dashboard_data.has_profile = True
 
-            if supabase_configured:
-                # Retrieve stored AI analysis from database
+            if stored['analysis'] is not None and stored_analysis_current(stored['analysis'], profile_data):
+                # Use the stored AI analysis
                 try:
-                    # Get career recommendations
-                    career_result = supabase.table('career_recommendations').select('*').eq('user_id', user_id).execute()
-                    if career_result.data:
-                        career_data = career_result.data[0]
-                        from app.models.schemas import CareerRecommendation
-                        dashboard_data.career_recommendations = CareerRecommendation(
-                            career_path=career_data['career_path'],
-                            short_term_goals=career_data['short_term_goals'],
-                            long_term_goals=career_data['long_term_goals'],
-                            industry_trends=career_data['industry_trends'],
-                            salary_potential=career_data['salary_potential']
-                        )
-
-                    # Get skill gap analysis
-                    skill_result = supabase.table('skill_gap_analysis').select('*').eq('user_id', user_id).execute()
-                    if skill_result.data:
-                        skill_data = skill_result.data[0]
-                        from app.models.schemas import SkillGapAnalysis
-                        dashboard_data.skill_gap_analysis = SkillGapAnalysis(
-                            missing_skills=skill_data['missing_skills'],
-                            recommended_skills=skill_data['recommended_skills'],
-                            skill_priority=skill_data['skill_priority'],
-                            time_to_acquire=skill_data['time_to_acquire']
-                        )
-
-                    # Get job recommendations
-                    job_result = supabase.table('job_recommendations').select('*').eq('user_id', user_id).order('match_score', desc=True).execute()
-                    if job_result.data:
-                        from app.models.schemas import JobRecommendation
-                        dashboard_data.job_recommendations = [
-                            JobRecommendation(
-                                title=job['title'],
-                                company=job['company'],
-                                location=job['location'],
-                                salary_range=job['salary_range'],
-                                match_score=job['match_score'],
-                                required_skills=job['required_skills'],
-                                description=job['description']
-                            ) for job in job_result.data
-                        ]
-
-                    # Get resume guidance
-                    resume_result = supabase.table('resume_guidance').select('*').eq('user_id', user_id).execute()
-                    if resume_result.data:
-                        resume_data = resume_result.data[0]
-                        from app.models.schemas import ResumeGuidance
-                        dashboard_data.resume_guidance = ResumeGuidance(
-                            strengths=resume_data['strengths'],
-                            areas_for_improvement=resume_data['areas_for_improvement'],
-                            suggested_sections=resume_data['suggested_sections'],
-                            keyword_suggestions=resume_data['keyword_suggestions'],
-                            ats_friendly_tips=resume_data['ats_friendly_tips']
-                        )
-
+                    apply_stored_analysis(dashboard_data, stored['analysis'], profile_data)
+                    headers["X-Analysis-Source"] = "stored"
                 except Exception as e:
                     print(f"Error retrieving stored analysis: {e}")
-                    # Fall back to generating fresh analysis
-                    dashboard_data.career_recommendations = career_guidance_service.generate_career_recommendations(profile_data)
-                    dashboard_data.skill_gap_analysis = career_guidance_service.analyze_skill_gaps(profile_data)
-                    dashboard_data.job_recommendations = career_guidance_service.generate_job_recommendations(profile_data)
-                    dashboard_data.resume_guidance = career_guidance_service.generate_resume_guidance(profile_data)
+                    # Fall back to generating fresh analysis; the header lets
+                    # clients and the load test notice the stored copy was unusable
+                    apply_generated_analysis(dashboard_data, profile_data)
+                    headers["X-Analysis-Source"] = "regenerated"
+            elif stored['analysis'] is not None:
+                # The background analysis of this profile version isn't stored
+                # yet; generate it (usually a cache hit) rather than show a stale one
+                apply_generated_analysis(dashboard_data, profile_data)
+                headers["X-Analysis-Source"] = "pending"
             else:
-                # Generate fresh analysis for memory storage
-                dashboard_data.career_recommendations = career_guidance_service.generate_career_recommendations(profile_data)
-                dashboard_data.skill_gap_analysis = career_guidance_service.analyze_skill_gaps(profile_data)
-                dashboard_data.job_recommendations = career_guidance_service.generate_job_recommendations(profile_data)
-                dashboard_data.resume_guidance = career_guidance_service.generate_resume_guidance(profile_data)
+                # Generate fresh analysis
+                apply_generated_analysis(dashboard_data, profile_data)
+                headers["X-Analysis-Source"] = "generated"
 
-        return APIResponse(
+        return json_response(APIResponse(
             success=True,
-            data=dashboard_data.dict()
-        )
+            data=dashboard_data
+        ), headers=headers)
 
     except Exception as e:
         print(f"Dashboard data error: {e}")
-        raise HTTPException(status_code=500, detail="Server error retrieving dashboard data")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="Server error retrieving dashboard data")
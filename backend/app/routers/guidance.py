@@ -0,0 +1,65 @@
+from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi.responses import StreamingResponse
+from app.core.auth import get_current_user_id
+from app.core.config import settings
+from app.services.guidance_batch import stream_batch_guidance
+from starlette.types import Receive, Scope, Send
+from typing import Any, AsyncIterator, List
+
+router = APIRouter()
+
+NDJSON_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl", "application/x-jsonlines")
+
+class UploadStreamingResponse(StreamingResponse):
+    """StreamingResponse whose body iterator is still reading the request body.
+
+    StreamingResponse normally watches receive() for a disconnect while it
+    streams, which would swallow request body chunks that are still arriving.
+    Here only the body iterator reads them; a client that goes away mid-upload
+    ends request.stream() and with it the response.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.stream_response(send)
+
+async def iterate(items: List[Any]) -> AsyncIterator[Any]:
+    for item in items:
+        yield item
+
+async def ndjson_lines(request: Request) -> AsyncIterator[bytes]:
+    """Lines of an NDJSON request body, as they arrive"""
+    buffer = b""
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield line
+    if buffer.strip():
+        yield buffer
+
+@router.post("/batch")
+async def batch_guidance(request: Request, user_id: str = Depends(get_current_user_id)):
+    """Guidance for many profiles at once, streamed back as NDJSON.
+
+    The body is either a JSON array of profiles (or {"profiles": [...]}), or an
+    NDJSON stream of profiles sent as application/x-ndjson. Each result line
+    carries the index of its profile; results arrive as they are ready.
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if content_type in NDJSON_TYPES:
+        return UploadStreamingResponse(stream_batch_guidance(ndjson_lines(request)), media_type="application/x-ndjson")
+
+    try:
+        body = await request.json()
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Request body must be JSON or NDJSON")
+    profiles = body.get("profiles") if isinstance(body, dict) else body
+    if not isinstance(profiles, list):
+        raise HTTPException(status_code=400, detail="Expected a list of profiles")
+    if len(profiles) > settings.guidance_batch_max_profiles:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch limit of {settings.guidance_batch_max_profiles} profiles exceeded"
+        )
+    return StreamingResponse(stream_batch_guidance(iterate(profiles)), media_type="application/x-ndjson")
@@ -0,0 +1,167 @@
+"""
+Production server: a pre-forking supervisor around uvicorn.
+
+The parent process imports the app, builds the guidance catalog and its
+indexes, and binds the listening socket once, then forks the workers. The
+workers share the catalog's memory pages copy-on-write and all accept
+connections on the inherited socket. The parent calls gc.freeze() before
+forking, so garbage collection in the workers does not write to those pages.
+
+In-memory storage lives in each process, so it runs on one worker only. The
+batch guidance process pool is started per worker, so its size
+(guidance_batch_workers, or the CPU count) is split between the workers.
+
+SIGTERM or SIGINT is passed on to the workers. Each worker stops accepting
+connections, finishes its in-flight requests (for up to
+graceful_shutdown_seconds) and runs the app's shutdown. Workers that exit
+unexpectedly are replaced.
+"""
+
+import gc
+import importlib.util
+import os
+import signal
+import socket
+import sys
+import time
+import traceback
+from typing import Dict, Optional
+
+from app.core.config import settings
+
+
+def default_workers() -> int:
+    """One worker per CPU this process may run on"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def event_loop_name() -> str:
+    return "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+
+
+def http_protocol_name() -> str:
+    return "httptools" if importlib.util.find_spec("httptools") else "h11"
+
+
+def preload():
+    """Import the app and build everything the workers should share"""
+    from app.main import app
+    from app.services.guidance_catalog import get_catalog
+    from app.services.job_matcher import get_job_matcher
+    from app.services.skill_index import get_skill_index
+
+    catalog = get_catalog()
+    get_job_matcher(catalog)
+    get_skill_index(catalog)
+    return app
+
+
+def bind_socket(host: str, port: int) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def run_worker(app, sock: socket.socket) -> None:
+    """Serve the app on an inherited socket until told to stop"""
+    import uvicorn
+
+    config = uvicorn.Config(
+        app,
+        loop=event_loop_name(),
+        http=http_protocol_name(),
+        lifespan="on",
+        timeout_graceful_shutdown=settings.graceful_shutdown_seconds,
+        log_level="info"
+    )
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+def serve(host: Optional[str] = None, port: Optional[int] = None, workers: Optional[int] = None) -> None:
+    """Run the app on a pre-forked pool of uvicorn workers"""
+    host = host or settings.host
+    port = port or settings.port
+    workers = workers or settings.workers
+
+    app = preload()
+    from app.services.guidance_batch import share_batch_workers
+    from app.storage import storage
+    if storage.name == "memory":
+        if workers > 1:
+            print("ERROR: in-memory storage is separate in every worker process, so users would see "
+                  "different data per request; use STORAGE_BACKEND=sqlite or supabase for more than one worker")
+            sys.exit(1)
+        workers = 1
+    else:
+        workers = workers or default_workers()
+    share_batch_workers(workers)
+
+    sock = bind_socket(host, port)
+    print(f"Serving on http://{host}:{port} with {workers} workers ({event_loop_name()}, {http_protocol_name()})")
+
+    # Move everything built so far out of the collector's reach, so the
+    # workers' collections do not copy the shared pages
+    gc.collect()
+    gc.freeze()
+
+    children: Dict[int, float] = {}  # pid -> start time
+    stopping = False
+
+    def spawn() -> None:
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            code = 0
+            try:
+                run_worker(app, sock)
+            except BaseException:
+                traceback.print_exc()
+                code = 1
+            finally:
+                sys.stdout.flush()
+                sys.stderr.flush()
+                os._exit(code)
+        children[pid] = time.monotonic()
+
+    def stop(signum, frame) -> None:
+        nonlocal stopping
+        if not stopping:
+            print(f"Received {signal.Signals(signum).name}, stopping {len(children)} workers...")
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    for _ in range(workers):
+        spawn()
+
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        started = children.pop(pid, None)
+        if started is None or stopping:
+            continue
+        print(f"Worker {pid} exited with status {os.waitstatus_to_exitcode(status)}; starting a new one")
+        if time.monotonic() - started < 1:
+            # Crashing on startup: do not fork in a tight loop
+            time.sleep(1)
+        if not stopping:
+            spawn()
+
+    sock.close()
+    print("All workers stopped")
@@ -0,0 +1,137 @@
+"""
+In-process background queue for profile analysis jobs.
+
+A bounded pool of worker tasks runs the jobs with retries. Jobs are
+deduplicated per user: a resubmission replaces the user's queued job, so
+rapid resubmits collapse into the latest one, and a user never has two jobs
+running at once.
+"""
+
+import asyncio
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from app.core.config import settings
+
+AnalysisJob = Callable[[], Awaitable[Any]]
+
+
+class AnalysisQueue:
+    """Per-user deduplicating job queue with a bounded worker pool"""
+
+    def __init__(
+        self,
+        workers: int = 2,
+        max_attempts: int = 3,
+        retry_delay: float = 1.0,
+        max_tracked_users: int = 10000
+    ):
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.max_tracked_users = max_tracked_users
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._pending: Dict[str, Tuple[str, AnalysisJob]] = {}
+        self._running: Set[str] = set()
+        self._status: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    def start(self):
+        """Start the worker tasks (idempotent; needs a running event loop)"""
+        if self._tasks:
+            return
+        self._queue = asyncio.Queue()
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self, timeout: float = 10.0):
+        """Let queued jobs finish (up to timeout), then stop the workers"""
+        if not self._tasks:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            print(f"Analysis queue stopped with {len(self._pending)} jobs still pending")
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+
+    def submit(self, user_id: str, version: str, job: AnalysisJob):
+        """Queue an analysis job for a profile version, replacing any queued job for the user"""
+        self.start()
+        self._set_status(user_id, {
+            "profile_version": version,
+            "status": "pending",
+            "attempts": 0,
+            "error": None,
+            "updated_at": datetime.now().isoformat()
+        })
+
+        already_queued = user_id in self._pending
+        self._pending[user_id] = (version, job)
+        # A running job re-queues the user when it finishes
+        if not already_queued and user_id not in self._running:
+            self._queue.put_nowait(user_id)
+
+    def get_status(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """Status of the latest job submitted for a user"""
+        status = self._status.get(user_id)
+        return dict(status) if status else None
+
+    def _set_status(self, user_id: str, status: Dict[str, Any]):
+        self._status[user_id] = status
+        self._status.move_to_end(user_id)
+        while len(self._status) > self.max_tracked_users:
+            self._status.popitem(last=False)
+
+    def _update_status(self, user_id: str, version: str, **fields):
+        """Update a user's status unless a newer version has been submitted since"""
+        status = self._status.get(user_id)
+        if status and status["profile_version"] == version:
+            status.update(fields, updated_at=datetime.now().isoformat())
+
+    async def _worker(self):
+        while True:
+            user_id = await self._queue.get()
+            try:
+                await self._run(user_id)
+            except Exception as e:
+                print(f"Analysis worker error: {e}")
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, user_id: str):
+        version, job = self._pending.pop(user_id)
+        self._running.add(user_id)
+        try:
+            for attempt in range(1, self.max_attempts + 1):
+                self._update_status(user_id, version, status="running", attempts=attempt)
+                try:
+                    await job()
+                    self._update_status(user_id, version, status="done", error=None)
+                    return
+                except Exception as e:
+                    print(f"Analysis job error for user {user_id} (attempt {attempt}): {e}")
+                    if attempt == self.max_attempts:
+                        self._update_status(user_id, version, status="failed", error=str(e))
+                        return
+                    self._update_status(user_id, version, error=str(e))
+
+                # Retrying a superseded version is wasted work
+                if user_id in self._pending:
+                    return
+                await asyncio.sleep(self.retry_delay * 2 ** (attempt - 1))
+        finally:
+            self._running.discard(user_id)
+            if user_id in self._pending:
+                self._queue.put_nowait(user_id)
+
+
+# Global instance
+analysis_queue = AnalysisQueue(
+    workers=settings.analysis_workers,
+    max_attempts=settings.analysis_max_attempts,
+    retry_delay=settings.analysis_retry_delay_seconds
+)
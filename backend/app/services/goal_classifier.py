@@ -0,0 +1,166 @@
+"""
+Career goal classifier - maps free-text career goals to career tracks.
+
+The goal text is lowercased and every non-alphanumeric character turned into a
+space (for ASCII text, in a single bytes.translate), so keywords can only
+start a word and are matched as " keyword" with C-level substring searches.
+
+Tracks are ranked by specificity (TRACK_PRIORITY), so the primary track is the
+first one with a keyword in the text: like the if/elif chains the generators
+used to run, the search stops at the first hit, but there is one chain for all
+of them. classify() also weighs every matching track by its keyword counts,
+not counting keywords inside a longer one ("data" in "data scientist"). Both
+are memoized per goal text, so the generators handling the same profile share
+a single scan.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+# keyword -> (track, weight); more specific phrases carry more weight
+GOAL_KEYWORDS: Dict[str, Tuple[str, float]] = {
+    "full stack": ("full_stack_developer", 3.0),
+    "full-stack": ("full_stack_developer", 3.0),
+    "fullstack": ("full_stack_developer", 3.0),
+    "mern": ("full_stack_developer", 3.0),
+    "data scientist": ("data_scientist", 3.0),
+    "data science": ("data_scientist", 3.0),
+    "machine learning": ("data_scientist", 3.0),
+    "devops": ("devops_engineer", 3.0),
+    "sre": ("devops_engineer", 3.0),
+    "site reliability": ("devops_engineer", 3.0),
+    "cybersecurity": ("cybersecurity_analyst", 3.0),
+    "cyber security": ("cybersecurity_analyst", 3.0),
+    "security": ("cybersecurity_analyst", 2.0),
+    "software": ("software_engineer", 2.0),
+    "developer": ("software_engineer", 1.0),
+    "engineer": ("software_engineer", 1.0),
+    "data": ("data_analyst", 1.0),
+    "analyst": ("data_analyst", 1.0),
+}
+
+# Track ranking: most specific first
+TRACK_PRIORITY = [
+    "full_stack_developer",
+    "data_scientist",
+    "devops_engineer",
+    "cybersecurity_analyst",
+    "software_engineer",
+    "data_analyst",
+]
+
+
+# ASCII bytes -> lowercase letters and digits, a space for everything else
+_ASCII_WORDS = bytes(
+    ord(chr(c).lower()) if chr(c).isalnum() else ord(" ") for c in range(128)
+) + bytes(range(128, 256))
+_NON_WORD = re.compile(r"[\W_]")
+
+
+def _words(text: str) -> str:
+    """Lowercased text with a leading space and a space for each non-alphanumeric,
+    so " keyword" only matches at the start of a word"""
+    if text.isascii():
+        # bytes.translate is much faster than str.translate; str searches are
+        # faster than bytes ones
+        return (" " + text).encode().translate(_ASCII_WORDS).decode()
+    return " " + _NON_WORD.sub(" ", text.lower())
+
+
+def _containing_keywords(keywords: List[str]) -> Dict[str, List[Tuple[str, int]]]:
+    """For each keyword, the longer keywords that contain it at a word start and how often.
+
+    Counting then matches longest-first scanning as long as no keyword
+    starts inside another one without being contained in it ("a b" and
+    "b c" could both match "a b c" when counted); such sets are rejected.
+    """
+    contained_in: Dict[str, List[Tuple[str, int]]] = {keyword: [] for keyword in keywords}
+    for longer in keywords:
+        starts = [i for i, char in enumerate(longer) if char == " "]
+        for keyword in keywords:
+            times = 0
+            for i in starts:
+                if i and len(keyword) > len(longer) - i and keyword.startswith(longer[i:]):
+                    raise ValueError(f"Goal keywords {longer!r} and {keyword!r} overlap")
+                if keyword != longer and longer.startswith(keyword, i):
+                    times += 1
+            if times:
+                contained_in[keyword].append((longer, times))
+    return contained_in
+
+
+class GoalClassifier:
+    """Keyword classifier for career goal text"""
+
+    def __init__(self, keywords: Dict[str, Tuple[str, float]], priority: List[str]):
+        # Keywords as they appear in _words() output: "full-stack" becomes " full stack"
+        self.keywords: Dict[str, Tuple[str, float]] = {}
+        for keyword, value in keywords.items():
+            self.keywords.setdefault(_words(keyword), value)
+        self.priority = {track: rank for rank, track in enumerate(priority)}
+        # Longest first, so the keywords containing one are counted before it
+        self.order = sorted(self.keywords, key=len, reverse=True)
+        self.contained_in = _containing_keywords(self.order)
+        # Every keyword, most specific track first: the first one in the text gives the
+        # primary track. One containing a keyword of its own track ("cyber security")
+        # adds nothing to that search.
+        redundant = {
+            longer
+            for keyword, containing in self.contained_in.items()
+            for longer, _ in containing
+            if self.keywords[longer][0] == self.keywords[keyword][0]
+        }
+        self.chain = tuple(sorted(
+            (keyword for keyword in self.keywords if keyword not in redundant),
+            key=lambda keyword: self._rank(self.keywords[keyword][0])
+        ))
+        for keyword, containing in self.contained_in.items():
+            for longer, _ in containing:
+                # Otherwise the first track with a keyword could be one whose
+                # keywords only occur inside a less specific track's
+                if self._rank(self.keywords[longer][0]) > self._rank(self.keywords[keyword][0]):
+                    raise ValueError(f"Goal keyword {longer!r} must not rank below {keyword!r}")
+        self._classify = lru_cache(maxsize=4096)(self._scan)
+        self._primary_track = lru_cache(maxsize=4096)(self._first_track)
+
+    def _rank(self, track: str) -> int:
+        return self.priority.get(track, len(self.priority))
+
+    def _first_track(self, career_goals: str) -> Optional[str]:
+        words = _words(career_goals)
+        for keyword in self.chain:
+            if keyword in words:
+                return self.keywords[keyword][0]
+        return None
+
+    def _scan(self, career_goals: str) -> Tuple[Tuple[str, float], ...]:
+        words = _words(career_goals)
+        counts: Dict[str, int] = {}
+        scores: Dict[str, float] = {}
+        for keyword in self.order:
+            count = words.count(keyword)
+            if not count:
+                continue
+            for longer, times in self.contained_in[keyword]:
+                count -= times * counts.get(longer, 0)
+            if count:
+                counts[keyword] = count
+                track, weight = self.keywords[keyword]
+                scores[track] = scores.get(track, 0.0) + weight * count
+
+        total = sum(scores.values())
+        ranked = sorted(scores.items(), key=lambda item: self._rank(item[0]))
+        return tuple((track, score / total) for track, score in ranked)
+
+    def classify(self, career_goals: str) -> List[Tuple[str, float]]:
+        """Return matching tracks, most specific first, with weights summing to 1"""
+        return list(self._classify(career_goals or ""))
+
+    def primary_track(self, career_goals: str) -> Optional[str]:
+        """Most specific matching track, or None when no keyword matches"""
+        return self._primary_track(career_goals or "")
+
+
+# Global instance
+goal_classifier = GoalClassifier(GOAL_KEYWORDS, TRACK_PRIORITY)
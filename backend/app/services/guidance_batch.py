@@ -0,0 +1,323 @@
+"""
+Batch guidance for whole cohorts of profiles.
+
+Profiles are validated, deduplicated by fingerprint and sent in chunks to a
+process pool, so CPU-bound generation runs on every core instead of the event
+loop's. Each chunk comes back as serialized JSON and is streamed to the client
+as soon as it completes, so results arrive out of input order; every line
+carries the index of the profile it belongs to.
+"""
+
+import asyncio
+import json
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from pydantic import ValidationError
+
+from app.core.config import settings
+from app.models.schemas import ProfileAnalysis, UserProfileCreate
+from app.services.career_guidance import career_guidance_service, profile_fingerprint
+from app.services.guidance_cache import GuidanceCache, cached_guidance_service
+from app.services.guidance_catalog import get_catalog, on_catalog_reload
+from app.services.job_matcher import get_job_matcher
+from app.services.skill_index import get_skill_index
+from app.services.skill_vocabulary import skill_vocabulary
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+# Server processes on this host that each start their own pool (see app.server)
+_server_processes = 1
+
+
+def _init_worker() -> None:
+    """Build the catalog and its match indexes once per worker process"""
+    catalog = get_catalog()
+    get_job_matcher(catalog)
+    get_skill_index(catalog)
+
+
+def analyze_chunk(profiles: List[Dict[str, Any]]) -> List[str]:
+    """Worker task: the serialized analyses for a chunk of profiles"""
+    return [analysis.model_dump_json() for _, analysis in career_guidance_service.generate_batch(profiles)]
+
+
+def analyze_profiles(profiles: List[Dict[str, Any]]) -> List[ProfileAnalysis]:
+    """Worker task: the analyses for a chunk of profiles, as models (pickled back)"""
+    return [analysis for _, analysis in career_guidance_service.generate_batch(profiles)]
+
+
+def analysis_rows(
+    user_id: str,
+    profile_id: str,
+    profile_version: str,
+    profile_data: Dict[str, Any],
+    analysis: Optional[ProfileAnalysis] = None
+) -> Dict[str, Any]:
+    """Storage rows for a profile's analysis, as save_analysis's keyword arguments.
+
+    Generates the analysis unless one is passed. profile_version is the
+    profile's updated_at, so readers can tell whether the rows are current.
+    """
+    if analysis is None:
+        # Generate all AI analysis
+        career_rec = cached_guidance_service.generate_career_recommendations(profile_data)
+        skill_analysis = cached_guidance_service.analyze_skill_gaps(profile_data)
+        job_recs = cached_guidance_service.generate_job_recommendations(profile_data)
+        resume_guide = cached_guidance_service.generate_resume_guidance(profile_data)
+    else:
+        career_rec = analysis.career_recommendations
+        skill_analysis = analysis.skill_gap_analysis
+        job_recs = analysis.job_recommendations
+        resume_guide = analysis.resume_guidance
+
+    career_data = {
+        "user_id": user_id,
+        "profile_id": profile_id,
+        "profile_version": profile_version,
+        "career_path": career_rec.career_path,
+        "short_term_goals": career_rec.short_term_goals,
+        "long_term_goals": career_rec.long_term_goals,
+        "industry_trends": career_rec.industry_trends,
+        "salary_potential": career_rec.salary_potential,
+        "certifications": career_rec.certifications
+    }
+
+    skill_data = {
+        "user_id": user_id,
+        "profile_id": profile_id,
+        "profile_version": profile_version,
+        "missing_skills": skill_analysis.missing_skills,
+        "recommended_skills": skill_analysis.recommended_skills,
+        "skill_priority": skill_analysis.skill_priority,
+        "time_to_acquire": skill_analysis.time_to_acquire
+    }
+
+    job_rows = [
+        {
+            "user_id": user_id,
+            "profile_id": profile_id,
+            "title": job.title,
+            "company": job.company,
+            "location": job.location,
+            "salary_range": job.salary_range,
+            "match_score": job.match_score,
+            "required_skills": job.required_skills,
+            "description": job.description,
+            "apply_link": job.apply_link,
+            "linkedin_link": job.linkedin_link
+        } for job in job_recs
+    ]
+
+    resume_data = {
+        "user_id": user_id,
+        "profile_id": profile_id,
+        "profile_version": profile_version,
+        "strengths": resume_guide.strengths,
+        "areas_for_improvement": resume_guide.areas_for_improvement,
+        "suggested_sections": resume_guide.suggested_sections,
+        "keyword_suggestions": resume_guide.keyword_suggestions,
+        "ats_friendly_tips": resume_guide.ats_friendly_tips
+    }
+
+    return {
+        "user_id": user_id,
+        "profile_id": profile_id,
+        "career_data": career_data,
+        "skill_data": skill_data,
+        "job_rows": job_rows,
+        "resume_data": resume_data
+    }
+
+
+def share_batch_workers(server_processes: int) -> None:
+    """Split the host's batch pool processes between this many server processes"""
+    global _server_processes
+    _server_processes = max(1, server_processes)
+
+
+def batch_workers() -> int:
+    """Pool processes for this server process: the host's total, split between server processes"""
+    total = settings.guidance_batch_workers or os.cpu_count() or 1
+    return max(1, total // _server_processes)
+
+
+def get_batch_executor() -> ProcessPoolExecutor:
+    """Get the batch process pool, starting it on first use"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            # spawn: the server has threads running, which fork does not copy safely
+            _executor = ProcessPoolExecutor(
+                max_workers=batch_workers(),
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker
+            )
+        return _executor
+
+
+def shutdown_batch_executor(wait: bool = True) -> None:
+    """Stop the batch process pool (a new one starts on next use)"""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait, cancel_futures=True)
+
+
+def parse_profile(item: Any) -> Dict[str, Any]:
+    """Validate one decoded batch item into a profile dict.
+
+    Raises ValueError with a client-facing message if the item is invalid.
+    """
+    try:
+        profile = UserProfileCreate.model_validate(item)
+    except ValidationError as e:
+        error = e.errors()[0]
+        location = ".".join(str(part) for part in error["loc"])
+        raise ValueError(f"{location}: {error['msg']}" if location else error["msg"])
+    return {
+        "education": profile.education,
+        "current_skills": skill_vocabulary.normalize_current_skills(profile.current_skills),
+        "career_goals": profile.career_goals,
+        "experience_level": profile.experience_level
+    }
+
+
+def _item_id(item: Any) -> Any:
+    # Optional client reference echoed back with the result
+    return item.get("id") if isinstance(item, dict) else None
+
+
+def _result_line(index: int, item_id: Any, fingerprint: str, analysis_json: str) -> str:
+    # The analysis is already JSON; splice it in rather than decode and re-encode it
+    return (
+        f'{{"index":{index},"id":{json.dumps(item_id)},"fingerprint":"{fingerprint}",'
+        f'"analysis":{analysis_json}}}\n'
+    )
+
+
+def _error_line(index: int, item_id: Any, error: str) -> str:
+    return json.dumps({"index": index, "id": item_id, "error": error}, separators=(",", ":")) + "\n"
+
+
+async def stream_batch_guidance(items: AsyncIterator[Any]) -> AsyncIterator[str]:
+    """Analyze a stream of profiles on the process pool, yielding NDJSON lines.
+
+    One line per input item, as results complete:
+    {"index", "id", "fingerprint", "analysis"} or {"index", "id", "error"},
+    then a final {"summary": {...}} line.
+    """
+    loop = asyncio.get_running_loop()
+    executor = get_batch_executor()
+    chunk_size = max(1, settings.guidance_batch_chunk_size)
+    # Enough queued chunks to keep every worker busy without reading the
+    # whole input into memory ahead of the pool
+    max_in_flight = batch_workers() * 2
+
+    # fingerprint -> inputs waiting on it; completed analyses kept for late duplicates
+    waiting: Dict[str, List[Tuple[int, Any]]] = {}
+    completed = GuidanceCache(max_entries=settings.guidance_cache_size, ttl_seconds=settings.guidance_cache_ttl_seconds)
+    in_flight: Dict[asyncio.Future, List[str]] = {}
+    chunk: List[Tuple[str, Dict[str, Any]]] = []
+    started = time.perf_counter()
+    counts = {"profiles": 0, "unique": 0, "duplicates": 0, "errors": 0}
+
+    def submit() -> None:
+        future = loop.run_in_executor(executor, analyze_chunk, [profile for _, profile in chunk])
+        in_flight[future] = [fingerprint for fingerprint, _ in chunk]
+        chunk.clear()
+
+    def collect(done) -> List[str]:
+        lines = []
+        for future in done:
+            fingerprints = in_flight.pop(future)
+            try:
+                analyses = future.result()
+            except Exception as e:
+                print(f"Batch guidance error: {e}")
+                for fingerprint in fingerprints:
+                    for index, item_id in waiting.pop(fingerprint):
+                        counts["errors"] += 1
+                        lines.append(_error_line(index, item_id, "Server error generating guidance"))
+                continue
+            for fingerprint, analysis_json in zip(fingerprints, analyses):
+                completed.set(fingerprint, analysis_json)
+                for index, item_id in waiting.pop(fingerprint):
+                    lines.append(_result_line(index, item_id, fingerprint, analysis_json))
+        return lines
+
+    try:
+        index = -1
+        async for item in items:
+            index += 1
+            if index >= settings.guidance_batch_max_profiles:
+                counts["errors"] += 1
+                yield _error_line(index, None, f"Batch limit of {settings.guidance_batch_max_profiles} profiles exceeded")
+                break
+            counts["profiles"] += 1
+            if isinstance(item, (bytes, str)):
+                # NDJSON line
+                try:
+                    item = json.loads(item)
+                except json.JSONDecodeError as e:
+                    counts["errors"] += 1
+                    yield _error_line(index, None, f"Invalid JSON: {e.msg}")
+                    continue
+            item_id = _item_id(item)
+            try:
+                profile = parse_profile(item)
+            except ValueError as e:
+                counts["errors"] += 1
+                yield _error_line(index, item_id, str(e))
+                continue
+
+            fingerprint = profile_fingerprint(profile)
+            if fingerprint in waiting:
+                counts["duplicates"] += 1
+                waiting[fingerprint].append((index, item_id))
+                continue
+            analysis_json = completed.get(fingerprint)
+            if analysis_json is not None:
+                counts["duplicates"] += 1
+                yield _result_line(index, item_id, fingerprint, analysis_json)
+                continue
+
+            counts["unique"] += 1
+            waiting[fingerprint] = [(index, item_id)]
+            chunk.append((fingerprint, profile))
+            if len(chunk) >= chunk_size:
+                submit()
+
+            # Stream whatever has finished; wait only when the pool is saturated
+            done = [future for future in in_flight if future.done()]
+            if len(in_flight) - len(done) >= max_in_flight:
+                more, _ = await asyncio.wait(
+                    [future for future in in_flight if not future.done()],
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                done.extend(more)
+            for line in collect(done):
+                yield line
+
+        if chunk:
+            submit()
+        while in_flight:
+            done, _ = await asyncio.wait(list(in_flight), return_when=asyncio.FIRST_COMPLETED)
+            for line in collect(done):
+                yield line
+
+        counts["seconds"] = round(time.perf_counter() - started, 3)
+        yield json.dumps({"summary": counts}, separators=(",", ":")) + "\n"
+    finally:
+        # Client went away: drop chunks that have not started yet
+        for future in in_flight:
+            future.cancel()
+
+
+# Workers hold their own copy of the catalog, so restart them on reload
+on_catalog_reload(lambda catalog: shutdown_batch_executor(wait=False))
@@ -0,0 +1,118 @@
+"""
+Result cache for CareerGuidanceService.
+
+The four guidance generators are pure functions of the profile fields they
+read, so results are cached under a fingerprint of the normalized profile with
+LRU + TTL eviction. The cache is cleared whenever the catalog is reloaded.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.models.schemas import (
+    CareerRecommendation, SkillGapAnalysis,
+    JobRecommendation, ResumeGuidance
+)
+from app.services.career_guidance import CareerGuidanceService, career_guidance_service, profile_fingerprint
+from app.services.guidance_catalog import on_catalog_reload
+
+
+class GuidanceCache:
+    """Thread-safe LRU cache with per-entry TTL and hit/miss/eviction counters"""
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 3600):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a cached value, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entries if full"""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Cache counters"""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations
+            }
+
+
+class CachedCareerGuidanceService:
+    """CareerGuidanceService front-end that memoizes results per profile fingerprint"""
+
+    def __init__(self, service: CareerGuidanceService, cache: GuidanceCache):
+        self.service = service
+        self.cache = cache
+
+    def _cached(self, generator: str, profile: Dict[str, Any], compute: Callable[[Dict[str, Any]], Any]) -> Any:
+        key = (generator, profile_fingerprint(profile))
+        result = self.cache.get(key)
+        if result is None:
+            with metrics.stage(f"guidance_{generator}"):
+                result = compute(profile)
+            self.cache.set(key, result)
+        return result
+
+    def generate_career_recommendations(self, profile: Dict[str, Any]) -> CareerRecommendation:
+        return self._cached("career", profile, self.service.generate_career_recommendations)
+
+    def analyze_skill_gaps(self, profile: Dict[str, Any]) -> SkillGapAnalysis:
+        return self._cached("skills", profile, self.service.analyze_skill_gaps)
+
+    def generate_job_recommendations(self, profile: Dict[str, Any]) -> List[JobRecommendation]:
+        # Copy the list so callers cannot change the cached entry
+        return list(self._cached("jobs", profile, self.service.generate_job_recommendations))
+
+    def generate_resume_guidance(self, profile: Dict[str, Any]) -> ResumeGuidance:
+        return self._cached("resume", profile, self.service.generate_resume_guidance)
+
+
+# Global instance
+guidance_cache = GuidanceCache(
+    max_entries=settings.guidance_cache_size,
+    ttl_seconds=settings.guidance_cache_ttl_seconds
+)
+on_catalog_reload(lambda catalog: guidance_cache.clear())
+
+cached_guidance_service = CachedCareerGuidanceService(career_guidance_service, guidance_cache)
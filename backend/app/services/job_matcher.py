@@ -0,0 +1,132 @@
+"""
+Job matching over skill bitsets.
+
+Each job in the catalog inherits the skills of its career path: required
+skills weigh twice as much as recommended ones. A profile is encoded once
+against the shared SkillVocabulary, and every job is then scored in one pass
+of AND + popcount, with no per-job string handling.
+"""
+
+import heapq
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from app.services.guidance_catalog import GuidanceCatalog
+from app.services.skill_index import JobKey, get_skill_index
+from app.services.skill_vocabulary import SkillVocabulary, popcount
+
+REQUIRED_WEIGHT = 2
+RECOMMENDED_WEIGHT = 1
+
+
+@dataclass(frozen=True)
+class JobEntry:
+    """A catalog job with its skill requirements encoded as bitsets"""
+    level: str
+    track: str
+    position: int
+    job: Mapping[str, Any]
+    required_skills: Tuple[str, ...]
+    required_mask: int
+    recommended_mask: int
+    # Weighted size of the job's skill set, the denominator of its match score
+    total_weight: int
+
+
+class JobMatcher:
+    """Scores a profile's skills against every job at once"""
+
+    def __init__(self, vocabulary: SkillVocabulary, entries: Sequence[JobEntry], catalog: Optional[GuidanceCatalog] = None):
+        self.vocabulary = vocabulary
+        self.entries = list(entries)
+        self.catalog = catalog
+        self._by_level: Dict[str, List[int]] = {}
+        self.index_of: Dict[JobKey, int] = {}
+        for index, entry in enumerate(self.entries):
+            self._by_level.setdefault(entry.level, []).append(index)
+            self.index_of[(entry.level, entry.track, entry.position)] = index
+        # Parallel arrays keep the scoring loop free of attribute lookups
+        self._required = [entry.required_mask for entry in self.entries]
+        self._recommended = [entry.recommended_mask for entry in self.entries]
+        self._totals = [entry.total_weight or 1 for entry in self.entries]
+
+    @classmethod
+    def from_catalog(cls, catalog: GuidanceCatalog, vocabulary: Optional[SkillVocabulary] = None) -> "JobMatcher":
+        if vocabulary is None:
+            vocabulary = SkillVocabulary.from_career_paths(catalog.career_paths)
+        entries = []
+        for level, tracks in catalog.career_paths.items():
+            for track, path in tracks.items():
+                required_mask = vocabulary.mask(path.get("required_skills", []))
+                # Skills in both lists count once, as required
+                recommended_mask = vocabulary.mask(path.get("recommended_skills", [])) & ~required_mask
+                total_weight = (
+                    REQUIRED_WEIGHT * popcount(required_mask)
+                    + RECOMMENDED_WEIGHT * popcount(recommended_mask)
+                )
+                for position, job in enumerate(path.get("jobs", [])):
+                    entries.append(JobEntry(
+                        level=level,
+                        track=track,
+                        position=position,
+                        job=job,
+                        required_skills=tuple(path.get("required_skills", [])),
+                        required_mask=required_mask,
+                        recommended_mask=recommended_mask,
+                        total_weight=total_weight
+                    ))
+        return cls(vocabulary, entries, catalog)
+
+    def level_entries(self, level: str) -> List[int]:
+        """Indexes of the jobs listed for an experience level"""
+        return self._by_level.get(level, [])
+
+    def scores(self, skills_mask: int) -> List[int]:
+        """Match score (0-100) of every job, in entry order"""
+        return [
+            (200 * (REQUIRED_WEIGHT * popcount(skills_mask & required)
+                    + RECOMMENDED_WEIGHT * popcount(skills_mask & recommended)) + total) // (2 * total)
+            for required, recommended, total in zip(self._required, self._recommended, self._totals)
+        ]
+
+    def top_k(
+        self,
+        skills: Iterable[str],
+        k: int,
+        candidates: Optional[Iterable[int]] = None,
+        preferred_track: Optional[str] = None
+    ) -> List[Tuple[int, JobEntry]]:
+        """Best k (score, job) pairs.
+
+        Jobs in preferred_track rank ahead of the rest; ties keep catalog order.
+        candidates optionally limits the ranking to those entry indexes.
+        """
+        scores = self.scores(self.vocabulary.mask(skills))
+        indexes = range(len(self.entries)) if candidates is None else candidates
+        if preferred_track is None:
+            groups = [indexes]
+        else:
+            entries = self.entries
+            groups = [
+                [i for i in indexes if entries[i].track == preferred_track],
+                [i for i in indexes if entries[i].track != preferred_track]
+            ]
+
+        # nlargest is stable, so equal scores stay in catalog order
+        best: List[int] = []
+        for group in groups:
+            if len(best) < k:
+                best.extend(heapq.nlargest(k - len(best), group, key=scores.__getitem__))
+        return [(scores[i], self.entries[i]) for i in best]
+
+
+_matcher: Optional[JobMatcher] = None
+
+
+def get_job_matcher(catalog: GuidanceCatalog) -> JobMatcher:
+    """Matcher for a catalog, rebuilt only when the catalog changes"""
+    global _matcher
+    if _matcher is None or _matcher.catalog is not catalog:
+        # Share the index's vocabulary so skill IDs mean the same in both
+        _matcher = JobMatcher.from_catalog(catalog, get_skill_index(catalog).vocabulary)
+    return _matcher
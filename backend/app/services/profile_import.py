@@ -0,0 +1,333 @@
+"""
+Bulk profile import from CSV or JSONL files (see `python run.py import`).
+
+Rows are streamed from the file, validated against UserProfileCreate and
+written with storage.save_profiles in chunks, a bounded number of chunks at a
+time. After each chunk the number of rows safely written is checkpointed, so
+an interrupted import resumes where it stopped. Profile writes are upserts
+keyed by user ID, so rows replayed after a crash are simply rewritten.
+Rows that fail validation go to a rejects file instead of stopping the import.
+Analyses are generated per chunk on the batch guidance process pool and
+saved with one storage.save_analyses call per chunk.
+
+Within a chunk a later row for a user replaces an earlier one. A chunk that
+shares users with chunks still being written waits for them first, so the
+last row in the file always wins.
+"""
+
+import asyncio
+import csv
+import json
+import os
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from pydantic import ValidationError
+
+from app.models.schemas import UserProfileCreate
+from app.services.guidance_batch import analysis_rows, analyze_profiles, get_batch_executor
+from app.services.skill_vocabulary import skill_vocabulary
+from app.storage import storage
+
+# CSV: list cells (skills, certifications) are separated by semicolons
+LIST_SEPARATOR = ";"
+EDUCATION_FIELDS = ("degree", "field", "institution", "graduation_year", "gpa")
+SKILL_FIELDS = ("technical", "soft", "certifications")
+FORMATS = ("csv", "jsonl")
+WRITE_ATTEMPTS = 3
+
+
+class ImportStats:
+    """Counters for one import run"""
+
+    def __init__(self, skipped: int = 0):
+        self.started = time.perf_counter()
+        self.skipped = skipped  # Rows already imported before a resume
+        self.read = 0
+        self.imported = 0
+        self.rejected = 0
+        self.analyzed = 0
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.read / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary(self) -> str:
+        text = (
+            f"{self.read:,} rows read, {self.imported:,} imported, {self.rejected:,} rejected, "
+            f"{self.analyzed:,} analyzed in {self.elapsed:.1f}s ({self.rows_per_second:,.0f} rows/s)"
+        )
+        if self.skipped:
+            text += f"; resumed after row {self.skipped:,}"
+        return text
+
+
+class Checkpoint:
+    """Number of leading input rows that are fully imported, kept in a small JSON file"""
+
+    def __init__(self, path: str, source: str):
+        self.path = path
+        self.source = os.path.abspath(source)
+
+    def load(self) -> int:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return 0
+        if data.get("source") != self.source:
+            raise ValueError(f"Checkpoint {self.path} belongs to {data.get('source')}")
+        return int(data.get("rows", 0))
+
+    def save(self, rows: int) -> None:
+        # Write then rename, so a crash never leaves a torn checkpoint
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"source": self.source, "rows": rows}, f)
+        os.replace(temp_path, self.path)
+
+    def clear(self) -> None:
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def detect_format(path: str) -> str:
+    """Input format from the file extension"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        return "csv"
+    if extension in (".jsonl", ".ndjson", ".json"):
+        return "jsonl"
+    raise ValueError(f"Cannot tell the format of {path}; pass --format csv or --format jsonl")
+
+
+def read_rows(path: str, input_format: str) -> Iterator[Tuple[int, Any]]:
+    """Stream (row number, raw row) pairs; row numbers start at 1 and skip the CSV header"""
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        if input_format == "csv":
+            for number, row in enumerate(csv.DictReader(f), start=1):
+                yield number, row
+        else:
+            number = 0
+            for line in f:
+                if line.strip():
+                    number += 1
+                    yield number, line
+
+
+def _split_list(value: Optional[str]) -> List[str]:
+    return [item.strip() for item in (value or "").split(LIST_SEPARATOR) if item.strip()]
+
+
+def _json_cell(value: str, column: str) -> Any:
+    try:
+        return json.loads(value)
+    except json.JSONDecodeError:
+        raise ValueError(f"{column}: invalid JSON")
+
+
+def _csv_record(row: Dict[str, Optional[str]]) -> Dict[str, Any]:
+    """Profile record from a CSV row.
+
+    education and current_skills may be JSON cells; otherwise they are built
+    from degree/field/... and technical/soft/certifications columns.
+    """
+    row = {key.strip().lower(): (value or "").strip() for key, value in row.items() if key}
+    if row.get("education"):
+        education = _json_cell(row["education"], "education")
+    else:
+        education = {field: row[field] for field in EDUCATION_FIELDS if field in row}
+    if row.get("current_skills"):
+        current_skills = _json_cell(row["current_skills"], "current_skills")
+    else:
+        current_skills = {field: _split_list(row.get(field)) for field in SKILL_FIELDS}
+    return {
+        "user_id": row.get("user_id"),
+        "education": education,
+        "current_skills": current_skills,
+        "career_goals": row.get("career_goals"),
+        "experience_level": row.get("experience_level")
+    }
+
+
+def parse_row(raw: Any, input_format: str) -> Tuple[str, Dict[str, Any]]:
+    """Validate a raw row into (user_id, profile dict); raises ValueError if invalid"""
+    if input_format == "csv":
+        record = _csv_record(raw)
+    else:
+        try:
+            record = json.loads(raw)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON: {e.msg}")
+        if not isinstance(record, dict):
+            raise ValueError("Expected a JSON object")
+
+    user_id = record.get("user_id")
+    if not user_id or not isinstance(user_id, str):
+        raise ValueError("user_id: Field required")
+    try:
+        profile = UserProfileCreate.model_validate(record)
+    except ValidationError as e:
+        error = e.errors()[0]
+        location = ".".join(str(part) for part in error["loc"])
+        raise ValueError(f"{location}: {error['msg']}" if location else error["msg"])
+
+    return user_id.strip(), {
+        "user_id": user_id.strip(),
+        "education": profile.education,
+        "current_skills": skill_vocabulary.normalize_current_skills(profile.current_skills),
+        "career_goals": profile.career_goals,
+        "experience_level": profile.experience_level
+    }
+
+
+async def _write_chunk(profiles: Dict[str, Dict[str, Any]], analyze: bool) -> int:
+    """Upsert one chunk of profiles (with retries) and optionally store their analysis"""
+    pending_analyses = None
+    if analyze:
+        # Generate on the batch process pool while the profiles are written
+        loop = asyncio.get_running_loop()
+        pending_analyses = loop.run_in_executor(get_batch_executor(), analyze_profiles, list(profiles.values()))
+
+    try:
+        for attempt in range(1, WRITE_ATTEMPTS + 1):
+            try:
+                saved = await storage.save_profiles(profiles)
+                break
+            except Exception as e:
+                if attempt == WRITE_ATTEMPTS:
+                    raise
+                print(f"Chunk write failed (attempt {attempt}/{WRITE_ATTEMPTS}): {e}")
+                await asyncio.sleep(attempt)
+    except Exception:
+        if pending_analyses is not None:
+            pending_analyses.cancel()
+        raise
+
+    if pending_analyses is None:
+        return 0
+    analyses = dict(zip(profiles, await pending_analyses))
+    await storage.save_analyses([
+        analysis_rows(
+            row["user_id"], row["id"], row["updated_at"], profiles[row["user_id"]], analyses[row["user_id"]]
+        )
+        for row in saved
+    ])
+    return len(saved)
+
+
+async def import_profiles(
+    path: str,
+    input_format: Optional[str] = None,
+    chunk_size: int = 500,
+    concurrency: int = 4,
+    analyze: bool = False,
+    checkpoint_path: Optional[str] = None,
+    rejects_path: Optional[str] = None,
+    restart: bool = False,
+    report_interval: float = 5.0
+) -> ImportStats:
+    """Import profiles from a CSV or JSONL file into the configured storage"""
+    input_format = input_format or detect_format(path)
+    if input_format not in FORMATS:
+        raise ValueError(f"Unknown format {input_format}; expected one of {', '.join(FORMATS)}")
+    if analyze and not storage.persists_analysis:
+        print(f"The {storage.name} backend does not store analysis; it will be generated on demand")
+        analyze = False
+
+    checkpoint = Checkpoint(checkpoint_path or f"{path}.checkpoint.json", path)
+    if restart:
+        checkpoint.clear()
+    resume_from = checkpoint.load()
+    if resume_from:
+        print(f"Resuming after row {resume_from:,} ({checkpoint.path})")
+
+    stats = ImportStats(skipped=resume_from)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    # Chunks can finish out of order; the checkpoint only advances past a
+    # chunk once every chunk before it has been written
+    chunk_ends: List[int] = []
+    finished: set = set()
+    committed = resume_from
+    failures: List[BaseException] = []
+    tasks: List[asyncio.Task] = []
+    # User ID -> task writing the latest chunk that contains the user
+    writing: Dict[str, asyncio.Task] = {}
+
+    async def run_chunk(profiles: Dict[str, Dict[str, Any]], last_row: int, earlier: set) -> None:
+        nonlocal committed
+        try:
+            if earlier:
+                # Rows for these users earlier in the file must be written first
+                await asyncio.wait(earlier)
+            if failures:
+                return
+            analyzed = await _write_chunk(profiles, analyze)
+            stats.analyzed += analyzed
+            stats.imported += len(profiles)
+            finished.add(last_row)
+            while chunk_ends and chunk_ends[0] in finished:
+                committed = chunk_ends.pop(0)
+                finished.discard(committed)
+            checkpoint.save(committed)
+        except Exception as e:
+            failures.append(e)
+        finally:
+            semaphore.release()
+            task = asyncio.current_task()
+            for user_id in profiles:
+                if writing.get(user_id) is task:
+                    del writing[user_id]
+
+    async def submit(profiles: Dict[str, Dict[str, Any]], last_row: int) -> None:
+        await semaphore.acquire()
+        chunk_ends.append(last_row)
+        earlier = {writing[user_id] for user_id in profiles if user_id in writing}
+        task = asyncio.create_task(run_chunk(profiles, last_row, earlier))
+        for user_id in profiles:
+            writing[user_id] = task
+        tasks.append(task)
+
+    last_report = time.perf_counter()
+    chunk: Dict[str, Dict[str, Any]] = {}
+    last_row = resume_from
+    with open(rejects_path or f"{path}.rejects.jsonl", "a", encoding="utf-8") as rejects:
+        for number, raw in read_rows(path, input_format):
+            if number <= resume_from:
+                continue
+            if failures:
+                break
+            stats.read += 1
+            last_row = number
+            try:
+                user_id, profile = parse_row(raw, input_format)
+            except ValueError as e:
+                stats.rejected += 1
+                rejects.write(json.dumps({"row": number, "error": str(e), "data": raw}) + "\n")
+                continue
+
+            # A later row for the same user replaces the earlier one
+            chunk.pop(user_id, None)
+            chunk[user_id] = profile
+            if len(chunk) >= chunk_size:
+                await submit(chunk, last_row)
+                chunk = {}
+
+            if time.perf_counter() - last_report >= report_interval:
+                last_report = time.perf_counter()
+                print(f"  {stats.read:,} rows, {stats.imported:,} imported ({stats.rows_per_second:,.0f} rows/s)")
+
+        if chunk and not failures:
+            await submit(chunk, last_row)
+        await asyncio.gather(*tasks)
+
+    if failures:
+        raise RuntimeError(f"Import stopped after row {committed:,}; rerun to resume") from failures[0]
+    checkpoint.clear()
+    return stats
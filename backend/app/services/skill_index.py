@@ -0,0 +1,173 @@
+"""
+Inverted index from skills to the catalog entries that need them.
+
+Each skill ID (see skill_vocabulary) has posting sets of the jobs, tracks and
+certifications relevant to it, so "what is relevant to these skills" is a
+union or intersection of a few small sets instead of a scan of the catalog.
+
+When the catalog is reloaded only the career paths and certification lists
+that actually changed are re-indexed.
+"""
+
+from collections import defaultdict
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from app.services.guidance_catalog import GuidanceCatalog
+from app.services.skill_vocabulary import SkillVocabulary, skill_vocabulary
+
+# (level, track, position in the path's job list)
+JobKey = Tuple[str, str, int]
+# (track, certification level, position in the list)
+CertificationKey = Tuple[str, str, int]
+
+
+def _path_skills(path: Mapping) -> List[str]:
+    return list(path.get("required_skills", [])) + list(path.get("recommended_skills", []))
+
+
+class SkillIndex:
+    """Skill ID -> jobs / tracks / certifications posting sets, updated incrementally"""
+
+    def __init__(self, vocabulary: Optional[SkillVocabulary] = None):
+        # Append-only, so skill IDs stay valid across updates
+        self.vocabulary = vocabulary or SkillVocabulary()
+        self.catalog: Optional[GuidanceCatalog] = None
+        self.jobs: Dict[int, Set[JobKey]] = defaultdict(set)
+        self.tracks: Dict[int, Set[str]] = defaultdict(set)
+        self.certifications: Dict[int, Set[CertificationKey]] = defaultdict(set)
+        self.level_jobs: Dict[str, Set[JobKey]] = defaultdict(set)
+        self._paths: Dict[Tuple[str, str], Mapping] = {}
+        self._certification_lists: Dict[str, Mapping] = {}
+        self._track_skills: Dict[str, Set[int]] = {}
+        # Career paths and certification tracks re-indexed so far
+        self.reindexed = 0
+
+    @classmethod
+    def from_catalog(cls, catalog: GuidanceCatalog) -> "SkillIndex":
+        index = cls(skill_vocabulary)
+        index.update(catalog)
+        return index
+
+    def update(self, catalog: GuidanceCatalog) -> None:
+        """Bring the index in line with a catalog, re-indexing only what changed"""
+        if catalog is self.catalog:
+            return
+
+        paths = {
+            (level, track): path
+            for level, tracks in catalog.career_paths.items()
+            for track, path in tracks.items()
+        }
+        changed_tracks = set()
+        for key in self._paths.keys() | paths.keys():
+            old_path, new_path = self._paths.get(key), paths.get(key)
+            if old_path != new_path:
+                if old_path is not None:
+                    self._index_path(key, old_path, remove=True)
+                if new_path is not None:
+                    self._index_path(key, new_path)
+                changed_tracks.add(key[1])
+                self.reindexed += 1
+        self._paths = paths
+
+        certification_lists = dict(catalog.certifications)
+        for track in self._certification_lists.keys() | certification_lists.keys():
+            if self._certification_lists.get(track) != certification_lists.get(track):
+                changed_tracks.add(track)
+                self.reindexed += 1
+
+        for track in changed_tracks:
+            self._index_track(track, self._certification_lists.get(track), certification_lists.get(track))
+        self._certification_lists = certification_lists
+        self.catalog = catalog
+
+    def _index_path(self, key: Tuple[str, str], path: Mapping, remove: bool = False) -> None:
+        level, track = key
+        job_keys = {(level, track, position) for position in range(len(path.get("jobs", [])))}
+        for skill in _path_skills(path):
+            postings = self.jobs[self.vocabulary.add(skill)]
+            if remove:
+                postings.difference_update(job_keys)
+            else:
+                postings.update(job_keys)
+        if remove:
+            self.level_jobs[level].difference_update(job_keys)
+        else:
+            self.level_jobs[level].update(job_keys)
+
+    def _index_track(self, track: str, old_certifications: Optional[Mapping], new_certifications: Optional[Mapping]) -> None:
+        """Re-index a track's skills and certifications after any of its paths changed"""
+        old_skills = self._track_skills.get(track, set())
+        new_skills = {
+            self.vocabulary.add(skill)
+            for (_, path_track), path in self._paths.items() if path_track == track
+            for skill in _path_skills(path)
+        }
+
+        old_keys = self._certification_keys(track, old_certifications)
+        for skill_id in old_skills:
+            self.tracks[skill_id].discard(track)
+            self.certifications[skill_id].difference_update(old_keys)
+
+        new_keys = self._certification_keys(track, new_certifications)
+        for skill_id in new_skills:
+            self.tracks[skill_id].add(track)
+            self.certifications[skill_id].update(new_keys)
+        self._track_skills[track] = new_skills
+
+    @staticmethod
+    def _certification_keys(track: str, certifications: Optional[Mapping]) -> Set[CertificationKey]:
+        if not certifications:
+            return set()
+        return {
+            (track, level, position)
+            for level, entries in certifications.items()
+            for position in range(len(entries))
+        }
+
+    def _ids(self, skills: Iterable[str]) -> List[int]:
+        return [skill_id for skill_id in map(self.vocabulary.id, skills) if skill_id is not None]
+
+    def jobs_for(self, skills: Iterable[str], require_all: bool = False) -> Set[JobKey]:
+        """Jobs needing any (or, with require_all, every) one of the skills"""
+        postings = [self.jobs.get(skill_id, set()) for skill_id in self._ids(skills)]
+        if not postings:
+            return set()
+        if require_all:
+            # Intersect smallest first
+            postings.sort(key=len)
+            return set.intersection(*postings)
+        return set().union(*postings)
+
+    def track_jobs(self, level: str, track: str) -> Set[JobKey]:
+        """Jobs of one career path"""
+        path = self._paths.get((level, track))
+        return {(level, track, position) for position in range(len(path.get("jobs", [])))} if path else set()
+
+    def tracks_for(self, skills: Iterable[str]) -> Dict[str, int]:
+        """Tracks relevant to the skills, with how many of the skills each one uses"""
+        counts: Dict[str, int] = defaultdict(int)
+        for skill_id in set(self._ids(skills)):
+            for track in self.tracks.get(skill_id, ()):
+                counts[track] += 1
+        return dict(counts)
+
+    def certifications_for(self, skills: Iterable[str], level: Optional[str] = None) -> Set[CertificationKey]:
+        """Certifications on tracks that use any of the skills, optionally for one certification level"""
+        keys = set().union(*(self.certifications.get(skill_id, set()) for skill_id in self._ids(skills)))
+        if level is not None:
+            keys = {key for key in keys if key[1] == level}
+        return keys
+
+
+_index: Optional[SkillIndex] = None
+
+
+def get_skill_index(catalog: GuidanceCatalog) -> SkillIndex:
+    """Shared index, incrementally updated when it is asked about a new catalog"""
+    global _index
+    if _index is None:
+        _index = SkillIndex.from_catalog(catalog)
+    else:
+        _index.update(catalog)
+    return _index
@@ -0,0 +1,293 @@
+"""
+Canonical skill vocabulary.
+
+Every skill the catalog knows gets a small integer ID, so a set of skills can
+be held as an int set or one int bitset (bit i set = skill i present) and
+overlaps computed with a single AND plus a popcount.
+
+User input is messy ("python3", "ReactJS", " node "), so names are case-folded,
+whitespace-collapsed and resolved through SKILL_ALIASES before lookup. Profiles
+are normalized to canonical names once, when they are saved; canonical names
+then resolve with a single dict lookup.
+"""
+
+import re
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+from app.services.guidance_catalog import get_catalog
+
+# Normalized alias -> canonical skill name
+SKILL_ALIASES: Dict[str, str] = {
+    "py": "Python",
+    "python programming": "Python",
+    "js": "JavaScript",
+    "java script": "JavaScript",
+    "javascript es6": "JavaScript",
+    "es6": "JavaScript",
+    "ecmascript": "JavaScript",
+    "ts": "TypeScript",
+    "mysql": "SQL",
+    "sql queries": "SQL",
+    "structured query language": "SQL",
+    "postgres": "PostgreSQL",
+    "postgresql db": "PostgreSQL",
+    "mongo": "MongoDB",
+    "mongo db": "MongoDB",
+    "react.js": "React",
+    "reactjs": "React",
+    "react js": "React",
+    "node": "Node.js",
+    "nodejs": "Node.js",
+    "node js": "Node.js",
+    "express": "Express.js",
+    "expressjs": "Express.js",
+    "express js": "Express.js",
+    "next": "Next.js",
+    "nextjs": "Next.js",
+    "next js": "Next.js",
+    "html": "HTML/CSS",
+    "css": "HTML/CSS",
+    "html5": "HTML/CSS",
+    "css3": "HTML/CSS",
+    "html css": "HTML/CSS",
+    "html & css": "HTML/CSS",
+    "html and css": "HTML/CSS",
+    "rest": "REST APIs",
+    "rest api": "REST APIs",
+    "restful apis": "REST APIs",
+    "restful api": "REST APIs",
+    "api": "APIs",
+    "api development": "APIs",
+    "git/github": "Git",
+    "version control": "Git",
+    "github actions": "CI/CD",
+    "ci cd": "CI/CD",
+    "cicd": "CI/CD",
+    "continuous integration": "CI/CD",
+    "amazon web services": "AWS",
+    "aws cloud": "AWS",
+    "sagemaker": "AWS SageMaker",
+    "redshift": "AWS Redshift",
+    "k8s": "Kubernetes",
+    "kube": "Kubernetes",
+    "golang": "Go",
+    "bash": "Shell Scripting",
+    "shell": "Shell Scripting",
+    "bash scripting": "Shell Scripting",
+    "ml": "Machine Learning",
+    "dl": "Deep Learning",
+    "natural language processing": "NLP",
+    "cv": "Computer Vision",
+    "opencv": "Computer Vision",
+    "ai": "AI/ML",
+    "ai ml": "AI/ML",
+    "artificial intelligence": "AI/ML",
+    "sklearn": "Scikit-learn",
+    "scikit learn": "Scikit-learn",
+    "scikitlearn": "Scikit-learn",
+    "tf": "TensorFlow",
+    "tensor flow": "TensorFlow",
+    "torch": "PyTorch",
+    "numpy arrays": "NumPy",
+    "spark": "Apache Spark",
+    "pyspark": "Apache Spark",
+    "jupyter notebook": "Jupyter",
+    "jupyter notebooks": "Jupyter",
+    "ms excel": "Excel",
+    "microsoft excel": "Excel",
+    "powerbi": "Power BI",
+    "power-bi": "Power BI",
+    "data viz": "Data Visualization",
+    "dataviz": "Data Visualization",
+    "stats": "Statistics",
+    "dsa": "Data Structures",
+    "data structures and algorithms": "Data Structures",
+    "data structures & algorithms": "Data Structures",
+    "problem-solving": "Problem Solving",
+    "team work": "Teamwork",
+    "team player": "Teamwork",
+    "collaboration": "Teamwork",
+    "communication skills": "Communication",
+    "unit testing": "Testing",
+    "automated testing": "Testing",
+    "pen testing": "Penetration Testing",
+    "pentesting": "Penetration Testing",
+    "cyber security": "Network Security",
+    "cpp": "C++",
+    "c plus plus": "C++",
+    "c language": "C",
+    "c programming": "C",
+    "ansi c": "C",
+    "dotnet": ".NET",
+    "dot net": ".NET",
+    ".net core": ".NET",
+    ".net framework": ".NET",
+    "scrum master": "Scrum",
+    "agile methodology": "Agile",
+}
+
+# Trailing version numbers ("Python 3", "python3.11", "React v18")
+_VERSION_SUFFIX = re.compile(r"\s*v?\d+(?:\.\d+)*$")
+# Whitespace and list punctuation left over from comma/semicolon separated
+# input; not dots or brackets, which can belong to the name (".NET")
+_STRIP_CHARS = " \t\n\"'`,;"
+
+
+def _bin_popcount(mask: int) -> int:
+    return bin(mask).count("1")
+
+
+# Number of set bits in a skill bitset: int.bit_count on Python 3.10+
+popcount = getattr(int, "bit_count", _bin_popcount)
+
+
+def normalize_skill(skill: str) -> str:
+    """Key a skill name is matched on: trimmed, whitespace-collapsed and case-folded"""
+    return " ".join(skill.strip(_STRIP_CHARS).split()).casefold()
+
+
+class SkillVocabulary:
+    """Bidirectional skill name <-> integer ID map with alias resolution"""
+
+    def __init__(self, skills: Iterable[str] = (), aliases: Optional[Mapping[str, str]] = None):
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        # Canonical display names resolve without normalization
+        self._exact: Dict[str, int] = {}
+        self._aliases: Dict[str, str] = {
+            normalize_skill(alias): normalize_skill(canonical)
+            for alias, canonical in (aliases or {}).items()
+        }
+        for skill in skills:
+            self.add(skill)
+        for canonical in (aliases or {}).values():
+            self.add(canonical)
+
+    @classmethod
+    def from_catalog_data(cls, career_paths: Mapping[str, Mapping[str, Mapping]], extra_skills: Iterable[str] = ()) -> "SkillVocabulary":
+        """Vocabulary of every skill in the career paths (plus any extras) with the standard aliases"""
+        skills = [
+            skill
+            for tracks in career_paths.values()
+            for path in tracks.values()
+            for skill in list(path.get("required_skills", [])) + list(path.get("recommended_skills", []))
+        ]
+        return cls(skills + list(extra_skills), SKILL_ALIASES)
+
+    @classmethod
+    def from_career_paths(cls, career_paths: Mapping[str, Mapping[str, Mapping]]) -> "SkillVocabulary":
+        """Vocabulary of every required and recommended skill in the career paths"""
+        return cls.from_catalog_data(career_paths)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add(self, skill: str) -> int:
+        """ID of a skill, assigning the next free ID if it is new"""
+        key = normalize_skill(skill)
+        skill_id = self._ids.get(key)
+        if skill_id is None:
+            skill_id = self._ids[key] = len(self._names)
+            self._names.append(skill.strip())
+            # Names that are also aliases ("HTML" -> "HTML/CSS") must resolve via the alias
+            if key not in self._aliases:
+                self._exact[self._names[skill_id]] = skill_id
+        return skill_id
+
+    def id(self, skill: str) -> Optional[int]:
+        """ID of a skill or any alias/spelling of it, or None if it is unknown"""
+        skill_id = self._exact.get(skill)
+        if skill_id is not None:
+            return skill_id
+        key = normalize_skill(skill)
+        key = self._aliases.get(key, key)
+        skill_id = self._ids.get(key)
+        if skill_id is None:
+            # "python3", "Python 3.11", "react v18"
+            stripped = _VERSION_SUFFIX.sub("", key)
+            if stripped and stripped != key:
+                skill_id = self._ids.get(self._aliases.get(stripped, stripped))
+        return skill_id
+
+    def name(self, skill_id: int) -> str:
+        """Canonical display name of a skill ID"""
+        return self._names[skill_id]
+
+    def canonical(self, skill: str) -> Optional[str]:
+        """Canonical name of a skill, or None if it is unknown"""
+        skill_id = self.id(skill)
+        return None if skill_id is None else self._names[skill_id]
+
+    def canonical_names(self, skills: Iterable[str]) -> set:
+        """Set of canonical names of the known skills in a list.
+
+        Names already canonical, as normalized profiles store them, are kept
+        with one set operation; only the rest are resolved one by one.
+        """
+        names = set(skills)
+        other = names.difference(self._exact)
+        if other:
+            names -= other
+            for skill in other:
+                name = self.canonical(skill)
+                if name is not None:
+                    names.add(name)
+        return names
+
+    def ids(self, skills: Iterable[str]) -> set:
+        """Set of IDs of the known skills in a list"""
+        ids = set()
+        for skill in skills:
+            skill_id = self.id(skill)
+            if skill_id is not None:
+                ids.add(skill_id)
+        return ids
+
+    def mask(self, skills: Iterable[str]) -> int:
+        """Bitset of the known skills in a list (unknown skills are ignored)"""
+        mask = 0
+        for skill in skills:
+            skill_id = self.id(skill)
+            if skill_id is not None:
+                mask |= 1 << skill_id
+        return mask
+
+    def names(self, mask: int) -> List[str]:
+        """Canonical names of the skills in a bitset, in ID order"""
+        names = []
+        while mask:
+            low_bit = mask & -mask
+            names.append(self._names[low_bit.bit_length() - 1])
+            mask ^= low_bit
+        return names
+
+    def normalize(self, skills: Iterable[str]) -> List[str]:
+        """Canonical names for known skills, cleaned-up input for unknown ones; duplicates dropped"""
+        normalized = []
+        seen = set()
+        for skill in skills:
+            if not isinstance(skill, str):
+                continue
+            name = self.canonical(skill) or " ".join(skill.strip(_STRIP_CHARS).split())
+            key = normalize_skill(name)
+            if name and key not in seen:
+                seen.add(key)
+                normalized.append(name)
+        return normalized
+
+    def normalize_current_skills(self, current_skills: Mapping[str, Any]) -> Dict[str, Any]:
+        """Profile current_skills with the technical and soft lists normalized"""
+        normalized = dict(current_skills)
+        for category in ("technical", "soft"):
+            if category in normalized:
+                normalized[category] = self.normalize(normalized[category])
+        return normalized
+
+
+def _build_vocabulary() -> SkillVocabulary:
+    catalog = get_catalog()
+    return SkillVocabulary.from_catalog_data(catalog.career_paths, catalog.skill_categories.keys())
+
+
+# Global instance
+skill_vocabulary = _build_vocabulary()
@@ -0,0 +1,32 @@
+"""
+Storage backends - selected once at startup via settings.storage_backend
+("supabase", "memory" or "sqlite"); defaults to Supabase when configured,
+otherwise in-memory storage.
+"""
+
+from typing import Optional
+
+from app.core.config import settings, supabase_configured
+from app.storage.base import StorageBackend
+
+
+def create_storage(name: Optional[str] = None) -> StorageBackend:
+    """Create the storage backend with the given name (or the configured default)"""
+    name = (name or settings.storage_backend or ("supabase" if supabase_configured else "memory")).lower()
+
+    if name == "supabase":
+        from app.storage.supabase import SupabaseStorageBackend
+        return SupabaseStorageBackend()
+    if name == "sqlite":
+        from app.storage.sqlite import SQLiteStorageBackend
+        return SQLiteStorageBackend(settings.sqlite_path)
+    if name == "memory":
+        from app.storage.memory import MemoryStorageBackend
+        from app.utils.memory_storage import memory_storage
+        return MemoryStorageBackend(memory_storage)
+
+    raise ValueError(f"Unknown storage backend: {name}")
+
+
+# Global instance
+storage = create_storage()
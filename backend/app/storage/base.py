@@ -0,0 +1,84 @@
+"""
+Storage backend interface used by the routers.
+
+Each backend stores user profiles and, if it can, the generated analysis.
+All methods are async; backends with blocking clients run them off the
+event loop.
+"""
+
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+
+class StorageBackend(ABC):
+    """Profile and analysis storage"""
+
+    name = "base"
+    # Whether save_analysis persists anything; when False the analysis is
+    # generated on demand for every dashboard load
+    persists_analysis = True
+
+    @abstractmethod
+    async def get_profile(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """Get a user's profile row, or None"""
+
+    @abstractmethod
+    async def save_profile(self, user_id: str, profile_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Create or update a user's profile and return the stored row"""
+
+    @abstractmethod
+    async def get_profiles(self, user_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get several profiles at once, keyed by user ID (missing users are omitted)"""
+
+    @abstractmethod
+    async def save_profiles(self, profiles: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Create or update several profiles (keyed by user ID) and return the stored rows"""
+
+    @abstractmethod
+    async def get_analysis(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """Get stored analysis rows, or None when the backend does not persist analysis.
+
+        Returns {career_recommendations, skill_gap_analysis, resume_guidance}
+        (row or None each) and job_recommendations (list, best match first).
+        """
+
+    @abstractmethod
+    async def save_analysis(
+        self,
+        user_id: str,
+        profile_id: str,
+        career_data: Dict[str, Any],
+        skill_data: Dict[str, Any],
+        job_rows: List[Dict[str, Any]],
+        resume_data: Dict[str, Any]
+    ):
+        """Replace a user's stored analysis"""
+
+    async def save_analyses(self, analyses: List[Dict[str, Any]]):
+        """Replace several users' stored analyses (bulk import).
+
+        Each item holds save_analysis's arguments: user_id, profile_id,
+        career_data, skill_data, job_rows and resume_data.
+        """
+        await asyncio.gather(*(self.save_analysis(**analysis) for analysis in analyses))
+
+    async def get_dashboard(self, user_id: str) -> Dict[str, Any]:
+        """Get the profile and stored analysis for the dashboard.
+
+        Returns {"user_profile": row or None, "analysis": rows or None};
+        analysis is None when it is not stored or could not be read.
+        """
+        profile = await self.get_profile(user_id)
+        if profile is None or not self.persists_analysis:
+            return {"user_profile": profile, "analysis": None}
+
+        try:
+            analysis = await self.get_analysis(user_id)
+        except Exception as e:
+            print(f"Error retrieving stored analysis: {e}")
+            analysis = None
+        return {"user_profile": profile, "analysis": analysis}
+
+    async def close(self):
+        """Release connections and flush pending writes"""
@@ -0,0 +1,48 @@
+"""
+Storage backend on top of the in-process MemoryStorage (demo mode).
+"""
+
+from typing import Any, Dict, List, Optional
+
+from app.storage.base import StorageBackend
+from app.utils.memory_storage import MemoryStorage
+
+
+class MemoryStorageBackend(StorageBackend):
+    """Profiles in MemoryStorage; analysis is generated on demand, not stored"""
+
+    name = "memory"
+    persists_analysis = False
+
+    def __init__(self, storage: MemoryStorage):
+        self.storage = storage
+
+    async def get_profile(self, user_id: str) -> Optional[Dict[str, Any]]:
+        return self.storage.get_user_profile(user_id)
+
+    async def save_profile(self, user_id: str, profile_data: Dict[str, Any]) -> Dict[str, Any]:
+        return self.storage.save_user_profile(user_id, profile_data)
+
+    async def get_profiles(self, user_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        profiles = {}
+        for user_id in user_ids:
+            profile = self.storage.get_user_profile(user_id)
+            if profile is not None:
+                profiles[user_id] = profile
+        return profiles
+
+    async def save_profiles(self, profiles: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [self.storage.save_user_profile(user_id, profile) for user_id, profile in profiles.items()]
+
+    async def get_analysis(self, user_id: str) -> Optional[Dict[str, Any]]:
+        return None
+
+    async def save_analysis(self, user_id, profile_id, career_data, skill_data, job_rows, resume_data):
+        # Analysis is generated on demand in memory mode
+        return None
+
+    async def save_analyses(self, analyses: List[Dict[str, Any]]):
+        return None
+
+    async def close(self):
+        self.storage.close()
@@ -0,0 +1,189 @@
+"""
+Storage backend on a local SQLite database.
+
+A single connection is used from one dedicated thread, so every query runs
+off the event loop and writes are serialized without extra locking.
+"""
+
+import asyncio
+import json
+import sqlite3
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from app.core.metrics import metrics
+from app.storage.base import StorageBackend
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS user_profiles (
+    user_id TEXT PRIMARY KEY,
+    id TEXT NOT NULL,
+    education TEXT NOT NULL,
+    current_skills TEXT NOT NULL,
+    career_goals TEXT NOT NULL,
+    experience_level TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS analysis (
+    user_id TEXT PRIMARY KEY,
+    profile_id TEXT NOT NULL,
+    career_recommendations TEXT NOT NULL,
+    skill_gap_analysis TEXT NOT NULL,
+    job_recommendations TEXT NOT NULL,
+    resume_guidance TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+"""
+
+PROFILE_COLUMNS = ["user_id", "id", "education", "current_skills", "career_goals", "experience_level", "created_at", "updated_at"]
+JSON_COLUMNS = {"education", "current_skills"}
+
+
+class SQLiteStorageBackend(StorageBackend):
+    """Profiles and analysis in a local SQLite file"""
+
+    name = "sqlite"
+
+    def __init__(self, path: str):
+        self.path = path
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite")
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path)
+            self._connection.row_factory = sqlite3.Row
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.executescript(SCHEMA)
+        return self._connection
+
+    async def _run(self, func: Callable[[sqlite3.Connection], Any]) -> Any:
+        loop = asyncio.get_running_loop()
+        with metrics.stage("sqlite"):
+            return await loop.run_in_executor(self._executor, lambda: func(self._connect()))
+
+    @staticmethod
+    def _profile_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+        return {
+            column: json.loads(row[column]) if column in JSON_COLUMNS else row[column]
+            for column in PROFILE_COLUMNS
+        }
+
+    @staticmethod
+    def _upsert_profiles(connection: sqlite3.Connection, profiles: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        now = datetime.now().isoformat()
+        existing = {}
+        user_ids = list(profiles)
+        # Keep IDs and creation times of existing rows (chunked under SQLite's variable limit)
+        for start in range(0, len(user_ids), 500):
+            chunk = user_ids[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            for row in connection.execute(
+                f"SELECT user_id, id, created_at FROM user_profiles WHERE user_id IN ({placeholders})", chunk
+            ):
+                existing[row["user_id"]] = (row["id"], row["created_at"])
+
+        saved = []
+        for user_id, profile_data in profiles.items():
+            profile_id, created_at = existing.get(user_id, (profile_data.get("id") or str(uuid.uuid4()), now))
+            saved.append({
+                "user_id": user_id,
+                "id": profile_id,
+                "education": profile_data["education"],
+                "current_skills": profile_data["current_skills"],
+                "career_goals": profile_data["career_goals"],
+                "experience_level": profile_data["experience_level"],
+                "created_at": created_at,
+                "updated_at": now
+            })
+
+        with connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO user_profiles VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    [json.dumps(profile[column]) if column in JSON_COLUMNS else profile[column] for column in PROFILE_COLUMNS]
+                    for profile in saved
+                ]
+            )
+        return saved
+
+    async def get_profile(self, user_id: str) -> Optional[Dict[str, Any]]:
+        def query(connection):
+            row = connection.execute("SELECT * FROM user_profiles WHERE user_id = ?", (user_id,)).fetchone()
+            return self._profile_from_row(row) if row else None
+        return await self._run(query)
+
+    async def save_profile(self, user_id: str, profile_data: Dict[str, Any]) -> Dict[str, Any]:
+        saved = await self._run(lambda connection: self._upsert_profiles(connection, {user_id: profile_data}))
+        return saved[0]
+
+    async def get_profiles(self, user_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        def query(connection):
+            profiles = {}
+            for start in range(0, len(user_ids), 500):
+                chunk = user_ids[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                for row in connection.execute(f"SELECT * FROM user_profiles WHERE user_id IN ({placeholders})", chunk):
+                    profiles[row["user_id"]] = self._profile_from_row(row)
+            return profiles
+        return await self._run(query)
+
+    async def save_profiles(self, profiles: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return await self._run(lambda connection: self._upsert_profiles(connection, profiles))
+
+    async def get_analysis(self, user_id: str) -> Optional[Dict[str, Any]]:
+        def query(connection):
+            row = connection.execute("SELECT * FROM analysis WHERE user_id = ?", (user_id,)).fetchone()
+            if not row:
+                return {
+                    "career_recommendations": None,
+                    "skill_gap_analysis": None,
+                    "job_recommendations": [],
+                    "resume_guidance": None
+                }
+            return {
+                "career_recommendations": json.loads(row["career_recommendations"]),
+                "skill_gap_analysis": json.loads(row["skill_gap_analysis"]),
+                "job_recommendations": json.loads(row["job_recommendations"]),
+                "resume_guidance": json.loads(row["resume_guidance"])
+            }
+        return await self._run(query)
+
+    @staticmethod
+    def _analysis_row(user_id, profile_id, career_data, skill_data, job_rows, resume_data) -> tuple:
+        jobs = sorted(job_rows, key=lambda job: job["match_score"], reverse=True)
+        return (
+            user_id, profile_id,
+            json.dumps(career_data), json.dumps(skill_data),
+            json.dumps(jobs), json.dumps(resume_data),
+            datetime.now().isoformat()
+        )
+
+    async def save_analysis(self, user_id, profile_id, career_data, skill_data, job_rows, resume_data):
+        row = self._analysis_row(user_id, profile_id, career_data, skill_data, job_rows, resume_data)
+
+        def query(connection):
+            # One row per user, so the whole analysis is replaced atomically
+            with connection:
+                connection.execute("INSERT OR REPLACE INTO analysis VALUES (?, ?, ?, ?, ?, ?, ?)", row)
+        await self._run(query)
+
+    async def save_analyses(self, analyses: List[Dict[str, Any]]):
+        rows = [self._analysis_row(**analysis) for analysis in analyses]
+
+        def query(connection):
+            with connection:
+                connection.executemany("INSERT OR REPLACE INTO analysis VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+        await self._run(query)
+
+    async def close(self):
+        def close_connection(connection):
+            connection.close()
+            self._connection = None
+        if self._connection is not None:
+            await self._run(close_connection)
+        self._executor.shutdown(wait=True)
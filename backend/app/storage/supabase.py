@@ -0,0 +1,193 @@
+"""
+Storage backend on Supabase (PostgREST).
+
+Uses the get_dashboard, save_analysis and save_analyses database functions
+for single round-trip reads and atomic writes, falling back to per-table
+queries when they are not installed.
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from app.storage.base import StorageBackend
+from app.utils.supabase_client import get_supabase, execute_async, is_missing_function
+
+
+class SupabaseStorageBackend(StorageBackend):
+    """Profiles and analysis in Supabase tables"""
+
+    name = "supabase"
+
+    def __init__(self, client=None):
+        self._client = client
+        # Set to False once the database function turns out to be missing
+        self.dashboard_rpc_available = True
+        self.analysis_rpc_available = True
+        self.analyses_rpc_available = True
+
+    @property
+    def client(self):
+        # Created on first query rather than at startup
+        return self._client or get_supabase()
+
+    async def get_profile(self, user_id: str) -> Optional[Dict[str, Any]]:
+        result = await execute_async(self.client.table('user_profiles').select('*').eq('user_id', user_id))
+        return result.data[0] if result.data else None
+
+    async def save_profile(self, user_id: str, profile_data: Dict[str, Any]) -> Dict[str, Any]:
+        profile_data = {**profile_data, "user_id": user_id}
+        existing_profile = await execute_async(self.client.table('user_profiles').select('id').eq('user_id', user_id))
+
+        if existing_profile.data:
+            # Update existing profile
+            result = await execute_async(self.client.table('user_profiles').update(profile_data).eq('user_id', user_id))
+        else:
+            # Create new profile
+            result = await execute_async(self.client.table('user_profiles').insert(profile_data))
+
+        if not result.data:
+            raise ValueError("Failed to save profile")
+        return result.data[0]
+
+    async def get_profiles(self, user_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        if not user_ids:
+            return {}
+        result = await execute_async(self.client.table('user_profiles').select('*').in_('user_id', user_ids))
+        return {profile['user_id']: profile for profile in result.data}
+
+    async def save_profiles(self, profiles: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        if not profiles:
+            return []
+        existing = await execute_async(
+            self.client.table('user_profiles').select('id, user_id').in_('user_id', list(profiles))
+        )
+        existing_ids = {row['user_id']: row['id'] for row in existing.data}
+
+        # PostgREST bulk writes need uniform keys: upsert existing rows by primary
+        # key and insert new ones, one request each
+        updates = [
+            {**profile, "user_id": user_id, "id": existing_ids[user_id]}
+            for user_id, profile in profiles.items() if user_id in existing_ids
+        ]
+        inserts = [
+            {**profile, "user_id": user_id}
+            for user_id, profile in profiles.items() if user_id not in existing_ids
+        ]
+
+        requests = []
+        if updates:
+            requests.append(execute_async(self.client.table('user_profiles').upsert(updates, on_conflict='id')))
+        if inserts:
+            requests.append(execute_async(self.client.table('user_profiles').insert(inserts)))
+        results = await asyncio.gather(*requests)
+        return [row for result in results for row in result.data]
+
+    async def get_analysis(self, user_id: str) -> Optional[Dict[str, Any]]:
+        # The analysis tables are independent, so read them concurrently
+        career_result, skill_result, job_result, resume_result = await asyncio.gather(
+            execute_async(self.client.table('career_recommendations').select('*').eq('user_id', user_id)),
+            execute_async(self.client.table('skill_gap_analysis').select('*').eq('user_id', user_id)),
+            execute_async(self.client.table('job_recommendations').select('*').eq('user_id', user_id).order('match_score', desc=True)),
+            execute_async(self.client.table('resume_guidance').select('*').eq('user_id', user_id))
+        )
+        return {
+            "career_recommendations": career_result.data[0] if career_result.data else None,
+            "skill_gap_analysis": skill_result.data[0] if skill_result.data else None,
+            "job_recommendations": job_result.data,
+            "resume_guidance": resume_result.data[0] if resume_result.data else None
+        }
+
+    async def get_dashboard(self, user_id: str) -> Dict[str, Any]:
+        """Read the whole dashboard in one round-trip via the get_dashboard function"""
+        if self.dashboard_rpc_available:
+            try:
+                result = await execute_async(self.client.rpc('get_dashboard', {'p_user_id': user_id}))
+            except Exception as e:
+                if not is_missing_function(e):
+                    raise
+                print("get_dashboard function not found - falling back to per-table dashboard reads")
+                self.dashboard_rpc_available = False
+            else:
+                document = result.data or {}
+                profile = document.get('user_profile')
+                return {
+                    "user_profile": profile,
+                    "analysis": {
+                        "career_recommendations": document.get('career_recommendations'),
+                        "skill_gap_analysis": document.get('skill_gap_analysis'),
+                        "job_recommendations": document.get('job_recommendations') or [],
+                        "resume_guidance": document.get('resume_guidance')
+                    } if profile else None
+                }
+
+        return await super().get_dashboard(user_id)
+
+    async def save_analysis(self, user_id, profile_id, career_data, skill_data, job_rows, resume_data):
+        """Replace all four analysis rows in one transaction via the save_analysis function"""
+        if self.analysis_rpc_available:
+            try:
+                await execute_async(self.client.rpc('save_analysis', {
+                    "p_user_id": user_id,
+                    "p_profile_id": profile_id,
+                    "p_career": career_data,
+                    "p_skills": skill_data,
+                    "p_jobs": job_rows,
+                    "p_resume": resume_data
+                }))
+                return
+            except Exception as e:
+                if not is_missing_function(e):
+                    raise
+                print("save_analysis function not found - falling back to per-table analysis writes")
+                self.analysis_rpc_available = False
+
+        await self._save_analysis_tables([user_id], [career_data], [skill_data], job_rows, [resume_data])
+
+    async def save_analyses(self, analyses: List[Dict[str, Any]]):
+        """Replace many users' analyses in one transaction via the save_analyses function"""
+        if not analyses:
+            return
+        if self.analyses_rpc_available:
+            try:
+                await execute_async(self.client.rpc('save_analyses', {"p_analyses": [
+                    {
+                        "p_user_id": analysis["user_id"],
+                        "p_profile_id": analysis["profile_id"],
+                        "p_career": analysis["career_data"],
+                        "p_skills": analysis["skill_data"],
+                        "p_jobs": analysis["job_rows"],
+                        "p_resume": analysis["resume_data"]
+                    } for analysis in analyses
+                ]}))
+                return
+            except Exception as e:
+                if not is_missing_function(e):
+                    raise
+                print("save_analyses function not found - falling back to per-table analysis writes")
+                self.analyses_rpc_available = False
+
+        await self._save_analysis_tables(
+            [analysis["user_id"] for analysis in analyses],
+            [analysis["career_data"] for analysis in analyses],
+            [analysis["skill_data"] for analysis in analyses],
+            [job for analysis in analyses for job in analysis["job_rows"]],
+            [analysis["resume_data"] for analysis in analyses]
+        )
+
+    async def _save_analysis_tables(self, user_ids, career_data, skill_data, job_rows, resume_data):
+        """Save analyses with one request per table for all the users (fallback path, not atomic)"""
+        # Insert the new job recommendations in one request before removing the
+        # old ones, so a failure part-way never leaves a user without any
+        if job_rows:
+            inserted = await execute_async(self.client.table('job_recommendations').insert(job_rows))
+            new_ids = [job['id'] for job in inserted.data]
+            await execute_async(self.client.table('job_recommendations').delete().in_('user_id', user_ids).not_.in_('id', new_ids))
+        else:
+            await execute_async(self.client.table('job_recommendations').delete().in_('user_id', user_ids))
+
+        # The remaining upserts are independent
+        await asyncio.gather(
+            execute_async(self.client.table('career_recommendations').upsert(career_data, on_conflict='user_id')),
+            execute_async(self.client.table('skill_gap_analysis').upsert(skill_data, on_conflict='user_id')),
+            execute_async(self.client.table('resume_guidance').upsert(resume_data, on_conflict='user_id'))
+        )
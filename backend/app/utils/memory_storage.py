@@ -1,41 +1,87 @@
 """
 In-memory storage for when Supabase is not configured.
 This allows the app to run for demonstration purposes.
+
+Profiles are kept in an LRU map and chat history in a per-user ring buffer,
+so memory stays bounded. With a persistence path set, every write is also
+appended to a JSON-lines log that is replayed at startup. The log is
+rewritten from the live entries (compacted) at startup and, while running,
+once it holds at least compact_min_records records and more than twice the
+live ones, so superseded and evicted entries do not pile up on disk.
 """
 
 import json
+import os
+import threading
 import uuid
-from typing import Dict, Any, List, Optional
+from collections import OrderedDict, deque
+from typing import Dict, Any, List, Optional, Deque
 from datetime import datetime
 
+from app.core.config import settings
+
 class MemoryStorage:
     """Simple in-memory storage to replace Supabase for demo purposes"""
 
-    def __init__(self):
-        self.user_profiles: Dict[str, Dict[str, Any]] = {}
-        self.chat_history: Dict[str, List[Dict[str, Any]]] = {}
+    def __init__(
+        self,
+        max_profiles: int = 10000,
+        max_chat_messages: int = 100,
+        persist_path: Optional[str] = None,
+        compact_min_records: int = 100000
+    ):
+        self.max_profiles = max_profiles
+        self.max_chat_messages = max_chat_messages
+        self.persist_path = persist_path
+        self.compact_min_records = compact_min_records
+        self.user_profiles: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.chat_history: "OrderedDict[str, Deque[Dict[str, Any]]]" = OrderedDict()
+        self.evictions = 0
+        self.compactions = 0
+        self._lock = threading.Lock()
+        self._log = None
+        self._log_records = 0  # Records in the log file
+        self._next_compaction_check = 0
+
+        if persist_path:
+            self._log_records = self._replay()
+            # Compact when the log is mostly superseded or evicted entries
+            if self._log_records > 2 * self._record_count():
+                self.compact()
+            else:
+                self._schedule_compaction_check()
+            self._log = open(persist_path, "a", encoding="utf-8")
 
     def save_user_profile(self, user_id: str, profile_data: Dict[str, Any]) -> Dict[str, Any]:
         """Save user profile data"""
-        # Generate a unique ID if not provided
-        if 'id' not in profile_data:
-            profile_data['id'] = str(uuid.uuid4())
+        with self._lock:
+            # Updates keep the existing ID and creation time, like a database row
+            existing = self.user_profiles.get(user_id)
+            if existing is not None:
+                profile_data['id'] = existing['id']
+                profile_data['created_at'] = existing['created_at']
+            else:
+                # Generate a unique ID if not provided
+                if 'id' not in profile_data:
+                    profile_data['id'] = str(uuid.uuid4())
+                profile_data['created_at'] = datetime.now().isoformat()
 
-        profile_data['user_id'] = user_id
-        profile_data['created_at'] = datetime.now().isoformat()
-        profile_data['updated_at'] = datetime.now().isoformat()
-        self.user_profiles[user_id] = profile_data
+            profile_data['user_id'] = user_id
+            profile_data['updated_at'] = datetime.now().isoformat()
+            self._put_profile(user_id, profile_data)
+            self._append({"op": "profile", "user_id": user_id, "data": profile_data})
         return profile_data
 
     def get_user_profile(self, user_id: str) -> Optional[Dict[str, Any]]:
         """Get user profile data"""
-        return self.user_profiles.get(user_id)
+        with self._lock:
+            profile = self.user_profiles.get(user_id)
+            if profile is not None:
+                self.user_profiles.move_to_end(user_id)
+            return profile
 
     def save_chat_message(self, user_id: str, message: str, response: str) -> Dict[str, Any]:
         """Save chat message and response"""
-        if user_id not in self.chat_history:
-            self.chat_history[user_id] = []
-
         chat_entry = {
             'user_id': user_id,
             'message': message,
@@ -43,12 +89,111 @@ class MemoryStorage:
             'timestamp': datetime.now().isoformat()
         }
 
-        self.chat_history[user_id].append(chat_entry)
+        with self._lock:
+            self._put_chat(user_id, chat_entry)
+            self._append({"op": "chat", "user_id": user_id, "data": chat_entry})
         return chat_entry
 
     def get_chat_history(self, user_id: str) -> List[Dict[str, Any]]:
-        """Get chat history for user"""
-        return self.chat_history.get(user_id, [])
+        """Get chat history for user (oldest first, at most max_chat_messages)"""
+        with self._lock:
+            return list(self.chat_history.get(user_id, ()))
+
+    def compact(self):
+        """Rewrite the persistence log with only the live entries"""
+        if not self.persist_path:
+            return
+        with self._lock:
+            self._compact()
+
+    def _compact(self):
+        tmp_path = f"{self.persist_path}.tmp"
+        records = 0
+        with open(tmp_path, "w", encoding="utf-8") as tmp:
+            for user_id, profile in self.user_profiles.items():
+                tmp.write(json.dumps({"op": "profile", "user_id": user_id, "data": profile}) + "\n")
+                records += 1
+            for user_id, entries in self.chat_history.items():
+                for entry in entries:
+                    tmp.write(json.dumps({"op": "chat", "user_id": user_id, "data": entry}) + "\n")
+                    records += 1
+        if self._log:
+            self._log.close()
+        os.replace(tmp_path, self.persist_path)
+        if self._log:
+            self._log = open(self.persist_path, "a", encoding="utf-8")
+        self._log_records = records
+        self.compactions += 1
+        self._schedule_compaction_check()
+
+    def _schedule_compaction_check(self):
+        # Counting the live entries walks every chat buffer, so it is only
+        # done again once the log could have grown past twice their number
+        self._next_compaction_check = max(self.compact_min_records, 2 * self._record_count() + 1)
+
+    def close(self):
+        """Flush and close the persistence log"""
+        with self._lock:
+            if self._log:
+                self._log.close()
+                self._log = None
+
+    def _put_profile(self, user_id: str, profile_data: Dict[str, Any]):
+        self.user_profiles[user_id] = profile_data
+        self.user_profiles.move_to_end(user_id)
+        while len(self.user_profiles) > self.max_profiles:
+            self.user_profiles.popitem(last=False)
+            self.evictions += 1
+
+    def _put_chat(self, user_id: str, chat_entry: Dict[str, Any]):
+        history = self.chat_history.get(user_id)
+        if history is None:
+            history = self.chat_history[user_id] = deque(maxlen=self.max_chat_messages)
+        history.append(chat_entry)
+        self.chat_history.move_to_end(user_id)
+        # Chat buffers are bounded per user; the number of users shares the profile limit
+        while len(self.chat_history) > self.max_profiles:
+            self.chat_history.popitem(last=False)
+            self.evictions += 1
+
+    def _append(self, record: Dict[str, Any]):
+        if self._log:
+            self._log.write(json.dumps(record) + "\n")
+            self._log.flush()
+            self._log_records += 1
+            if self._log_records >= self._next_compaction_check:
+                if self._log_records > 2 * self._record_count():
+                    self._compact()
+                else:
+                    self._schedule_compaction_check()
+
+    def _replay(self) -> int:
+        """Rebuild state from the persistence log; returns the number of records read"""
+        if not os.path.exists(self.persist_path):
+            return 0
+
+        replayed = 0
+        with open(self.persist_path, "r", encoding="utf-8") as log:
+            for line in log:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # Torn final write after a crash
+                    continue
+                if record.get("op") == "profile":
+                    self._put_profile(record["user_id"], record["data"])
+                elif record.get("op") == "chat":
+                    self._put_chat(record["user_id"], record["data"])
+                replayed += 1
+        return replayed
+
+    def _record_count(self) -> int:
+        return len(self.user_profiles) + sum(len(entries) for entries in self.chat_history.values())
 
 # Global instance
-memory_storage = MemoryStorage()
\ No newline at end of file
+memory_storage = MemoryStorage(
+    max_profiles=settings.memory_max_profiles,
+    max_chat_messages=settings.memory_max_chat_messages,
+    persist_path=settings.memory_storage_path,
+    compact_min_records=settings.memory_compact_min_records
+)
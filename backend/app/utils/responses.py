@@ -0,0 +1,87 @@
+"""
+Fast JSON responses and conditional requests for API routes.
+
+Returning an APIResponse model makes FastAPI validate it against the route's
+response_model and then encode it again. json_response serializes it once with
+pydantic's JSON encoder and hands back the bytes; response_model stays on the
+route for the OpenAPI docs.
+
+Routes whose output only changes with a known version (a profile's updated_at,
+the catalog contents) send an ETag, and answer a matching If-None-Match with
+304 Not Modified before building the response at all.
+"""
+
+import hashlib
+import threading
+from typing import Any, Dict, Optional
+
+from fastapi import Request, Response
+
+from app.core.metrics import metrics
+from app.models.schemas import APIResponse
+
+
+def json_response(response: APIResponse, status_code: int = 200, headers: Optional[Dict[str, str]] = None) -> Response:
+    """Serialize an API response in one pass, without re-validation"""
+    with metrics.stage("serialize"):
+        content = response.model_dump_json()
+    return Response(
+        content=content,
+        status_code=status_code,
+        media_type="application/json",
+        headers=headers
+    )
+
+
+def make_etag(*parts: Any) -> str:
+    """Strong ETag from the values a response is derived from"""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else str(part).encode("utf-8"))
+        digest.update(b"\0")
+    return f'"{digest.hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match already names this ETag"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        # Weak comparison, as RFC 9110 requires for If-None-Match
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def not_modified(headers: Dict[str, str]) -> Response:
+    """Empty 304 response carrying the validator headers"""
+    return Response(status_code=304, headers=headers)
+
+
+class ConditionalStats:
+    """Per-route counters of conditional GETs answered with 304"""
+
+    def __init__(self):
+        self._counts: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, route: str, not_modified: bool) -> None:
+        with self._lock:
+            counts = self._counts.setdefault(route, {"requests": 0, "not_modified": 0})
+            counts["requests"] += 1
+            if not_modified:
+                counts["not_modified"] += 1
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Requests, 304s and 304 hit rate per route"""
+        with self._lock:
+            return {
+                route: {**counts, "hit_rate": counts["not_modified"] / counts["requests"]}
+                for route, counts in self._counts.items()
+            }
+
+
+# Global instance
+conditional_stats = ConditionalStats()
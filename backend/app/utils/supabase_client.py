@@ -1,25 +1,71 @@
-from supabase import create_client, Client
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional, TYPE_CHECKING
 from app.core.config import settings
+from app.core.metrics import metrics
 
-def get_supabase_client() -> Client:
+if TYPE_CHECKING:
+    from supabase import Client
+
+# PostgREST / Postgres error codes for a database function that does not exist
+MISSING_FUNCTION_CODES = {"PGRST202", "42883"}
+
+def get_supabase_client() -> "Client":
     """Get Supabase client instance"""
+    # The supabase package is slow to import, so only load it when a client is needed
+    from supabase import create_client
     return create_client(settings.supabase_url, settings.supabase_key)
 
-def get_supabase_admin_client() -> Client:
+def get_supabase_admin_client() -> "Client":
     """Get Supabase admin client with service role key"""
     if not settings.supabase_service_role_key:
         raise ValueError("SUPABASE_SERVICE_ROLE_KEY is required for admin operations")
 
+    from supabase import create_client
     return create_client(settings.supabase_url, settings.supabase_service_role_key)
 
-# Create global client instances
-supabase = get_supabase_client()
+# Global client instance, created on first use so memory mode never pays for it
+_supabase: Optional["Client"] = None
+_supabase_lock = threading.Lock()
+
+def get_supabase() -> "Client":
+    """Get the shared Supabase client, creating it on first use"""
+    global _supabase
+    if _supabase is None:
+        with _supabase_lock:
+            if _supabase is None:
+                _supabase = get_supabase_client()
+    return _supabase
+
+def __getattr__(name: str) -> Any:
+    # Keep `from app.utils.supabase_client import supabase` working, lazily
+    if name == "supabase":
+        return get_supabase()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Bounded pool for the blocking Supabase client, so queries never run on the event loop
+query_executor = ThreadPoolExecutor(
+    max_workers=settings.supabase_max_workers,
+    thread_name_prefix="supabase"
+)
+
+async def execute_async(query: Any) -> Any:
+    """Run a Supabase query builder's blocking execute() on the query pool"""
+    loop = asyncio.get_running_loop()
+    with metrics.stage("supabase"):
+        return await loop.run_in_executor(query_executor, query.execute)
+
+def is_missing_function(error: Exception) -> bool:
+    """Check whether an RPC failed because the database function is not installed"""
+    from postgrest.exceptions import APIError
+    return isinstance(error, APIError) and error.code in MISSING_FUNCTION_CODES
 
 async def test_connection() -> bool:
     """Test Supabase connection"""
     try:
         # Simple query to test connection
-        response = supabase.table('users').select('id').limit(1).execute()
+        response = get_supabase().table('users').select('id').limit(1).execute()
         return True
     except Exception as e:
         print(f"Supabase connection error: {e}")
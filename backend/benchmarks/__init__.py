@@ -0,0 +1 @@
+# AI Career Guidance Platform - Backend benchmarks
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark for batch guidance over a cohort of profiles
+
+Builds a cohort where many students share the same profile, then times full
+analysis one profile at a time (what N /api/profile/submit calls compute),
+CareerGuidanceService.generate_batch (deduplicated, in-process), and
+stream_batch_guidance (deduplicated, on the process pool), including the time
+to the first streamed result. Run from the backend directory:
+
+    python -m benchmarks.batch_guidance [profiles] [distinct]
+"""
+
+import asyncio
+import os
+import random
+import sys
+import time
+
+from app.core.config import settings
+from app.services.career_guidance import career_guidance_service
+from app.services.guidance_batch import batch_workers, parse_profile, shutdown_batch_executor, stream_batch_guidance
+
+GOALS = [
+    "Full stack web developer", "Data scientist working on machine learning", "Cloud DevOps engineer",
+    "Cybersecurity analyst", "Mobile app developer", "Product manager", "Backend software engineer"
+]
+SKILLS = [
+    "Python", "JavaScript", "React", "SQL", "Git", "Docker", "AWS", "Java", "Linux", "Pandas",
+    "Machine Learning", "Node.js", "TypeScript", "Kubernetes", "HTML", "CSS"
+]
+SOFT = ["Communication", "Teamwork", "Problem Solving", "Leadership"]
+LEVELS = ["student", "entry", "mid", "senior"]
+
+def build_cohort(count: int, distinct: int, rng: random.Random):
+    unique = [
+        {
+            "id": f"template-{i}",
+            "education": {"degree": rng.choice(["BTech", "BSc", "MCA"]), "field": "Computer Science"},
+            "current_skills": {"technical": rng.sample(SKILLS, rng.randint(2, 7)), "soft": rng.sample(SOFT, 2)},
+            "career_goals": rng.choice(GOALS),
+            "experience_level": rng.choice(LEVELS)
+        }
+        for i in range(distinct)
+    ]
+    return [dict(rng.choice(unique), id=i) for i in range(count)]
+
+async def consume(items):
+    async def source():
+        for item in items:
+            yield item
+    first = None
+    started = time.perf_counter()
+    lines = 0
+    async for _ in stream_batch_guidance(source()):
+        if first is None:
+            first = time.perf_counter() - started
+        lines += 1
+    return first, lines
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    distinct = int(sys.argv[2]) if len(sys.argv) > 2 else 400
+    cohort = build_cohort(count, distinct, random.Random(42))
+    profiles = [parse_profile(item) for item in cohort]
+    print(f"{count} profiles, {distinct} distinct, {os.cpu_count()} CPUs, "
+          f"{batch_workers()} pool workers, chunk size {settings.guidance_batch_chunk_size}")
+
+    start = time.perf_counter()
+    for profile in profiles:
+        career_guidance_service.analyze_profile(profile).model_dump_json()
+    one_by_one = time.perf_counter() - start
+    print(f"  one at a time:           {one_by_one:7.2f} s  ({count / one_by_one:8.0f} profiles/s)")
+
+    start = time.perf_counter()
+    for _, analysis in career_guidance_service.generate_batch(profiles):
+        analysis.model_dump_json()
+    batched = time.perf_counter() - start
+    print(f"  generate_batch:          {batched:7.2f} s  ({count / batched:8.0f} profiles/s)")
+
+    # Start the workers outside the timed run
+    asyncio.run(consume(cohort[:1]))
+    start = time.perf_counter()
+    first, lines = asyncio.run(consume(cohort))
+    pooled = time.perf_counter() - start
+    shutdown_batch_executor()
+    assert lines == count + 1, lines
+    print(f"  stream_batch_guidance:   {pooled:7.2f} s  ({count / pooled:8.0f} profiles/s), "
+          f"first result after {first * 1000:.0f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for CareerGuidanceService.analyze_skill_gaps
+
+Reports time and memory churn per call. Run from the backend directory:
+
+    python -m benchmarks.catalog_allocations
+"""
+
+import sys
+import time
+import tracemalloc
+
+from app.services.career_guidance import CareerGuidanceService
+
+SAMPLE_PROFILE = {
+    "experience_level": "student",
+    "career_goals": "I want to become a full stack developer",
+    "current_skills": {
+        "technical": ["Python", "HTML", "CSS"],
+        "soft": ["Communication"],
+        "certifications": []
+    },
+    "education": {"degree": "B.Tech", "field": "Computer Science"}
+}
+
+def measure_allocations(service: CareerGuidanceService, calls: int) -> dict:
+    """Measure allocated blocks and peak bytes per call using tracemalloc"""
+    tracemalloc.start()
+    try:
+        service.analyze_skill_gaps(SAMPLE_PROFILE)  # warm up
+        before = tracemalloc.take_snapshot()
+        allocated_bytes = 0
+        peak_bytes = 0
+        for _ in range(calls):
+            tracemalloc.reset_peak()
+            start_current, _ = tracemalloc.get_traced_memory()
+            service.analyze_skill_gaps(SAMPLE_PROFILE)
+            current, peak = tracemalloc.get_traced_memory()
+            allocated_bytes += current - start_current
+            peak_bytes += peak - start_current
+        after = tracemalloc.take_snapshot()
+        retained = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "peak_bytes_per_call": peak_bytes // calls,
+        "retained_bytes_per_call": allocated_bytes // calls,
+        "retained_blocks": retained
+    }
+
+def measure_time(service: CareerGuidanceService, calls: int) -> float:
+    """Return mean nanoseconds per call"""
+    start = time.perf_counter_ns()
+    for _ in range(calls):
+        service.analyze_skill_gaps(SAMPLE_PROFILE)
+    return (time.perf_counter_ns() - start) / calls
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    service = CareerGuidanceService()
+
+    allocations = measure_allocations(service, min(calls, 200))
+    ns_per_call = measure_time(service, calls)
+
+    print("analyze_skill_gaps")
+    print(f"  time/call:           {ns_per_call / 1000:.1f} us")
+    print(f"  peak bytes/call:     {allocations['peak_bytes_per_call']}")
+    print(f"  retained bytes/call: {allocations['retained_bytes_per_call']}")
+    print(f"  retained blocks:     {allocations['retained_blocks']}")
+
+if __name__ == "__main__":
+    main()
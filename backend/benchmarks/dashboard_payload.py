@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark for dashboard response size and serialization time
+
+Compares the dashboard with the full skill catalog embedded in the skill gap
+analysis (the previous response) against the current response, trimmed to the
+user's missing and recommended skills. Serialization follows the dashboard
+route: DashboardData.dict() wrapped in APIResponse, encoded to JSON. Run from
+the backend directory:
+
+    python -m benchmarks.dashboard_payload [iterations]
+"""
+
+import json
+import sys
+import time
+import warnings
+
+from fastapi.encoders import jsonable_encoder
+
+from app.models.schemas import APIResponse, DashboardData, UserProfileResponse
+from app.services.career_guidance import CareerGuidanceService
+
+PROFILES = {
+    "student": {
+        "current_skills": {"technical": ["Python", "SQL"], "soft": ["Communication"], "certifications": []},
+        "career_goals": "I want to become a full stack developer",
+        "experience_level": "student"
+    },
+    "mid_level": {
+        "current_skills": {"technical": ["Python", "JavaScript", "SQL", "Git", "React", "Docker", "AWS"], "soft": ["Leadership"], "certifications": []},
+        "career_goals": "senior software engineer",
+        "experience_level": "mid_level"
+    }
+}
+
+class FullCatalogService(CareerGuidanceService):
+    """Previous behaviour: every skill gap analysis carries the whole catalog"""
+
+    def analyze_skill_gaps(self, profile):
+        analysis = super().analyze_skill_gaps(profile)
+        learning_resources = dict(self.catalog.learning_resources)
+        learning_resources.update(analysis.learning_resources)
+        return analysis.model_copy(update={
+            "skill_categories": self.catalog.skill_categories,
+            "skill_topics": self.catalog.skill_topics,
+            "learning_resources": learning_resources
+        })
+
+def build_dashboard(service: CareerGuidanceService, profile: dict) -> DashboardData:
+    profile = {
+        "id": "profile-1", "user_id": "user-1",
+        "education": {"degree": "B.Tech", "field": "Computer Science"},
+        "created_at": "2025-01-01T00:00:00", "updated_at": "2025-01-01T00:00:00",
+        **profile
+    }
+    return DashboardData(
+        user_profile=UserProfileResponse(**profile),
+        has_profile=True,
+        career_recommendations=service.generate_career_recommendations(profile),
+        skill_gap_analysis=service.analyze_skill_gaps(profile),
+        job_recommendations=service.generate_job_recommendations(profile),
+        resume_guidance=service.generate_resume_guidance(profile)
+    )
+
+def serialize(dashboard_data: DashboardData) -> bytes:
+    response = APIResponse(success=True, data=dashboard_data.dict())
+    return json.dumps(jsonable_encoder(response), ensure_ascii=False).encode("utf-8")
+
+def measure(dashboard_data: DashboardData, iterations: int):
+    size = len(serialize(dashboard_data))
+    start = time.perf_counter()
+    for _ in range(iterations):
+        serialize(dashboard_data)
+    return size, (time.perf_counter() - start) / iterations
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    warnings.simplefilter("ignore")
+    services = {"full catalog": FullCatalogService(), "trimmed": CareerGuidanceService()}
+
+    print(f"{'profile':<10} {'response':<14} {'bytes':>10} {'us/serialize':>14}")
+    for profile_name, profile in PROFILES.items():
+        for label, service in services.items():
+            size, elapsed = measure(build_dashboard(service, profile), iterations)
+            print(f"{profile_name:<10} {label:<14} {size:>10,} {elapsed * 1e6:>14.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark for goal classification on long free-text career goals
+
+Compares the substring if/elif chains the three generators used to run (one
+chain per generator, so three per profile) with the GoalClassifier: one
+uncached primary-track search per profile, plus the memoized lookup the other
+generators hit, and the full weighted classify() scan. Run from the backend
+directory:
+
+    python -m benchmarks.goal_classifier
+"""
+
+import sys
+import time
+
+from app.services.goal_classifier import goal_classifier
+
+GOAL_SENTENCES = [
+    "I graduated in mechanical engineering but I have been teaching myself programming for two years.",
+    "I enjoy building things end to end and would like to work on products used by millions of people.",
+    "Eventually I would love to lead a small team and mentor junior colleagues.",
+    "Cloud infrastructure and automation interest me, as does keeping production systems healthy.",
+    "My long term goal is to become a full stack developer at a product company in Bangalore.",
+]
+
+def legacy_classify(career_goals: str) -> tuple:
+    """The substring chains previously duplicated across the three generators"""
+    # Each generator lowercased the goal text itself
+    text = career_goals.lower()
+    if "software" in text or "developer" in text or "engineer" in text:
+        career = "software_engineer"
+    elif "full stack" in text or "mern" in text:
+        career = "full_stack_developer"
+    elif "data scientist" in text or "machine learning" in text:
+        career = "data_scientist"
+    elif "devops" in text or "sre" in text:
+        career = "devops_engineer"
+    elif "cybersecurity" in text or "security" in text:
+        career = "cybersecurity_analyst"
+    elif "data" in text or "analyst" in text:
+        career = "data_analyst"
+    else:
+        career = None
+
+    text = career_goals.lower()
+    if "full stack" in text or "mern" in text:
+        jobs = "full_stack_developer"
+    elif "data scientist" in text or "machine learning" in text:
+        jobs = "data_scientist"
+    elif "devops" in text or "sre" in text:
+        jobs = "devops_engineer"
+    elif "cybersecurity" in text or "security" in text:
+        jobs = "cybersecurity_analyst"
+    elif "software" in text or "developer" in text:
+        jobs = "software_engineer"
+    elif "data" in text or "analyst" in text:
+        jobs = "data_analyst"
+    else:
+        jobs = None
+
+    text = career_goals.lower()
+    if "software" in text:
+        resume = "software"
+    elif "data" in text:
+        resume = "data"
+    else:
+        resume = None
+
+    return career, jobs, resume
+
+def goal_text(sentences: int) -> str:
+    """Build a free-text goal of the given number of sentences"""
+    return " ".join(GOAL_SENTENCES[i % len(GOAL_SENTENCES)] for i in range(sentences))
+
+def ns_per_call(func, text: str, calls: int) -> float:
+    start = time.perf_counter_ns()
+    for _ in range(calls):
+        func(text)
+    return (time.perf_counter_ns() - start) / calls
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    print(f"{'chars':>8} {'legacy us':>10} {'primary us':>11} {'memo hit us':>12} {'classify us':>12}  top track")
+    for sentences in (1, 5, 20, 100):
+        text = goal_text(sentences)
+        legacy = ns_per_call(legacy_classify, text, calls)
+        primary = ns_per_call(goal_classifier._first_track, text, calls)
+        memo = ns_per_call(goal_classifier.primary_track, text, calls)
+        scan = ns_per_call(goal_classifier._scan, text, calls)
+        top = goal_classifier.primary_track(text)
+        print(f"{len(text):>8} {legacy / 1000:>10.2f} {primary / 1000:>11.2f} {memo / 1000:>12.2f} {scan / 1000:>12.2f}  {top}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for each CareerGuidanceService generator, with a regression gate
+
+Runs generate_career_recommendations, analyze_skill_gaps,
+generate_job_recommendations and generate_resume_guidance over a synthetic
+profile corpus (benchmarks.profile_corpus, normalized as the routes save it)
+and reports per generator:
+
+- ns/call: median and minimum over several passes of the corpus
+- peak bytes/call: the most memory a call had allocated at once (tracemalloc)
+- retained bytes/call: what the call left allocated, its result included
+- output bytes: mean size of the result serialized as JSON
+
+--save writes the numbers to a JSON file; --compare reads such a file and
+exits with status 1 if the minimum ns/call or the peak bytes/call of any
+generator grew by more than --threshold percent. The minimum is gated rather
+than the median because it is the least disturbed by other load on the
+machine. Run from the backend directory:
+
+    python -m benchmarks.guidance_generators [--profiles 500] [--passes 7] [--save FILE] [--compare FILE] [--threshold 15]
+"""
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from pydantic import TypeAdapter
+
+from app.services.career_guidance import CareerGuidanceService
+from app.services.skill_vocabulary import skill_vocabulary
+from benchmarks.profile_corpus import generate_profiles
+
+GENERATORS = [
+    "generate_career_recommendations",
+    "analyze_skill_gaps",
+    "generate_job_recommendations",
+    "generate_resume_guidance"
+]
+# Metrics the regression gate checks
+GATED = ("min_ns_per_call", "peak_bytes_per_call")
+
+
+def load_corpus(count: int, seed: int) -> List[Dict[str, Any]]:
+    profiles = generate_profiles(count, seed)
+    for profile in profiles:
+        profile["current_skills"] = skill_vocabulary.normalize_current_skills(profile["current_skills"])
+    return profiles
+
+
+def time_per_call(generate: Callable, profiles: List[Dict[str, Any]], passes: int) -> List[float]:
+    """ns/call of each pass over the corpus, with the garbage collector off as timeit does"""
+    results = []
+    gc.disable()
+    try:
+        for _ in range(passes):
+            start = time.perf_counter_ns()
+            for profile in profiles:
+                generate(profile)
+            results.append((time.perf_counter_ns() - start) / len(profiles))
+    finally:
+        gc.enable()
+    return results
+
+
+def allocations_per_call(generate: Callable, profiles: List[Dict[str, Any]]) -> Dict[str, float]:
+    peak_total = 0
+    retained_total = 0
+    results = []
+    tracemalloc.start()
+    try:
+        for profile in profiles:
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            results.append(generate(profile))  # Keep the result so it counts as retained
+            current, peak = tracemalloc.get_traced_memory()
+            peak_total += peak - before
+            retained_total += current - before
+    finally:
+        tracemalloc.stop()
+    return {
+        "peak_bytes_per_call": peak_total / len(profiles),
+        "retained_bytes_per_call": retained_total / len(profiles)
+    }
+
+
+def output_bytes(generate: Callable, profiles: List[Dict[str, Any]]) -> float:
+    adapter = TypeAdapter(Any)
+    total = sum(len(adapter.dump_json(generate(profile))) for profile in profiles)
+    return total / len(profiles)
+
+
+def run(profiles: List[Dict[str, Any]], passes: int) -> Dict[str, Dict[str, float]]:
+    service = CareerGuidanceService()
+    results = {}
+    for name in GENERATORS:
+        generate = getattr(service, name)
+        for profile in profiles:
+            generate(profile)  # Warm up indexes and memoized lookups
+        timings = time_per_call(generate, profiles, passes)
+        results[name] = {
+            "ns_per_call": round(statistics.median(timings)),
+            "min_ns_per_call": round(min(timings)),
+            **{key: round(value) for key, value in allocations_per_call(generate, profiles).items()},
+            "output_bytes": round(output_bytes(generate, profiles))
+        }
+    return results
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], threshold: float) -> List[str]:
+    """Print changes against the baseline and return the regressions over the threshold"""
+    regressions = []
+    print(f"Compared with baseline (threshold {threshold:.0f}%):")
+    for name, stats in results.items():
+        old = baseline.get(name)
+        if not old:
+            continue
+        changes = []
+        for key in GATED + ("output_bytes",):
+            if not old.get(key):
+                continue
+            change = (stats[key] - old[key]) / old[key] * 100
+            changes.append(f"{key} {change:+.1f}%")
+            if key in GATED and change > threshold:
+                regressions.append(f"{name} {key}: {old[key]:,} -> {stats[key]:,} ({change:+.1f}%)")
+        print(f"  {name:<34}" + ", ".join(changes))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.guidance_generators", description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--profiles", type=int, default=500, help="Corpus size")
+    parser.add_argument("--seed", type=int, default=0, help="Corpus seed")
+    parser.add_argument("--passes", type=int, default=7, help="Timed passes over the corpus")
+    parser.add_argument("--save", metavar="FILE", help="Write results as JSON")
+    parser.add_argument("--compare", metavar="FILE", help="Baseline written by --save")
+    parser.add_argument("--threshold", type=float, default=15.0, help="Allowed regression in percent")
+    args = parser.parse_args()
+
+    profiles = load_corpus(args.profiles, args.seed)
+    results = run(profiles, args.passes)
+
+    print(f"{args.profiles} profiles (seed {args.seed}), {args.passes} passes, Python {platform.python_version()}")
+    print(f"  {'generator':<34}{'ns/call':>10}{'min':>10}{'peak B/call':>13}{'retained B':>12}{'output B':>10}")
+    for name, stats in results.items():
+        print(f"  {name:<34}{stats['ns_per_call']:>10,}{stats['min_ns_per_call']:>10,}"
+              f"{stats['peak_bytes_per_call']:>13,}{stats['retained_bytes_per_call']:>12,}{stats['output_bytes']:>10,}")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({"profiles": args.profiles, "seed": args.seed, "generators": results}, f, indent=2)
+        print(f"Results saved to {args.save}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if (baseline["profiles"], baseline["seed"]) != (args.profiles, args.seed):
+            print("Warning: the baseline used a different corpus")
+        regressions = compare(results, baseline["generators"], args.threshold)
+        if regressions:
+            print("Regressions:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print("No regressions")
+
+if __name__ == "__main__":
+    main()
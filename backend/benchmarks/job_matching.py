@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Benchmark for scoring a profile against a large job pool
+
+Builds a synthetic pool of jobs over the catalog's skill vocabulary and times
+one bitset scoring pass plus top-k, against the same weighted score computed
+with Python string sets. Run from the backend directory:
+
+    python -m benchmarks.job_matching [jobs]
+"""
+
+import random
+import sys
+import time
+
+from app.services.guidance_catalog import get_catalog
+from app.services.job_matcher import JobEntry, JobMatcher, REQUIRED_WEIGHT, RECOMMENDED_WEIGHT
+from app.services.skill_vocabulary import SkillVocabulary
+
+PROFILE_SKILLS = ["Python", "SQL", "Git", "Docker", "Communication", "Problem Solving", "React", "Linux"]
+
+def build_jobs(vocabulary: SkillVocabulary, count: int, rng: random.Random):
+    names = [vocabulary.name(skill_id) for skill_id in range(len(vocabulary))]
+    entries, string_jobs = [], []
+    for i in range(count):
+        skills = rng.sample(names, 14)
+        required, recommended = skills[:7], skills[7:]
+        required_mask = vocabulary.mask(required)
+        recommended_mask = vocabulary.mask(recommended)
+        entries.append(JobEntry(
+            level="student", track=f"track_{i % 6}", position=i, job={"title": f"Job {i}"},
+            required_skills=tuple(required), required_mask=required_mask, recommended_mask=recommended_mask,
+            total_weight=REQUIRED_WEIGHT * len(required) + RECOMMENDED_WEIGHT * len(recommended)
+        ))
+        string_jobs.append((set(required), set(recommended)))
+    return entries, string_jobs
+
+def string_scores(profile_skills: set, string_jobs) -> list:
+    scores = []
+    for required, recommended in string_jobs:
+        total = REQUIRED_WEIGHT * len(required) + RECOMMENDED_WEIGHT * len(recommended)
+        weight = REQUIRED_WEIGHT * len(profile_skills & required) + RECOMMENDED_WEIGHT * len(profile_skills & recommended)
+        scores.append((200 * weight + total) // (2 * total))
+    return scores
+
+def best_of(func, runs: int = 5) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    vocabulary = SkillVocabulary.from_career_paths(get_catalog().career_paths)
+    entries, string_jobs = build_jobs(vocabulary, count, random.Random(42))
+    matcher = JobMatcher(vocabulary, entries)
+    mask = vocabulary.mask(PROFILE_SKILLS)
+
+    assert matcher.scores(mask) == string_scores(set(PROFILE_SKILLS), string_jobs)
+
+    print(f"{count:,} jobs over a {len(vocabulary)}-skill vocabulary")
+    print(f"string sets:    {best_of(lambda: string_scores(set(PROFILE_SKILLS), string_jobs)) * 1000:>8.1f} ms")
+    print(f"bitset scores:  {best_of(lambda: matcher.scores(mask)) * 1000:>8.1f} ms")
+    print(f"bitset top-10:  {best_of(lambda: matcher.top_k(PROFILE_SKILLS, 10)) * 1000:>8.1f} ms")
+
+if __name__ == "__main__":
+    main()
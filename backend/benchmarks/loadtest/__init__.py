@@ -0,0 +1 @@
+# Load test (python -m benchmarks.loadtest)
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+In-memory stand-in for Supabase's PostgREST API
+
+Implements the subset of PostgREST the backend uses: select with eq/in/not.in
+filters and order, insert, upsert (on_conflict), update and delete returning
+the affected rows, plus the get_dashboard and save_analysis functions from
+database/schema.sql. Tables are dicts indexed by id, user_id and email, so
+lookups stay constant-time as the load test adds users. --latency-ms adds a
+fixed delay per request to model the network round trip to a real database.
+
+    python -m benchmarks.loadtest.postgrest_stub [--port 54321] [--latency-ms 0]
+"""
+
+import argparse
+import asyncio
+import uuid
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+INDEXED_COLUMNS = ("id", "user_id", "email")
+UNIQUE_COLUMNS = {
+    "users": ("email",),
+    "career_recommendations": ("user_id",),
+    "skill_gap_analysis": ("user_id",),
+    "resume_guidance": ("user_id",)
+}
+# Query parameters that are not filters
+RESERVED_PARAMS = {"select", "order", "limit", "offset", "on_conflict", "columns"}
+
+
+def now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def error(status: int, code: str, message: str) -> JSONResponse:
+    return JSONResponse({"code": code, "message": message, "details": None, "hint": None}, status_code=status)
+
+
+def parse_list(value: str) -> List[str]:
+    """Items of a PostgREST list literal: (a,"b,c",d)"""
+    items, current, quoted = [], "", False
+    for char in value.strip("()"):
+        if char == '"':
+            quoted = not quoted
+        elif char == "," and not quoted:
+            items.append(current)
+            current = ""
+        else:
+            current += char
+    if current or items:
+        items.append(current)
+    return items
+
+
+class Table:
+    """Rows by id, with equality indexes on the columns the backend filters by"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.rows: Dict[str, Dict[str, Any]] = {}
+        self.indexes: Dict[str, Dict[str, set]] = {column: defaultdict(set) for column in INDEXED_COLUMNS}
+
+    def _index(self, row: Dict[str, Any]) -> None:
+        for column, index in self.indexes.items():
+            if row.get(column) is not None:
+                index[str(row[column])].add(row["id"])
+
+    def _unindex(self, row: Dict[str, Any]) -> None:
+        for column, index in self.indexes.items():
+            if row.get(column) is not None:
+                index[str(row[column])].discard(row["id"])
+
+    def find(self, column: str, value: Any) -> Optional[Dict[str, Any]]:
+        ids = self.indexes[column].get(str(value))
+        return self.rows[next(iter(ids))] if ids else None
+
+    def select(self, filters: List[Tuple[str, str, Any]]) -> List[Dict[str, Any]]:
+        # Narrow with an indexed equality filter first, then check the rest
+        candidates = None
+        for column, operator, value in filters:
+            if operator == "eq" and column in self.indexes:
+                candidates = [self.rows[row_id] for row_id in self.indexes[column].get(value, ())]
+                break
+            if operator == "in" and column in self.indexes:
+                candidates = [self.rows[row_id] for item in value for row_id in self.indexes[column].get(item, ())]
+                break
+        if candidates is None:
+            candidates = list(self.rows.values())
+        return [row for row in candidates if all(matches(row, f) for f in filters)]
+
+    def insert(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        for column in UNIQUE_COLUMNS.get(self.name, ()):
+            if record.get(column) is not None and self.find(column, record[column]):
+                raise KeyError(column)
+        timestamp = now()
+        row = {"id": str(uuid.uuid4()), "created_at": timestamp, "updated_at": timestamp, **record}
+        self.rows[row["id"]] = row
+        self._index(row)
+        return row
+
+    def update(self, row: Dict[str, Any], changes: Dict[str, Any]) -> Dict[str, Any]:
+        self._unindex(row)
+        row.update(changes)
+        row["updated_at"] = now()
+        self._index(row)
+        return row
+
+    def delete(self, row: Dict[str, Any]) -> None:
+        self._unindex(row)
+        del self.rows[row["id"]]
+
+    def upsert(self, record: Dict[str, Any], conflict_column: str) -> Dict[str, Any]:
+        existing = self.find(conflict_column, record[conflict_column]) if record.get(conflict_column) else None
+        return self.update(existing, record) if existing else self.insert(record)
+
+
+def matches(row: Dict[str, Any], condition: Tuple[str, str, Any]) -> bool:
+    column, operator, value = condition
+    actual = None if row.get(column) is None else str(row[column])
+    if operator == "eq":
+        return actual == value
+    if operator == "neq":
+        return actual != value
+    if operator == "in":
+        return actual in value
+    if operator == "not.in":
+        return actual not in value
+    if operator == "is":
+        return actual is None if value == "null" else actual is not None
+    raise ValueError(f"Unsupported filter operator: {operator}")
+
+
+def parse_filters(request: Request) -> List[Tuple[str, str, Any]]:
+    filters = []
+    for column, expression in request.query_params.multi_items():
+        if column in RESERVED_PARAMS:
+            continue
+        for operator in ("not.in", "in", "eq", "neq", "is"):
+            if expression.startswith(operator + "."):
+                value = expression[len(operator) + 1:]
+                filters.append((column, operator, set(parse_list(value)) if operator.endswith("in") else value))
+                break
+        else:
+            raise ValueError(f"Unsupported filter: {column}={expression}")
+    return filters
+
+
+def order_rows(rows: List[Dict[str, Any]], order: Optional[str]) -> List[Dict[str, Any]]:
+    for term in reversed((order or "").split(",")):
+        if term:
+            column, _, direction = term.partition(".")
+            rows.sort(key=lambda row: (row.get(column) is None, row.get(column)), reverse=direction.startswith("desc"))
+    return rows
+
+
+def project(rows: List[Dict[str, Any]], select: Optional[str]) -> List[Dict[str, Any]]:
+    if not select or select == "*":
+        return rows
+    columns = [column.strip() for column in select.split(",")]
+    return [{column: row.get(column) for column in columns} for row in rows]
+
+
+class PostgRESTStub:
+    """PostgREST over in-memory tables"""
+
+    def __init__(self, latency_ms: float = 0.0):
+        self.latency = latency_ms / 1000
+        self.tables: Dict[str, Table] = {}
+        self.requests = 0
+
+    def table(self, name: str) -> Table:
+        if name not in self.tables:
+            self.tables[name] = Table(name)
+        return self.tables[name]
+
+    async def handle_table(self, request: Request) -> Response:
+        await self._delay()
+        table = self.table(request.path_params["table"])
+        try:
+            filters = parse_filters(request)
+        except ValueError as e:
+            return error(400, "PGRST100", str(e))
+
+        if request.method == "GET":
+            rows = order_rows(table.select(filters), request.query_params.get("order"))
+            limit = request.query_params.get("limit")
+            if limit:
+                rows = rows[:int(limit)]
+            return JSONResponse(project(rows, request.query_params.get("select")))
+
+        if request.method == "DELETE":
+            rows = table.select(filters)
+            for row in rows:
+                table.delete(row)
+            return JSONResponse(rows)
+
+        body = await request.json()
+        if request.method == "PATCH":
+            return JSONResponse([table.update(row, body) for row in table.select(filters)])
+
+        records = body if isinstance(body, list) else [body]
+        prefer = request.headers.get("prefer", "")
+        try:
+            if "resolution=merge-duplicates" in prefer:
+                conflict_column = request.query_params.get("on_conflict", "id")
+                rows = [table.upsert(record, conflict_column) for record in records]
+            else:
+                rows = [table.insert(record) for record in records]
+        except KeyError as e:
+            return error(409, "23505", f"duplicate key value violates unique constraint on {e.args[0]}")
+        return JSONResponse(rows, status_code=201)
+
+    async def handle_rpc(self, request: Request) -> Response:
+        await self._delay()
+        function = request.path_params["function"]
+        args = await request.json()
+        if function == "get_dashboard":
+            return JSONResponse(self.get_dashboard(args["p_user_id"]))
+        if function == "save_analysis":
+            self.save_analysis(args)
+            return Response(status_code=204)
+        if function == "save_analyses":
+            for analysis in args["p_analyses"]:
+                self.save_analysis(analysis)
+            return Response(status_code=204)
+        return error(404, "PGRST202", f"Could not find the function public.{function}")
+
+    def get_dashboard(self, user_id: str) -> Dict[str, Any]:
+        def one(name: str) -> Optional[Dict[str, Any]]:
+            rows = self.table(name).select([("user_id", "eq", user_id)])
+            return rows[0] if rows else None
+
+        jobs = self.table("job_recommendations").select([("user_id", "eq", user_id)])
+        return {
+            "user_profile": one("user_profiles"),
+            "career_recommendations": one("career_recommendations"),
+            "skill_gap_analysis": one("skill_gap_analysis"),
+            "job_recommendations": order_rows(jobs, "match_score.desc"),
+            "resume_guidance": one("resume_guidance")
+        }
+
+    def save_analysis(self, args: Dict[str, Any]) -> None:
+        user_id, profile_id = args["p_user_id"], args["p_profile_id"]
+        for name, key in (("career_recommendations", "p_career"), ("skill_gap_analysis", "p_skills"), ("resume_guidance", "p_resume")):
+            self.table(name).upsert({**args[key], "user_id": user_id, "profile_id": profile_id}, "user_id")
+        jobs = self.table("job_recommendations")
+        for row in jobs.select([("user_id", "eq", user_id)]):
+            jobs.delete(row)
+        for job in args["p_jobs"] or []:
+            jobs.insert({**job, "user_id": user_id, "profile_id": profile_id})
+
+    async def _delay(self) -> None:
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+    def app(self) -> Starlette:
+        return Starlette(routes=[
+            Route("/rest/v1/rpc/{function}", self.handle_rpc, methods=["POST"]),
+            Route("/rest/v1/{table}", self.handle_table, methods=["GET", "POST", "PATCH", "DELETE"])
+        ])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="In-memory PostgREST stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=54321)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Delay added to every request")
+    args = parser.parse_args()
+
+    import uvicorn
+    uvicorn.run(PostgRESTStub(args.latency_ms).app(), host=args.host, port=args.port, log_level="warning")
+
+if __name__ == "__main__":
+    main()
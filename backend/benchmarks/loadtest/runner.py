@@ -0,0 +1,177 @@
+"""
+Closed-loop load generation and statistics
+
+`concurrency` loops each send one request at a time, picking an operation by
+weight and a virtual user at random, for a warm-up period (not recorded) and
+then the measured duration. Latencies are kept per operation; RSS of the
+server processes is sampled while the load runs.
+
+A dashboard served by regenerating the analysis because the stored copy could
+not be used answers 200, but is counted as an error and a fallback: the
+storage backend under test is then not the one doing the work.
+"""
+
+import asyncio
+import math
+import os
+import random
+import time
+from bisect import bisect_right
+from collections import Counter, defaultdict
+from typing import Callable, Dict, List, Optional
+
+import httpx
+
+from benchmarks.loadtest.scenarios import ANALYSIS_SOURCE_HEADER, MIXES, OPERATIONS, VirtualUser
+
+
+def rss_kb(pid: int) -> int:
+    """Resident set size of a process (Linux); 0 if it cannot be read"""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+def process_tree(pid: int) -> List[int]:
+    """A process and its children, e.g. the server supervisor and its workers"""
+    try:
+        with open(f"/proc/{pid}/task/{pid}/children") as f:
+            return [pid] + [int(child) for child in f.read().split()]
+    except OSError:
+        return [pid]
+
+
+def percentile(ordered: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not ordered:
+        return 0.0
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def summarize(latencies: List[float], errors: int, seconds: float, fallbacks: int = 0) -> Dict[str, float]:
+    ordered = sorted(latencies)
+    return {
+        "requests": len(ordered),
+        "errors": errors,
+        "fallbacks": fallbacks,
+        "throughput_rps": round(len(ordered) / seconds, 1) if seconds else 0.0,
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 3) if ordered else 0.0,
+        "p50_ms": round(percentile(ordered, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(ordered, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(ordered, 0.99) * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3) if ordered else 0.0
+    }
+
+
+class MemorySampler:
+    """Samples the total RSS of a set of processes in the background"""
+
+    def __init__(self, pids: Callable[[], List[int]], interval: float = 0.25):
+        self.pids = pids
+        self.interval = interval
+        self.samples: List[int] = []
+        self._task: Optional[asyncio.Task] = None
+
+    def sample(self) -> int:
+        total = sum(rss_kb(pid) for pid in self.pids())
+        self.samples.append(total)
+        return total
+
+    async def _run(self) -> None:
+        while True:
+            self.sample()
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> Dict[str, float]:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self.sample()
+        return {
+            "start": round(self.samples[0] / 1024, 1),
+            "end": round(self.samples[-1] / 1024, 1),
+            "peak": round(max(self.samples) / 1024, 1)
+        }
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    users: List[VirtualUser],
+    mix: str,
+    concurrency: int,
+    duration: float,
+    warmup: float,
+    server_pid: Optional[int] = None,
+    seed: int = 0
+) -> Dict:
+    """Drive the mix and return summary, per-operation stats and RSS"""
+    weights = MIXES[mix]
+    names = list(weights)
+    cumulative = []
+    total = 0
+    for name in names:
+        total += weights[name]
+        cumulative.append(total)
+
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    statuses: Dict[str, Counter] = defaultdict(Counter)
+    errors: Counter = Counter()
+    fallbacks: Counter = Counter()
+    started = time.perf_counter()
+    measure_from = started + warmup
+    stop_at = measure_from + duration
+
+    async def loop(rng: random.Random) -> None:
+        while True:
+            now = time.perf_counter()
+            if now >= stop_at:
+                return
+            name = names[bisect_right(cumulative, rng.random() * total)]
+            user = rng.choice(users)
+            fallback = False
+            try:
+                response = await OPERATIONS[name](client, user)
+                status = response.status_code
+                fallback = response.headers.get(ANALYSIS_SOURCE_HEADER) == "regenerated"
+            except httpx.HTTPError:
+                status = 0  # Connection failure or timeout
+            finished = time.perf_counter()
+            if fallback:
+                # Counted during warm-up too: that is when most users first load their
+                # dashboard, and later loads are answered 304 from the ETag
+                fallbacks[name] += 1
+            if now < measure_from:
+                continue
+            latencies[name].append(finished - now)
+            statuses[name][status] += 1
+            if status == 0 or status >= 400 or fallback:
+                errors[name] += 1
+
+    # In-process, the app shares this process (the PostgREST stand-in is a child, so not the whole tree)
+    sampler = MemorySampler(lambda: process_tree(server_pid) if server_pid else [os.getpid()])
+    sampler.start()
+    await asyncio.gather(*(loop(random.Random(seed * 1000 + i)) for i in range(concurrency)))
+    rss = await sampler.stop()
+
+    operations = {}
+    for name in names:
+        stats = summarize(latencies[name], errors[name], duration, fallbacks[name])
+        stats["status"] = {str(code): count for code, count in sorted(statuses[name].items())}
+        operations[name] = stats
+    everything = [latency for values in latencies.values() for latency in values]
+    return {
+        "summary": summarize(everything, sum(errors.values()), duration, sum(fallbacks.values())),
+        "operations": operations,
+        "rss_mb": rss
+    }
@@ -0,0 +1,100 @@
+"""
+Request mixes for the load test
+
+Each virtual user has an identity (sent as X-Loadtest-User, see target.py), a
+registered account with a bearer token, and remembers the dashboard ETag it
+last saw, as the frontend does. Operations are picked at random by weight.
+"""
+
+import random
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, Optional
+
+import httpx
+
+from benchmarks.profile_corpus import generate_profile
+
+USER_HEADER = "X-Loadtest-User"
+# Password of every seeded account
+LOGIN_PASSWORD = "loadtest-password"
+# Set by the dashboard: "stored", "generated", "pending" while the stored analysis
+# is behind the profile, or "regenerated" when the stored analysis was unusable
+ANALYSIS_SOURCE_HEADER = "X-Analysis-Source"
+
+CHAT_MESSAGES = [
+    "Which skills should I learn next?", "How do I find a job in data science?",
+    "Can you review my resume?", "help", "What does a DevOps engineer do day to day?"
+]
+
+
+@dataclass
+class VirtualUser:
+    """State one simulated user carries between requests"""
+
+    user_id: str
+    email: str
+    token: str
+    rng: random.Random
+    dashboard_etag: Optional[str] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    def __post_init__(self):
+        self.headers = {USER_HEADER: self.user_id}
+
+
+async def submit_profile(client: httpx.AsyncClient, user: VirtualUser) -> httpx.Response:
+    return await client.post("/api/profile/submit", json=generate_profile(user.rng), headers=user.headers)
+
+
+async def get_profile(client: httpx.AsyncClient, user: VirtualUser) -> httpx.Response:
+    return await client.get("/api/profile/", headers=user.headers)
+
+
+async def get_dashboard(client: httpx.AsyncClient, user: VirtualUser) -> httpx.Response:
+    headers = dict(user.headers)
+    if user.dashboard_etag:
+        headers["If-None-Match"] = user.dashboard_etag
+    response = await client.get("/api/dashboard/", headers=headers)
+    user.dashboard_etag = response.headers.get("etag", user.dashboard_etag)
+    return response
+
+
+async def chat(client: httpx.AsyncClient, user: VirtualUser) -> httpx.Response:
+    return await client.post("/api/chat/", json={"message": user.rng.choice(CHAT_MESSAGES)}, headers=user.headers)
+
+
+async def auth_register(client: httpx.AsyncClient, user: VirtualUser) -> httpx.Response:
+    # Always a new account: registering an existing email is a 400
+    email = f"new-{user.rng.getrandbits(64):x}@loadtest.example.com"
+    return await client.post("/api/auth/register", json={"email": email, "name": "Load Test", "password": LOGIN_PASSWORD})
+
+
+async def auth_login(client: httpx.AsyncClient, user: VirtualUser) -> httpx.Response:
+    return await client.post("/api/auth/login", json={"email": user.email, "password": LOGIN_PASSWORD})
+
+
+async def auth_me(client: httpx.AsyncClient, user: VirtualUser) -> httpx.Response:
+    return await client.get("/api/auth/me", headers={"Authorization": f"Bearer {user.token}"})
+
+
+Operation = Callable[[httpx.AsyncClient, VirtualUser], Awaitable[httpx.Response]]
+
+OPERATIONS: Dict[str, Operation] = {
+    "dashboard": get_dashboard,
+    "profile_get": get_profile,
+    "profile_submit": submit_profile,
+    "chat": chat,
+    "auth_register": auth_register,
+    "auth_login": auth_login,
+    "auth_me": auth_me
+}
+
+# Relative weights per operation
+MIXES: Dict[str, Dict[str, int]] = {
+    # A student session: mostly dashboard views, some edits and chat, logins
+    "default": {"dashboard": 45, "profile_get": 10, "profile_submit": 12, "chat": 15, "auth_login": 8, "auth_me": 8, "auth_register": 2},
+    "read-heavy": {"dashboard": 70, "profile_get": 15, "chat": 10, "auth_me": 5},
+    "write-heavy": {"profile_submit": 50, "dashboard": 30, "chat": 15, "auth_register": 5},
+    # Registration and login hash a password (bcrypt), so they dominate where they appear
+    "auth": {"auth_login": 45, "auth_me": 45, "auth_register": 10}
+}
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+The app as the load test drives it
+
+Profile, dashboard and chat routes currently take every request as the same
+placeholder user (app.core.auth.get_current_user_id). The load test overrides
+that dependency so each virtual user, named in the X-Loadtest-User header,
+gets its own profile and dashboard; nothing else about the app changes.
+
+Run as a module, it serves that app on the production server (app.server):
+
+    python -m benchmarks.loadtest.target --port 8000 [--workers N]
+"""
+
+import argparse
+
+from fastapi import Request
+
+from benchmarks.loadtest.scenarios import USER_HEADER
+
+
+def loadtest_user_id(request: Request) -> str:
+    return request.headers.get(USER_HEADER, "demo_user_1")
+
+
+def load_app():
+    """Import the app (configure the environment first) with per-user identities"""
+    from app.core.auth import get_current_user_id
+    from app.main import app
+
+    app.dependency_overrides[get_current_user_id] = loadtest_user_id
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the app for the load test")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    from app.server import serve
+    load_app()  # The server preloads the same app object, override included
+    serve(host=args.host, port=args.port, workers=args.workers)
+
+if __name__ == "__main__":
+    main()
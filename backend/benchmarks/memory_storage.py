@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Benchmark for MemoryStorage write throughput and log recovery time
+
+Writes N entries (chat messages plus one profile per user), with and without
+the append-only log, then times rebuilding state from the log. Run from the
+backend directory:
+
+    python -m benchmarks.memory_storage [entries]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from app.utils.memory_storage import MemoryStorage
+
+USERS = 10000
+
+def write_entries(storage: MemoryStorage, entries: int) -> float:
+    """Write entries and return the elapsed seconds"""
+    start = time.perf_counter()
+    for i in range(entries):
+        user_id = f"user_{i % USERS}"
+        if i < USERS:
+            storage.save_user_profile(user_id, {
+                "education": {"degree": "B.Tech"},
+                "current_skills": {"technical": ["Python", "SQL"]},
+                "career_goals": "software developer",
+                "experience_level": "student"
+            })
+        else:
+            storage.save_chat_message(user_id, f"message {i}", "Thank you for sharing.")
+    return time.perf_counter() - start
+
+def main():
+    entries = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    memory_only = MemoryStorage(max_profiles=USERS)
+    elapsed = write_entries(memory_only, entries)
+    print(f"memory only:   {entries / elapsed:>12,.0f} writes/sec")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "storage.log")
+        persistent = MemoryStorage(max_profiles=USERS, persist_path=path)
+        elapsed = write_entries(persistent, entries)
+        persistent.close()
+        print(f"with log:      {entries / elapsed:>12,.0f} writes/sec ({os.path.getsize(path) / 1e6:.0f} MB log)")
+
+        start = time.perf_counter()
+        recovered = MemoryStorage(max_profiles=USERS, persist_path=path)
+        elapsed = time.perf_counter() - start
+        print(f"recovery:      {elapsed:>12.2f} s for {entries:,} entries (includes compaction)")
+        recovered.close()
+
+        start = time.perf_counter()
+        compacted = MemoryStorage(max_profiles=USERS, persist_path=path)
+        elapsed = time.perf_counter() - start
+        print(f"after compact: {elapsed:>12.2f} s ({os.path.getsize(path) / 1e6:.0f} MB log)")
+        compacted.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the cost of request and stage metrics
+
+Times `with metrics.stage(...)` and Metrics.observe_request on their own, then
+drives a trivial ASGI app with and without MetricsMiddleware in front of it, so
+the difference is the middleware's cost per request. For scale, it also times
+a full GET /health and GET /api/catalog/ through the real app. Run from the
+backend directory:
+
+    python -m benchmarks.metrics_overhead [iterations]
+"""
+
+import asyncio
+import sys
+import time
+
+from app.core.metrics import Metrics, MetricsMiddleware
+
+class Route:
+    path = "/bench"
+
+async def trivial_app(scope, receive, send):
+    scope["route"] = Route
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+async def drive(app, iterations: int, path: str = "/bench") -> float:
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        scope = {
+            "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+            "scheme": "http", "path": path, "raw_path": path.encode(), "query_string": b"",
+            "root_path": "", "headers": [(b"host", b"localhost")], "client": ("127.0.0.1", 1),
+            "server": ("127.0.0.1", 80)
+        }
+        await app(scope, receive, send)
+    return (time.perf_counter() - start) / iterations
+
+def per_call(function, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        function()
+    return (time.perf_counter() - start) / iterations
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    registry = Metrics()
+
+    def timed_stage():
+        with registry.stage("bench"):
+            pass
+
+    stage = per_call(timed_stage, iterations)
+    observe = per_call(lambda: registry.observe_request("GET", "/bench", 200, 0.001), iterations)
+    print(f"{iterations:,} iterations")
+    print(f"  metrics.stage():             {stage * 1e9:8.0f} ns")
+    print(f"  observe_request():           {observe * 1e9:8.0f} ns")
+
+    bare = asyncio.run(drive(trivial_app, iterations))
+    wrapped = asyncio.run(drive(MetricsMiddleware(trivial_app, registry), iterations))
+    print(f"  trivial app:                 {bare * 1e9:8.0f} ns/request")
+    print(f"  trivial app + middleware:    {wrapped * 1e9:8.0f} ns/request  (+{(wrapped - bare) * 1e9:.0f} ns)")
+
+    start = time.perf_counter()
+    registry.render()
+    print(f"  render():                    {(time.perf_counter() - start) * 1e6:8.0f} us")
+
+    from app.main import app
+    requests = max(1, iterations // 20)
+    for path in ("/health", "/api/catalog/"):
+        asyncio.run(drive(app, 100, path))
+        full = asyncio.run(drive(app, requests, path))
+        print(f"  full GET {path + ':':<19} {full * 1e9:8.0f} ns/request")
+
+if __name__ == "__main__":
+    main()
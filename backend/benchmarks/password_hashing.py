@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark for /health latency during a registration burst
+
+Runs the app in-process and polls /health while a burst of registrations
+hashes passwords on the same event loop: once with bcrypt called inline (the
+old register code) and once through the password pool. Registration needs
+Supabase, so the burst exercises only its hashing step. Run from the backend
+directory:
+
+    python -m benchmarks.password_hashing [registrations] [bcrypt_rounds]
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+
+import bcrypt
+import httpx
+
+from app.core.config import settings
+
+INTERVAL = 0.005
+
+async def inline_hash(password: str) -> str:
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(settings.bcrypt_rounds)).decode('utf-8')
+
+async def measure(client: httpx.AsyncClient, burst=None, registrations: int = 0) -> list:
+    """Poll /health every 5 ms until the burst finishes (or for one second) and return latencies.
+
+    Latency is measured from when each request was due, so time the event loop
+    spends blocked counts against the requests that could not be sent.
+    """
+    latencies = []
+    burst_task = None
+    if burst is not None:
+        burst_task = asyncio.ensure_future(asyncio.gather(*(burst(f"password-{i}") for i in range(registrations))))
+    start = time.perf_counter()
+    due = start
+    while (burst_task and not burst_task.done()) or (not burst_task and due < start + 1.0):
+        await asyncio.sleep(max(0.0, due - time.perf_counter()))
+        response = await client.get("/health")
+        assert response.status_code == 200
+        now = time.perf_counter()
+        # Requests that fell due while the loop was blocked all complete now
+        while due <= now:
+            latencies.append(now - due)
+            due += INTERVAL
+    if burst_task:
+        await burst_task
+    return latencies
+
+def report(label: str, latencies: list):
+    latencies = sorted(latencies)
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(f"{label:<16} p50 {statistics.median(latencies) * 1000:>8.1f} ms   p99 {p99 * 1000:>8.1f} ms   max {latencies[-1] * 1000:>8.1f} ms")
+
+async def main():
+    registrations = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    if len(sys.argv) > 2:
+        settings.bcrypt_rounds = int(sys.argv[2])
+
+    from app.core.passwords import hash_password
+    from app.main import app
+
+    print(f"{registrations} registrations at bcrypt cost {settings.bcrypt_rounds}, {settings.password_hash_workers} hash workers")
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        report("idle", await measure(client))
+        report("inline bcrypt", await measure(client, inline_hash, registrations))
+        report("password pool", await measure(client, hash_password, registrations))
+
+if __name__ == "__main__":
+    asyncio.run(main())
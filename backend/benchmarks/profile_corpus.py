@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Synthetic profile corpus for benchmarks
+
+Profiles look like what the profile form submits. Each one aims at a career
+track, and its goal text, skills and education follow from that track:
+
+- experience_level: mostly students and freshers, as on the platform, plus a
+  few legacy values ("entry_level", "mid_level") the generators also see
+- career_goals: a role phrase alone, a sentence or two, or a long paragraph;
+  some name no recognizable role at all
+- current_skills: more technical skills with experience, drawn mostly from the
+  track's catalog skills and partly from other tracks; some typed as aliases
+  or in odd case ("reactjs", " python "), as users type them
+- education: degree, field, institution, graduation year relative to the level
+
+Generation is deterministic for a given seed. As a script it writes JSONL,
+with user IDs, ready for `python run.py import`:
+
+    python -m benchmarks.profile_corpus [count] [seed] > profiles.jsonl
+"""
+
+import json
+import random
+import sys
+import uuid
+from typing import Any, Dict, List
+
+from app.services.guidance_catalog import get_catalog
+from app.services.skill_vocabulary import SKILL_ALIASES
+
+LEVELS = ["student", "fresher", "professional", "entry_level", "mid_level"]
+LEVEL_WEIGHTS = [45, 30, 20, 3, 2]
+# Technical skill count range per level
+SKILL_COUNTS = {"student": (1, 6), "fresher": (3, 9), "professional": (6, 15), "entry_level": (3, 9), "mid_level": (6, 15)}
+YEARS_SINCE_GRADUATION = {"student": (-3, 0), "fresher": (0, 2), "professional": (2, 12), "entry_level": (0, 2), "mid_level": (3, 8)}
+
+TRACK_WEIGHTS = {
+    "software_engineer": 30, "full_stack_developer": 22, "data_scientist": 15,
+    "data_analyst": 13, "devops_engineer": 10, "cybersecurity_analyst": 10
+}
+ROLE_PHRASES = {
+    "software_engineer": ["Software engineer", "software developer", "backend engineer", "SDE at a product company"],
+    "full_stack_developer": ["Full stack developer", "MERN stack developer", "full-stack web developer"],
+    "data_scientist": ["Data scientist", "machine learning engineer", "AI/ML engineer working on machine learning"],
+    "data_analyst": ["Data analyst", "business analyst working with data", "BI analyst"],
+    "devops_engineer": ["DevOps engineer", "SRE", "cloud DevOps engineer"],
+    "cybersecurity_analyst": ["Cybersecurity analyst", "security engineer", "penetration tester in cybersecurity"]
+}
+# Goals that name no role the classifier knows
+VAGUE_GOALS = [
+    "Not sure yet, I want to explore my options.",
+    "I want a stable job with good growth.",
+    "Something creative where I can keep learning."
+]
+SENTENCES = [
+    "I enjoy solving problems and building things end to end.",
+    "I have done a couple of internships and personal projects.",
+    "My long term goal is to lead a small team and mentor juniors.",
+    "I would like to work remotely for a global company.",
+    "I am preparing for interviews and want to know which skills matter most.",
+    "I switched from mechanical engineering and have been learning programming for a year.",
+    "I want to earn a certification this year.",
+    "Working at a startup in Bangalore or Hyderabad would be ideal."
+]
+SOFT_SKILLS = ["Communication", "Teamwork", "Problem Solving", "Leadership", "Time Management", "Critical Thinking", "Adaptability"]
+CERTIFICATIONS = [
+    "AWS Certified Cloud Practitioner", "Google Data Analytics Certificate", "Microsoft Azure Fundamentals",
+    "CompTIA Security+", "Meta Front-End Developer Certificate", "TensorFlow Developer Certificate"
+]
+DEGREES = ["B.Tech", "B.E.", "B.Sc", "BCA", "MCA", "M.Tech", "M.Sc", "MBA", "Diploma"]
+FIELDS = {
+    "software_engineer": ["Computer Science", "Information Technology", "Electronics"],
+    "full_stack_developer": ["Computer Science", "Information Technology"],
+    "data_scientist": ["Computer Science", "Statistics", "Mathematics", "Data Science"],
+    "data_analyst": ["Statistics", "Economics", "Commerce", "Mathematics"],
+    "devops_engineer": ["Computer Science", "Information Technology", "Electronics"],
+    "cybersecurity_analyst": ["Computer Science", "Cyber Security", "Information Technology"]
+}
+INSTITUTIONS = ["IIT Madras", "NIT Trichy", "VIT Vellore", "Anna University", "Delhi University", "Pune University", ""]
+
+# Skills of each track, across every level of the catalog
+_track_skills: Dict[str, List[str]] = {}
+
+
+def track_skills(track: str) -> List[str]:
+    if not _track_skills:
+        for tracks in get_catalog().career_paths.values():
+            for name, data in tracks.items():
+                name = name.replace("senior_", "")
+                pool = _track_skills.setdefault(name, [])
+                for skill in list(data["required_skills"]) + list(data["recommended_skills"]):
+                    if skill not in pool:
+                        pool.append(skill)
+    return _track_skills.get(track) or _track_skills["software_engineer"]
+
+
+# Canonical skill -> aliases users type for it
+_aliases: Dict[str, List[str]] = {}
+for _alias, _canonical in SKILL_ALIASES.items():
+    _aliases.setdefault(_canonical, []).append(_alias)
+
+
+def as_typed(skill: str, rng: random.Random) -> str:
+    """The skill as a user might type it"""
+    roll = rng.random()
+    if roll < 0.15 and skill in _aliases:
+        return rng.choice(_aliases[skill])
+    if roll < 0.25:
+        return skill.lower()
+    if roll < 0.30:
+        return f" {skill} "
+    return skill
+
+
+def career_goals(track: str, rng: random.Random) -> str:
+    roll = rng.random()
+    if roll < 0.08:
+        return rng.choice(VAGUE_GOALS)
+    role = rng.choice(ROLE_PHRASES[track])
+    if roll < 0.35:
+        return role
+    if roll < 0.80:
+        return f"I want to become a {role}. " + " ".join(rng.sample(SENTENCES, rng.randint(1, 2)))
+    return " ".join(rng.sample(SENTENCES, 3)) + f" Eventually I see myself as a {role}. " + " ".join(rng.sample(SENTENCES, 2))
+
+
+def generate_profile(rng: random.Random) -> Dict[str, Any]:
+    """One profile in the shape UserProfileCreate accepts"""
+    level = rng.choices(LEVELS, LEVEL_WEIGHTS)[0]
+    track = rng.choices(list(TRACK_WEIGHTS), list(TRACK_WEIGHTS.values()))[0]
+
+    own = track_skills(track)
+    other = track_skills(rng.choice(list(TRACK_WEIGHTS)))
+    low, high = SKILL_COUNTS[level]
+    count = rng.randint(low, high)
+    # Mostly the track's skills, the rest from another track
+    chosen = rng.sample(own, min(len(own), count - count // 4)) + rng.sample(other, min(len(other), count // 4))
+    technical = list(dict.fromkeys(as_typed(skill, rng) for skill in chosen))
+
+    first, last = YEARS_SINCE_GRADUATION[level]
+    education = {
+        "degree": rng.choice(DEGREES),
+        "field": rng.choice(FIELDS[track]),
+        "institution": rng.choice(INSTITUTIONS),
+        "graduation_year": str(2026 - rng.randint(first, last))
+    }
+    if rng.random() < 0.5:
+        education["gpa"] = f"{rng.uniform(6.0, 9.8):.1f}/10"
+
+    return {
+        "education": education,
+        "current_skills": {
+            "technical": technical,
+            "soft": rng.sample(SOFT_SKILLS, rng.choices([0, 1, 2, 3, 4], [10, 20, 35, 25, 10])[0]),
+            "certifications": rng.sample(CERTIFICATIONS, rng.choices([0, 1, 2], [70, 22, 8])[0])
+        },
+        "career_goals": career_goals(track, rng),
+        "experience_level": level
+    }
+
+
+def generate_profiles(count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    return [generate_profile(rng) for _ in range(count)]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+    ids = random.Random(seed)
+    for profile in generate_profiles(count, seed):
+        user_id = str(uuid.UUID(int=ids.getrandbits(128), version=4))
+        sys.stdout.write(json.dumps({"user_id": user_id, **profile}) + "\n")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the cost of per-request profiling
+
+Times GET /api/dashboard/ in-process through the app as it runs with profiling
+off (no middleware), with ProfilingMiddleware installed but the request not
+selected, and with the request profiled (cProfile plus writing the .folded and
+.prof files). Run from the backend directory:
+
+    python -m benchmarks.request_profiling [requests]
+"""
+
+import asyncio
+import sys
+import tempfile
+
+from app.core.profiling import ProfilingMiddleware, RequestProfiler
+from benchmarks.metrics_overhead import drive
+
+TOKEN = "benchmark-profiling-token"
+
+def with_header(app, header: bytes, value: bytes):
+    """The app, with a header added to every request"""
+    async def wrapped(scope, receive, send):
+        scope["headers"] = [*scope["headers"], (header, value)]
+        await app(scope, receive, send)
+    return wrapped
+
+def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    from app.main import app
+    from fastapi.testclient import TestClient
+
+    with TestClient(app) as client:
+        client.post("/api/profile/submit", json={
+            "education": {"degree": "B.Tech", "field": "Computer Science"},
+            "current_skills": {"technical": ["Python", "SQL", "React"], "soft": ["Communication"]},
+            "career_goals": "Full stack developer",
+            "experience_level": "student"
+        })
+
+    with tempfile.TemporaryDirectory() as directory:
+        profiled = ProfilingMiddleware(app, RequestProfiler(TOKEN, 0, directory, keep=10))
+        runs = [
+            ("profiling off (no middleware)", app, requests),
+            ("middleware, not selected", profiled, requests),
+            ("profiled", with_header(profiled, b"x-profile-token", TOKEN.encode()), max(1, requests // 10))
+        ]
+        print(f"GET /api/dashboard/, {requests:,} requests")
+        for label, target, count in runs:
+            asyncio.run(drive(target, 50, "/api/dashboard/"))
+            seconds = asyncio.run(drive(target, count, "/api/dashboard/"))
+            print(f"  {label:<32} {seconds * 1e6:8.0f} us/request")
+
+if __name__ == "__main__":
+    main()
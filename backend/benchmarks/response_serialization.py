@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Benchmark for per-request CPU time of the dashboard response
+
+Serves a realistic dashboard payload from two routes: the previous path
+(DashboardData.dict() wrapped in APIResponse, re-validated and encoded through
+response_model) and json_response (one model_dump_json pass). Run from the
+backend directory:
+
+    python -m benchmarks.response_serialization [requests]
+"""
+
+import asyncio
+import sys
+import time
+import warnings
+
+import httpx
+from fastapi import FastAPI
+
+from app.models.schemas import APIResponse
+from app.services.career_guidance import career_guidance_service
+from app.utils.responses import json_response
+from benchmarks.dashboard_payload import PROFILES, build_dashboard
+
+async def cpu_per_request(app: FastAPI, path: str, requests: int) -> float:
+    """CPU time per request, driving the ASGI app directly to keep client overhead out"""
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "query_string": b"",
+        "root_path": "", "headers": [], "client": ("127.0.0.1", 1234), "server": ("test", 80)
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    await app(scope, receive, send)
+    start = time.process_time()
+    for _ in range(requests):
+        await app(scope, receive, send)
+    return (time.process_time() - start) / requests
+
+async def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    warnings.simplefilter("ignore")
+
+    dashboard_data = build_dashboard(career_guidance_service, PROFILES["student"])
+    app = FastAPI()
+
+    @app.get("/validated", response_model=APIResponse)
+    async def validated():
+        return APIResponse(success=True, data=dashboard_data.dict())
+
+    @app.get("/serialized-once", response_model=APIResponse)
+    async def serialized_once():
+        return json_response(APIResponse(success=True, data=dashboard_data))
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        baseline = await client.get("/validated")
+        fast = await client.get("/serialized-once")
+        assert baseline.json() == fast.json()
+        print(f"payload: {len(fast.content):,} bytes")
+        for label, path in (("dict + response_model", "/validated"), ("json_response", "/serialized-once")):
+            elapsed = min([await cpu_per_request(app, path, requests) for _ in range(3)])
+            print(f"{label:<22} {elapsed * 1e6:>8.0f} us CPU/request")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the production server as the worker count grows
+
+Starts app.server with 1, 2, 4... workers, drives it with keep-alive HTTP/1.1
+connections for a few seconds per route, and reports requests/sec. It also
+reports the workers' total RSS against their PSS (proportional set size): the
+gap is memory the workers share copy-on-write with the parent, such as the
+preloaded guidance catalog. Uses SQLite storage, as in-memory storage runs on
+one worker only. Linux only. Run from the backend directory:
+
+    python -m benchmarks.server_workers [max_workers] [seconds]
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+PORT = 8799
+CONNECTIONS = 64
+ROUTES = ["/health", "/api/catalog/"]
+
+async def drive(path: str, seconds: float) -> int:
+    request = f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode()
+    deadline = time.perf_counter() + seconds
+    completed = 0
+
+    async def connection():
+        nonlocal completed
+        reader, writer = await asyncio.open_connection("127.0.0.1", PORT)
+        while time.perf_counter() < deadline:
+            writer.write(request)
+            headers = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in headers.split(b"\r\n"):
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":")[1])
+            await reader.readexactly(length)
+            completed += 1
+        writer.close()
+
+    await asyncio.gather(*(connection() for _ in range(CONNECTIONS)))
+    return completed
+
+def memory_kb(pid: int):
+    fields = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if parts[0] in ("Rss:", "Pss:"):
+                fields[parts[0]] = int(parts[1])
+    return fields["Rss:"], fields["Pss:"]
+
+def worker_pids(parent: int):
+    with open(f"/proc/{parent}/task/{parent}/children") as f:
+        return [int(pid) for pid in f.read().split()]
+
+def run(workers: int, seconds: float):
+    database = os.path.join(tempfile.mkdtemp(prefix="server-workers-"), "benchmark.db")
+    env = dict(os.environ, PRODUCTION="true", STORAGE_BACKEND="sqlite", SQLITE_PATH=database)
+    server = subprocess.Popen(
+        [sys.executable, "-c", f"from app.server import serve; serve(host='127.0.0.1', port={PORT}, workers={workers})"],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        for _ in range(100):
+            try:
+                urllib.request.urlopen(f"http://127.0.0.1:{PORT}/health")
+                break
+            except OSError:
+                time.sleep(0.1)
+        time.sleep(0.5)  # Let every worker finish starting up
+        rates = [asyncio.run(drive(path, seconds)) / seconds for path in ROUTES]
+        pids = worker_pids(server.pid)
+        rss, pss = map(sum, zip(*(memory_kb(pid) for pid in pids)))
+        return rates, rss, pss
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+def main():
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 3.0
+    print(f"{os.cpu_count()} CPUs, {CONNECTIONS} connections, {seconds:.0f}s per route (client shares the machine)")
+    print(f"{'workers':>7}  " + "  ".join(f"{path + ' req/s':>20}" for path in ROUTES) + f"  {'worker RSS':>11}  {'worker PSS':>11}")
+    workers = 1
+    while workers <= max_workers:
+        rates, rss, pss = run(workers, seconds)
+        print(f"{workers:>7}  " + "  ".join(f"{rate:>20,.0f}" for rate in rates) + f"  {rss / 1024:>8.1f} MB  {pss / 1024:>8.1f} MB")
+        workers *= 2
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Accuracy and throughput of skill normalization
+
+Compares normalized and exact string matching on the labelled messy skill
+names of tests/test_skill_normalization.py (which asserts them), and times
+normalizing profiles and computing skill gaps on strings and on integer ID sets. Run from the
+backend directory:
+
+    python -m benchmarks.skill_normalization [profiles]
+"""
+
+import random
+import sys
+import time
+
+from app.services.guidance_catalog import get_catalog
+from app.services.skill_vocabulary import skill_vocabulary
+from tests.test_skill_normalization import LABELLED
+
+def report_accuracy():
+    failures = [
+        (raw, expected, skill_vocabulary.canonical(raw))
+        for raw, expected in LABELLED.items()
+        if skill_vocabulary.canonical(raw) != expected
+    ]
+    known = {skill_vocabulary.name(skill_id) for skill_id in range(len(skill_vocabulary))}
+    exact_hits = sum(1 for raw, expected in LABELLED.items() if (raw if raw in known else None) == expected)
+
+    print(f"normalized accuracy: {len(LABELLED) - len(failures)}/{len(LABELLED)}")
+    print(f"exact-string match:  {exact_hits}/{len(LABELLED)}")
+    for raw, expected, actual in failures:
+        print(f"  {raw!r}: expected {expected!r}, got {actual!r}")
+
+def messy_profiles(count: int, rng: random.Random) -> list:
+    raw_skills = [raw for raw in LABELLED if raw]
+    return [
+        {"technical": rng.sample(raw_skills, 8), "soft": rng.sample(raw_skills, 2), "certifications": []}
+        for _ in range(count)
+    ]
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    report_accuracy()
+
+    profiles = messy_profiles(count, random.Random(7))
+    start = time.perf_counter()
+    normalized = [skill_vocabulary.normalize_current_skills(skills) for skills in profiles]
+    elapsed = time.perf_counter() - start
+    print(f"\nnormalize on save:   {count / elapsed:>10,.0f} profiles/sec")
+
+    required = list(get_catalog().career_paths["student"]["software_engineer"]["required_skills"])
+    required_ids = [(skill, skill_vocabulary.id(skill)) for skill in required]
+
+    start = time.perf_counter()
+    for skills in normalized:
+        current = set(skills["technical"]) | set(skills["soft"])
+        [skill for skill in required if skill not in current]
+    strings = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for skills in normalized:
+        current = skill_vocabulary.canonical_names(skills["technical"]) | skill_vocabulary.canonical_names(skills["soft"])
+        [skill for skill in required if skill not in current]
+    canonical = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for skills in normalized:
+        current_ids = skill_vocabulary.ids(skills["technical"]) | skill_vocabulary.ids(skills["soft"])
+        [skill for skill, skill_id in required_ids if skill_id not in current_ids]
+    ids = time.perf_counter() - start
+    print(f"gap on string sets:  {count / strings:>10,.0f} profiles/sec")
+    print(f"gap on canonical:    {count / canonical:>10,.0f} profiles/sec (as analyze_skill_gaps; tolerates unnormalized names)")
+    print(f"gap on ID sets:      {count / ids:>10,.0f} profiles/sec (includes name -> ID lookup)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmark for cold start: import time and time to the first /health response
+
+Each run uses a fresh interpreter, so nothing is cached between runs. Run from
+the backend directory:
+
+    python -m benchmarks.startup [runs]
+"""
+
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+IMPORT_SCRIPT = "import time; start = time.perf_counter(); import app.main; print(time.perf_counter() - start)"
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def time_import() -> float:
+    """Seconds spent in `import app.main`, measured inside a fresh interpreter"""
+    result = subprocess.run([sys.executable, "-c", IMPORT_SCRIPT], capture_output=True, text=True, check=True)
+    return float(result.stdout.strip().splitlines()[-1])
+
+def time_first_health() -> float:
+    """Seconds from launching uvicorn to the first successful /health response"""
+    port = free_port()
+    url = f"http://127.0.0.1:{port}/health"
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    try:
+        while True:
+            try:
+                with urllib.request.urlopen(url, timeout=1) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - start
+            except OSError:
+                if server.poll() is not None:
+                    raise RuntimeError("uvicorn exited before serving /health")
+                time.sleep(0.005)
+    finally:
+        server.terminate()
+        server.wait()
+
+def report(label: str, samples: list):
+    print(f"{label:<18} median {statistics.median(samples) * 1000:>7.0f} ms   min {min(samples) * 1000:>7.0f} ms")
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    os.environ.setdefault("PYTHONPATH", os.getcwd())
+
+    report("import app.main", [time_import() for _ in range(runs)])
+    report("first /health", [time_first_health() for _ in range(runs)])
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Throughput of the storage backends
+
+Times single and bulk profile writes and reads on the memory and sqlite
+backends. The checks that keep the backends interchangeable are in
+tests/test_storage_backends.py. Run from the backend directory:
+
+    python -m benchmarks.storage_backends [profiles]
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import uuid
+
+from app.storage.base import StorageBackend
+from app.storage.memory import MemoryStorageBackend
+from app.storage.sqlite import SQLiteStorageBackend
+from app.utils.memory_storage import MemoryStorage
+from tests.test_storage_backends import make_profile
+
+async def measure_throughput(backend: StorageBackend, profiles: int):
+    user_ids = [str(uuid.uuid4()) for _ in range(profiles)]
+
+    start = time.perf_counter()
+    for i, user_id in enumerate(user_ids):
+        await backend.save_profile(user_id, make_profile(i))
+    single = profiles / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for user_id in user_ids:
+        await backend.get_profile(user_id)
+    reads = profiles / (time.perf_counter() - start)
+
+    bulk_ids = [str(uuid.uuid4()) for _ in range(profiles)]
+    start = time.perf_counter()
+    for chunk in range(0, profiles, 500):
+        await backend.save_profiles({user_id: make_profile(i) for i, user_id in enumerate(bulk_ids[chunk:chunk + 500])})
+    bulk = profiles / (time.perf_counter() - start)
+
+    print(f"{backend.name:<10} {single:>12,.0f} {bulk:>12,.0f} {reads:>12,.0f}")
+
+async def main():
+    profiles = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        backends = [
+            MemoryStorageBackend(MemoryStorage(max_profiles=profiles * 3)),
+            SQLiteStorageBackend(os.path.join(tmp_dir, "bench.db"))
+        ]
+        print(f"{'backend':<10} {'writes/sec':>12} {'bulk/sec':>12} {'reads/sec':>12}")
+        for backend in backends:
+            await measure_throughput(backend, profiles)
+            await backend.close()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark for authenticated request throughput with and without the token cache
+
+Serves a minimal route guarded by verify_token in-process and sends the same
+bearer token repeatedly, as a dashboard session does. Run from the backend
+directory:
+
+    python -m benchmarks.token_cache [requests]
+"""
+
+import asyncio
+import secrets
+import sys
+import time
+
+import httpx
+from fastapi import Depends, FastAPI
+
+from app.core.config import settings
+
+async def run(client: httpx.AsyncClient, token: str, requests: int) -> float:
+    """Send authenticated requests and return requests/sec"""
+    headers = {"Authorization": f"Bearer {token}"}
+    start = time.perf_counter()
+    for _ in range(requests):
+        response = await client.get("/whoami", headers=headers)
+        assert response.status_code == 200
+    return requests / (time.perf_counter() - start)
+
+async def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    if len(settings.jwt_secret_key) < 32:
+        settings.jwt_secret_key = secrets.token_hex(32)
+
+    from app.core.token_cache import token_cache
+    from app.routers.auth import create_access_token, verify_token
+
+    app = FastAPI()
+
+    @app.get("/whoami")
+    async def whoami(user_id: str = Depends(verify_token)):
+        return {"user_id": user_id}
+
+    token = create_access_token({"sub": "benchmark-user"})
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        max_entries = token_cache.max_entries
+        token_cache.max_entries = 0
+        uncached = await run(client, token, requests)
+        token_cache.max_entries = max_entries
+        cached = await run(client, token, requests)
+
+    print(f"without cache: {uncached:>10,.0f} requests/sec")
+    print(f"with cache:    {cached:>10,.0f} requests/sec")
+    print(f"cache stats:   {token_cache.stats()}")
+
+    # Verification alone, without the HTTP stack
+    class Credentials:
+        credentials = token
+    start = time.perf_counter()
+    for _ in range(requests):
+        verify_token(Credentials)
+    cached_call = (time.perf_counter() - start) / requests
+    token_cache.clear()
+    token_cache.max_entries = 0
+    start = time.perf_counter()
+    for _ in range(requests):
+        verify_token(Credentials)
+    uncached_call = (time.perf_counter() - start) / requests
+    token_cache.max_entries = max_entries
+    print(f"verify_token:  {uncached_call * 1e6:.1f} us uncached, {cached_call * 1e6:.1f} us cached")
+
+if __name__ == "__main__":
+    asyncio.run(main())
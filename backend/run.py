@@ -1,16 +1,22 @@
 #!/usr/bin/env python3
 """
 Run script for AI Career Guidance Platform Backend
+
+    python run.py                       # start the server (one process with auto-reload)
+    python run.py serve --production    # multi-worker server (or set PRODUCTION=true)
+    python run.py import students.csv   # bulk-import profiles (see --help)
 """
 
+import argparse
+import asyncio
 import os
 import sys
 import subprocess
 
 def check_python_version():
     """Check if Python version is compatible"""
-    if sys.version_info < (3, 8):
-        print("Python 3.8 or higher is required")
+    if sys.version_info < (3, 9):
+        print("Python 3.9 or higher is required")
         sys.exit(1)
     print(f"Python {sys.version.split()[0]} detected")
 
@@ -52,8 +58,19 @@ def check_environment():
     print("Environment variables configured")
     return True
 
-def start_server():
+def start_server(production=False, workers=None):
     """Start the FastAPI server"""
+    from app.core.config import settings
+
+    if production or settings.production:
+        # Multi-worker mode: no reload, workers forked after the app is loaded
+        from app.server import serve
+
+        print("Starting AI Career Guidance Platform Backend (production mode)...")
+        print(f"Health Check: http://localhost:{settings.port}/health\n")
+        serve(workers=workers)
+        return
+
     print("Starting AI Career Guidance Platform Backend...")
     print("API Documentation: http://localhost:8000/docs")
     print("Health Check: http://localhost:8000/health")
@@ -70,8 +87,68 @@ def start_server():
         print(f"Server failed to start: {e}")
         sys.exit(1)
 
+def import_profiles(args):
+    """Bulk-import profiles from a CSV or JSONL file into the configured storage"""
+    from app.services.guidance_batch import shutdown_batch_executor
+    from app.services.profile_import import import_profiles as run_import
+    from app.storage import storage
+
+    print(f"Importing {args.file} into {storage.name} storage...")
+
+    async def run():
+        try:
+            return await run_import(
+                args.file,
+                input_format=args.format,
+                chunk_size=args.chunk_size,
+                concurrency=args.concurrency,
+                analyze=args.analyze,
+                checkpoint_path=args.checkpoint,
+                rejects_path=args.rejects,
+                restart=args.restart
+            )
+        finally:
+            shutdown_batch_executor()
+            await storage.close()
+
+    try:
+        stats = asyncio.run(run())
+    except KeyboardInterrupt:
+        print("\nImport interrupted; rerun the same command to resume")
+        sys.exit(1)
+    except (OSError, ValueError, RuntimeError) as e:
+        print(f"Import failed: {e}")
+        sys.exit(1)
+
+    print(f"Import complete: {stats.summary()}")
+    if stats.rejected:
+        print(f"Rejected rows were written to {args.rejects or args.file + '.rejects.jsonl'}")
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="AI Career Guidance Platform backend")
+    commands = parser.add_subparsers(dest="command")
+
+    serve_parser = commands.add_parser("serve", help="Start the server (the default)")
+    serve_parser.add_argument("--production", action="store_true", help="Multi-worker mode (default: PRODUCTION)")
+    serve_parser.add_argument("--workers", type=int, help="Worker processes in production mode (default: WORKERS, or one per CPU)")
+
+    import_parser = commands.add_parser("import", help="Bulk-import profiles from a CSV or JSONL file")
+    import_parser.add_argument("file", help="CSV (with a header row) or JSONL file of profiles, each with a user_id")
+    import_parser.add_argument("--format", choices=["csv", "jsonl"], help="Input format (default: from the file extension)")
+    import_parser.add_argument("--chunk-size", type=int, default=500, help="Profiles per bulk write (default: 500)")
+    import_parser.add_argument("--concurrency", type=int, default=4, help="Chunks written at once (default: 4)")
+    import_parser.add_argument("--analyze", action="store_true", help="Also generate and store each profile's analysis")
+    import_parser.add_argument("--checkpoint", help="Checkpoint file (default: FILE.checkpoint.json)")
+    import_parser.add_argument("--rejects", help="File for rows that fail validation (default: FILE.rejects.jsonl)")
+    import_parser.add_argument("--restart", action="store_true", help="Ignore an existing checkpoint and start from the first row")
+
+    return parser.parse_args()
+
 def main():
     """Main function"""
+    args = parse_args()
+
     print("AI Career Guidance Platform - Backend")
     print("=" * 50)
 
@@ -81,11 +158,18 @@ def main():
     if not check_dependencies():
         sys.exit(1)
 
+    if args.command == "import":
+        import_profiles(args)
+        return
+
     if not check_environment():
         sys.exit(1)
 
     # Start server
-    start_server()
+    start_server(
+        production=getattr(args, "production", False),
+        workers=getattr(args, "workers", None)
+    )
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,16 @@
+"""
+Shared test setup. Run from the backend directory: python -m pytest
+
+Tests use in-memory storage unless they create a backend themselves, so they
+never touch a configured Supabase project.
+"""
+
+import os
+import sys
+
+os.environ["STORAGE_BACKEND"] = "memory"
+os.environ.pop("MEMORY_STORAGE_PATH", None)
+os.environ["PROFILING_TOKEN"] = ""
+os.environ["PROFILING_SAMPLE_EVERY"] = "0"
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,198 @@
+"""
+Saving an analysis must never lose the previous one: when a write fails
+part-way, the rows saved before are still there.
+"""
+
+import asyncio
+import itertools
+from types import SimpleNamespace
+
+import pytest
+from postgrest.exceptions import APIError
+
+from app.storage.sqlite import SQLiteStorageBackend
+from app.storage.supabase import SupabaseStorageBackend
+
+USER_ID = "user-1"
+OTHER_USER_ID = "user-2"
+ANALYSIS_TABLES = ("career_recommendations", "skill_gap_analysis", "job_recommendations", "resume_guidance")
+
+
+def analysis(version: str, user_id: str = USER_ID):
+    """(career_data, skill_data, job_rows, resume_data) tagged with a version"""
+    base = {"user_id": user_id, "profile_id": f"profile-{user_id}"}
+    career = {**base, "career_path": f"Path {version}", "short_term_goals": [], "long_term_goals": [],
+              "industry_trends": [], "salary_potential": "4-6 LPA"}
+    skills = {**base, "missing_skills": [version], "recommended_skills": [], "skill_priority": {}, "time_to_acquire": {}}
+    jobs = [
+        {**base, "title": f"Job {version} {rank}", "company": "Acme", "location": "Remote", "salary_range": "4-6 LPA",
+         "match_score": 90 - rank, "required_skills": [], "description": ""}
+        for rank in range(3)
+    ]
+    resume = {**base, "strengths": [version], "areas_for_improvement": [], "suggested_sections": [],
+              "keyword_suggestions": [], "ats_friendly_tips": []}
+    return career, skills, jobs, resume
+
+
+class FailingQuery:
+    """The slice of the postgrest query builder the storage backend uses"""
+
+    def __init__(self, client: "FailingClient", table: str):
+        self.client = client
+        self.table = table
+        self.operation = "select"
+        self.payload = None
+        self.filters = []
+        self.negate = False
+
+    def insert(self, rows):
+        self.operation, self.payload = "insert", rows
+        return self
+
+    def upsert(self, rows, on_conflict):
+        self.operation, self.payload = "upsert", rows if isinstance(rows, list) else [rows]
+        return self
+
+    def delete(self):
+        self.operation = "delete"
+        return self
+
+    @property
+    def not_(self):
+        self.negate = True
+        return self
+
+    def eq(self, column, value):
+        self.filters.append(lambda row: row[column] == value)
+        return self
+
+    def in_(self, column, values):
+        negate, self.negate = self.negate, False
+        self.filters.append(lambda row: (row[column] in values) != negate)
+        return self
+
+    def execute(self):
+        if (self.table, self.operation) in self.client.fail_on:
+            raise APIError({"code": "08006", "message": f"connection lost during {self.operation} on {self.table}"})
+        rows = self.client.tables[self.table]
+        if self.operation == "insert":
+            inserted = [{**row, "id": f"id-{next(self.client.ids)}"} for row in self.payload]
+            rows.extend(inserted)
+            return SimpleNamespace(data=inserted)
+        if self.operation == "upsert":
+            user_ids = {row["user_id"] for row in self.payload}
+            rows[:] = [row for row in rows if row["user_id"] not in user_ids] + [dict(row) for row in self.payload]
+            return SimpleNamespace(data=self.payload)
+        if self.operation == "delete":
+            deleted = [row for row in rows if all(check(row) for check in self.filters)]
+            rows[:] = [row for row in rows if row not in deleted]
+            return SimpleNamespace(data=deleted)
+        return SimpleNamespace(data=[row for row in rows if all(check(row) for check in self.filters)])
+
+
+class FailingClient:
+    """Supabase client stand-in without the save_analysis function, failing the given (table, operation) writes"""
+
+    def __init__(self, rpc_error_code: str = "PGRST202"):
+        self.tables = {table: [] for table in ANALYSIS_TABLES}
+        self.fail_on = set()
+        self.ids = itertools.count(1)
+        self.rpc_error_code = rpc_error_code  # PGRST202: the function is not installed
+
+    def table(self, name):
+        return FailingQuery(self, name)
+
+    def rpc(self, name, params):
+        def execute():
+            raise APIError({"code": self.rpc_error_code, "message": f"save_analysis failed: {name}"})
+        return SimpleNamespace(execute=execute)
+
+    def rows(self, table, user_id=USER_ID):
+        return [row for row in self.tables[table] if row["user_id"] == user_id]
+
+
+def save(backend, version, user_id=USER_ID):
+    career, skills, jobs, resume = analysis(version, user_id)
+    return asyncio.run(backend.save_analysis(user_id, career["profile_id"], career, skills, jobs, resume))
+
+
+@pytest.mark.parametrize("failing", [
+    ("job_recommendations", "insert"),
+    ("job_recommendations", "delete"),
+    ("career_recommendations", "upsert"),
+    ("skill_gap_analysis", "upsert"),
+    ("resume_guidance", "upsert")
+])
+def test_supabase_fallback_failure_keeps_previous_rows(failing):
+    client = FailingClient()
+    backend = SupabaseStorageBackend(client)
+    save(backend, "old")
+    save(backend, "other", OTHER_USER_ID)
+    assert not backend.analysis_rpc_available
+
+    client.fail_on.add(failing)
+    with pytest.raises(APIError):
+        save(backend, "new")
+
+    # Jobs may have been replaced already, but the user always has a full set
+    titles = {job["title"] for job in client.rows("job_recommendations")}
+    assert {f"Job old {rank}" for rank in range(3)} <= titles or titles == {f"Job new {rank}" for rank in range(3)}
+    # The row whose write failed still holds the old analysis
+    old_rows = dict(zip(ANALYSIS_TABLES, analysis("old")))
+    table, operation = failing
+    if operation == "upsert":
+        assert client.rows(table) == [old_rows[table]]
+    # Other users are untouched
+    assert {job["title"] for job in client.rows("job_recommendations", OTHER_USER_ID)} == {f"Job other {rank}" for rank in range(3)}
+
+
+def test_supabase_rpc_failure_does_not_fall_back():
+    # The function exists but the transaction failed: it rolled back, and
+    # per-table writes must not half-apply the analysis instead
+    client = FailingClient(rpc_error_code="40001")
+    backend = SupabaseStorageBackend(client)
+    with pytest.raises(APIError):
+        save(backend, "new")
+    assert backend.analysis_rpc_available
+    assert all(not rows for rows in client.tables.values())
+
+
+def test_supabase_fallback_replaces_analysis():
+    client = FailingClient()
+    backend = SupabaseStorageBackend(client)
+    save(backend, "old")
+    save(backend, "new")
+    assert [job["title"] for job in client.rows("job_recommendations")] == [f"Job new {rank}" for rank in range(3)]
+    assert client.rows("career_recommendations")[0]["career_path"] == "Path new"
+
+
+def test_sqlite_failed_save_keeps_previous_analysis(tmp_path):
+    backend = SQLiteStorageBackend(str(tmp_path / "analysis.db"))
+    try:
+        save(backend, "old")
+        career, skills, jobs, resume = analysis("new")
+        resume["strengths"] = [object()]  # Not JSON serializable: the write fails
+        with pytest.raises(TypeError):
+            asyncio.run(backend.save_analysis(USER_ID, career["profile_id"], career, skills, jobs, resume))
+
+        stored = asyncio.run(backend.get_analysis(USER_ID))
+        assert stored["career_recommendations"]["career_path"] == "Path old"
+        assert [job["title"] for job in stored["job_recommendations"]] == [f"Job old {rank}" for rank in range(3)]
+    finally:
+        asyncio.run(backend.close())
+
+
+def test_supabase_fallback_saves_many_analyses():
+    client = FailingClient()
+    backend = SupabaseStorageBackend(client)
+    save(backend, "old")
+    analyses = []
+    for user_id in (USER_ID, OTHER_USER_ID):
+        career, skills, jobs, resume = analysis("new", user_id)
+        analyses.append({"user_id": user_id, "profile_id": career["profile_id"], "career_data": career,
+                         "skill_data": skills, "job_rows": jobs, "resume_data": resume})
+    asyncio.run(backend.save_analyses(analyses))
+    assert not backend.analyses_rpc_available
+    for user_id in (USER_ID, OTHER_USER_ID):
+        assert [job["title"] for job in client.rows("job_recommendations", user_id)] == [f"Job new {rank}" for rank in range(3)]
+        assert [row["career_path"] for row in client.rows("career_recommendations", user_id)] == ["Path new"]
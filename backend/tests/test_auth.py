@@ -0,0 +1,84 @@
+"""
+Registration stores a bcrypt hash of the password and login checks it.
+"""
+
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.main import app
+from app.routers import auth
+
+
+class UsersQuery:
+    """The slice of the postgrest query builder the auth routes use on the users table"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.record = None
+        self.changes = None
+        self.filters = []
+
+    def select(self, columns):
+        return self
+
+    def eq(self, column, value):
+        self.filters.append((column, value))
+        return self
+
+    def is_(self, column, value):
+        self.filters.append((column, None if value == "null" else value))
+        return self
+
+    def insert(self, record):
+        self.record = record
+        return self
+
+    def update(self, changes):
+        self.changes = changes
+        return self
+
+    def execute(self):
+        if self.record is not None:
+            row = {**self.record, "id": str(uuid.uuid4()), "created_at": datetime.now(timezone.utc).isoformat()}
+            self.rows.append(row)
+            return SimpleNamespace(data=[row])
+        matched = [row for row in self.rows if all(row.get(column) == value for column, value in self.filters)]
+        if self.changes is not None:
+            for row in matched:
+                row.update(self.changes)
+        return SimpleNamespace(data=matched)
+
+
+@pytest.fixture
+def users(monkeypatch):
+    rows = []
+    monkeypatch.setattr(auth, "get_supabase", lambda: SimpleNamespace(table=lambda name: UsersQuery(rows)))
+    monkeypatch.setattr(settings, "bcrypt_rounds", 4)  # bcrypt's minimum, to keep the test fast
+    return rows
+
+
+def test_login_checks_the_registered_password(users):
+    with TestClient(app) as client:
+        registered = client.post("/api/auth/register", json={"email": "a@example.com", "name": "A", "password": "secret-1"})
+        assert registered.status_code == 200
+        assert "password_hash" not in registered.json()["data"]["user"]
+        assert users[0]["password_hash"].startswith("$2")
+
+        assert client.post("/api/auth/login", json={"email": "a@example.com", "password": "secret-1"}).status_code == 200
+        assert client.post("/api/auth/login", json={"email": "a@example.com", "password": "wrong"}).status_code == 401
+        assert client.post("/api/auth/login", json={"email": "b@example.com", "password": "secret-1"}).status_code == 401
+
+
+def test_account_without_password_hash_sets_it_on_first_login(users):
+    # Created before passwords were stored
+    users.append({"id": str(uuid.uuid4()), "email": "old@example.com", "name": "Old", "created_at": datetime.now(timezone.utc).isoformat()})
+    with TestClient(app) as client:
+        assert client.post("/api/auth/login", json={"email": "old@example.com", "password": "chosen-1"}).status_code == 200
+        assert users[0]["password_hash"].startswith("$2")
+        assert client.post("/api/auth/login", json={"email": "old@example.com", "password": "chosen-1"}).status_code == 200
+        assert client.post("/api/auth/login", json={"email": "old@example.com", "password": "other"}).status_code == 401
@@ -0,0 +1,115 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.routers import dashboard, profile
+from app.services.career_guidance import career_guidance_service
+from app.services.guidance_batch import analysis_rows
+from app.storage.sqlite import SQLiteStorageBackend
+
+USER_ID = "demo_user_1"  # What the placeholder auth returns
+PROFILE = {
+    "education": {"degree": "B.Tech", "field": "Computer Science", "institution": "NIT Trichy", "graduation_year": "2026"},
+    "current_skills": {"technical": ["Python", "SQL"], "soft": ["Communication"], "certifications": []},
+    "career_goals": "I want to become a data scientist",
+    "experience_level": "student"
+}
+
+
+@pytest.fixture
+def sqlite_storage(tmp_path, monkeypatch):
+    backend = SQLiteStorageBackend(str(tmp_path / "dashboard.db"))
+    monkeypatch.setattr(dashboard, "storage", backend)
+    monkeypatch.setattr(profile, "storage", backend)
+    yield backend
+    asyncio.run(backend.close())
+
+
+def test_dashboard_uses_stored_analysis(sqlite_storage, monkeypatch):
+    async def save():
+        saved = await sqlite_storage.save_profile(USER_ID, PROFILE)
+        await profile.save_ai_analysis(USER_ID, saved["id"], saved["updated_at"], PROFILE)
+    asyncio.run(save())
+
+    def regenerate(dashboard_data, profile_data):
+        raise AssertionError("dashboard regenerated the analysis instead of using the stored one")
+    monkeypatch.setattr(dashboard, "apply_generated_analysis", regenerate)
+
+    with TestClient(app) as client:
+        response = client.get("/api/dashboard/")
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["has_profile"]
+
+    expected = career_guidance_service.analyze_skill_gaps(PROFILE)
+    skill_gaps = data["skill_gap_analysis"]
+    assert skill_gaps["missing_skills"] == expected.missing_skills
+    assert skill_gaps["skill_categories"] == dict(expected.skill_categories)
+    assert skill_gaps["skill_topics"].keys() == expected.skill_topics.keys()
+    assert skill_gaps["learning_resources"].keys() == expected.learning_resources.keys()
+
+    jobs = career_guidance_service.generate_job_recommendations(PROFILE)
+    assert [(job["title"], job["apply_link"], job["linkedin_link"]) for job in data["job_recommendations"]] == [
+        (job.title, job.apply_link, job.linkedin_link) for job in jobs
+    ]
+    certifications = career_guidance_service.generate_career_recommendations(PROFILE).certifications
+    assert certifications
+    assert data["career_recommendations"]["certifications"] == certifications
+
+
+def test_dashboard_fills_links_and_certifications_missing_from_older_rows(sqlite_storage):
+    async def save():
+        saved = await sqlite_storage.save_profile(USER_ID, PROFILE)
+        rows = analysis_rows(USER_ID, saved["id"], saved["updated_at"], PROFILE)
+        # As saved before links and certifications were stored
+        del rows["career_data"]["certifications"]
+        for job in rows["job_rows"]:
+            del job["apply_link"], job["linkedin_link"]
+        await sqlite_storage.save_analysis(**rows)
+    asyncio.run(save())
+
+    with TestClient(app) as client:
+        response = client.get("/api/dashboard/")
+    data = response.json()["data"]
+    assert response.headers["x-analysis-source"] == "stored"
+
+    jobs = career_guidance_service.generate_job_recommendations(PROFILE)
+    assert [(job["apply_link"], job["linkedin_link"]) for job in data["job_recommendations"]] == [
+        (job.apply_link, job.linkedin_link) for job in jobs
+    ]
+    certifications = career_guidance_service.generate_career_recommendations(PROFILE).certifications
+    assert data["career_recommendations"]["certifications"] == certifications
+
+
+def test_dashboard_generates_analysis_while_it_is_pending(sqlite_storage):
+    asyncio.run(sqlite_storage.save_profile(USER_ID, PROFILE))
+
+    with TestClient(app) as client:
+        response = client.get("/api/dashboard/")
+    data = response.json()["data"]
+    assert response.headers["x-analysis-source"] == "pending"
+    expected = career_guidance_service.generate_career_recommendations(PROFILE)
+    assert data["career_recommendations"]["career_path"] == expected.career_path
+
+
+def test_dashboard_ignores_analysis_of_an_older_profile_version(sqlite_storage):
+    resubmitted = dict(PROFILE, career_goals="I want to become a software developer")
+
+    async def save():
+        saved = await sqlite_storage.save_profile(USER_ID, PROFILE)
+        await profile.save_ai_analysis(USER_ID, saved["id"], saved["updated_at"], PROFILE)
+        await asyncio.sleep(0.01)
+        # Resubmitted; its analysis is still queued
+        await sqlite_storage.save_profile(USER_ID, resubmitted)
+    asyncio.run(save())
+
+    with TestClient(app) as client:
+        response = client.get("/api/dashboard/")
+    data = response.json()["data"]
+    assert response.headers["x-analysis-source"] == "pending"
+    expected = career_guidance_service.generate_career_recommendations(resubmitted)
+    assert expected.career_path != career_guidance_service.generate_career_recommendations(PROFILE).career_path
+    assert data["career_recommendations"]["career_path"] == expected.career_path
@@ -0,0 +1,45 @@
+import random
+
+import pytest
+
+from app.services.goal_classifier import goal_classifier
+
+
+@pytest.mark.parametrize("goal, track", [
+    ("I want to become a Data Scientist", "data_scientist"),  # Longest keyword wins over "data"
+    ("Full-Stack developer", "full_stack_developer"),
+    ("(DevOps) or SRE", "devops_engineer"),
+    ("software engineering", "software_engineer"),  # Keywords may end mid-word
+    ("“Cyber security” analyst", "cybersecurity_analyst"),  # Non-ASCII text
+    ("Développeur software", "software_engineer"),
+    ("Working with big data as an analyst", "data_analyst"),
+])
+def test_primary_track(goal, track):
+    assert goal_classifier.primary_track(goal) == track
+
+
+@pytest.mark.parametrize("goal", ["", "Not sure yet", "bigdata", "presre", "unsecurity"])
+def test_keywords_must_start_a_word(goal):
+    assert goal_classifier.primary_track(goal) is None
+
+
+def test_classify_weights_sum_to_one():
+    ranked = goal_classifier.classify("software developer who enjoys machine learning and data")
+    assert [track for track, _ in ranked] == ["data_scientist", "software_engineer", "data_analyst"]
+    assert sum(weight for _, weight in ranked) == pytest.approx(1.0)
+
+
+def test_keywords_inside_longer_ones_are_not_counted():
+    assert goal_classifier.classify("data scientist, cyber security") == [
+        ("data_scientist", 0.5), ("cybersecurity_analyst", 0.5)
+    ]
+
+
+def test_primary_track_is_the_first_classified_track():
+    words = ["data", "scientist", "science", "full", "stack", "cyber", "security", "sre", "software",
+             "engineering", "analysts", "devops", "machine", "learning", "misread", "big", "-"]
+    rng = random.Random(0)
+    for _ in range(2000):
+        goal = " ".join(rng.choice(words) for _ in range(rng.randint(0, 8)))
+        ranked = goal_classifier.classify(goal)
+        assert goal_classifier.primary_track(goal) == (ranked[0][0] if ranked else None), goal
@@ -0,0 +1,19 @@
+"""
+Job scores come from popcounts of skill bitsets; the bin() fallback used
+before Python 3.10 gives the same scores as int.bit_count.
+"""
+
+from app.services import job_matcher
+from app.services.guidance_catalog import get_catalog
+from app.services.skill_vocabulary import _bin_popcount
+
+
+def test_popcount_fallback_scores_match(monkeypatch):
+    matcher = job_matcher.get_job_matcher(get_catalog())
+    mask = matcher.vocabulary.mask(["Python", "SQL", "Git", "Docker", "React", "Communication"])
+    expected = matcher.scores(mask)
+    assert max(expected) > 0
+
+    monkeypatch.setattr(job_matcher, "popcount", _bin_popcount)
+    assert matcher.scores(mask) == expected
+    assert _bin_popcount((1 << 200) | 0b1011) == 4
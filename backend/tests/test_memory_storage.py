@@ -0,0 +1,44 @@
+"""
+The in-memory storage log is compacted while running, not only at startup,
+and replaying a compacted log restores the same state.
+"""
+
+from app.utils.memory_storage import MemoryStorage
+
+
+def log_lines(path) -> int:
+    with open(path, "r", encoding="utf-8") as f:
+        return sum(1 for _ in f)
+
+
+def test_log_is_compacted_at_runtime(tmp_path):
+    path = str(tmp_path / "storage.log")
+    storage = MemoryStorage(max_profiles=10, max_chat_messages=5, persist_path=path, compact_min_records=50)
+    for i in range(1000):
+        storage.save_user_profile(f"user-{i % 20}", {"career_goals": f"goal {i}"})
+        storage.save_chat_message(f"user-{i % 20}", f"message {i}", "response")
+    profiles = {user_id: dict(profile) for user_id, profile in storage.user_profiles.items()}
+    chats = {user_id: list(entries) for user_id, entries in storage.chat_history.items()}
+    storage.close()
+
+    # 10 profiles and 10 * 5 chat messages are live; the log never grew past
+    # the threshold or twice the live entries by much
+    assert storage.compactions > 0
+    assert log_lines(path) <= 2 * 60 + 1
+
+    recovered = MemoryStorage(max_profiles=10, max_chat_messages=5, persist_path=path, compact_min_records=50)
+    try:
+        assert {user_id: dict(profile) for user_id, profile in recovered.user_profiles.items()} == profiles
+        assert {user_id: list(entries) for user_id, entries in recovered.chat_history.items()} == chats
+    finally:
+        recovered.close()
+
+
+def test_small_log_is_left_alone(tmp_path):
+    path = str(tmp_path / "storage.log")
+    storage = MemoryStorage(persist_path=path, compact_min_records=1000)
+    for i in range(100):
+        storage.save_user_profile("user-1", {"career_goals": f"goal {i}"})
+    storage.close()
+    assert storage.compactions == 0
+    assert log_lines(path) == 100
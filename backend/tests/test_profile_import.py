@@ -0,0 +1,65 @@
+"""
+Bulk import: the last row for a user wins even when chunks are written
+concurrently, and analyses are saved with one call per chunk.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from app.services import profile_import
+from app.storage.sqlite import SQLiteStorageBackend
+
+PROFILE = {
+    "education": {"degree": "B.Tech", "field": "Computer Science"},
+    "current_skills": {"technical": ["Python"], "soft": [], "certifications": []},
+    "experience_level": "student"
+}
+
+
+@pytest.fixture
+def sqlite_storage(tmp_path, monkeypatch):
+    backend = SQLiteStorageBackend(str(tmp_path / "import.db"))
+    monkeypatch.setattr(profile_import, "storage", backend)
+    # Analyses on the default thread pool rather than a process pool
+    monkeypatch.setattr(profile_import, "get_batch_executor", lambda: None)
+    yield backend
+    asyncio.run(backend.close())
+
+
+def test_last_row_wins_across_concurrent_chunks(sqlite_storage, tmp_path, monkeypatch):
+    batches = []
+    save_analyses = sqlite_storage.save_analyses
+
+    async def record_batch(analyses):
+        batches.append(len(analyses))
+        await save_analyses(analyses)
+    monkeypatch.setattr(sqlite_storage, "save_analyses", record_batch)
+
+    # Earlier chunks are slower to write, so unordered chunks would finish last-first
+    delays = iter([0.08, 0.06, 0.04, 0.02])
+    save_profiles = sqlite_storage.save_profiles
+
+    async def slow_save(profiles):
+        await asyncio.sleep(next(delays))
+        return await save_profiles(profiles)
+    monkeypatch.setattr(sqlite_storage, "save_profiles", slow_save)
+
+    # user-0 appears in every chunk; its last row names the data analyst goal
+    path = tmp_path / "profiles.jsonl"
+    goals = ["software developer", "devops engineer", "security engineer", "data analyst"]
+    with open(path, "w", encoding="utf-8") as f:
+        for goal in goals:
+            f.write(json.dumps({**PROFILE, "user_id": "user-0", "career_goals": goal}) + "\n")
+            f.write(json.dumps({**PROFILE, "user_id": f"user-{goal}", "career_goals": goal}) + "\n")
+
+    stats = asyncio.run(profile_import.import_profiles(str(path), chunk_size=2, concurrency=4, analyze=True))
+    assert (stats.imported, stats.analyzed) == (8, 8)
+    assert batches == [2, 2, 2, 2]
+
+    stored = asyncio.run(sqlite_storage.get_profile("user-0"))
+    assert stored["career_goals"] == "data analyst"
+    analysis = asyncio.run(sqlite_storage.get_analysis("user-0"))
+    assert analysis["career_recommendations"]["profile_id"] == stored["id"]
+    assert "Data Analytics" in analysis["career_recommendations"]["career_path"]
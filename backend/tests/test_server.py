@@ -0,0 +1,44 @@
+"""
+The multi-worker server: in-memory storage runs on one worker only, and the
+batch guidance pool is split between the workers.
+"""
+
+import pytest
+
+from app import server
+from app.core.config import settings
+from app.services import guidance_batch
+
+
+@pytest.fixture
+def no_fork(monkeypatch):
+    """serve() up to the point where it would bind the socket"""
+    monkeypatch.setattr(server, "preload", lambda: None)
+    monkeypatch.setattr(server, "bind_socket", lambda host, port: (_ for _ in ()).throw(RuntimeError("bind")))
+    yield
+    guidance_batch.share_batch_workers(1)
+
+
+def test_memory_storage_refuses_several_workers(no_fork):
+    with pytest.raises(SystemExit):
+        server.serve(workers=2)
+
+
+def test_memory_storage_defaults_to_one_worker(no_fork, monkeypatch):
+    monkeypatch.setattr(server, "default_workers", lambda: 8)
+    monkeypatch.setattr(settings, "workers", 0)
+    with pytest.raises(RuntimeError, match="bind"):
+        server.serve()
+    assert guidance_batch._server_processes == 1
+
+
+def test_batch_workers_split_between_server_processes(monkeypatch):
+    monkeypatch.setattr(settings, "guidance_batch_workers", 8)
+    try:
+        guidance_batch.share_batch_workers(4)
+        assert guidance_batch.batch_workers() == 2
+        guidance_batch.share_batch_workers(16)
+        assert guidance_batch.batch_workers() == 1
+    finally:
+        guidance_batch.share_batch_workers(1)
+    assert guidance_batch.batch_workers() == 8
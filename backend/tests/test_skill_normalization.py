@@ -0,0 +1,64 @@
+"""
+Skill normalization on messy, real-world style input: case, spacing,
+versions, aliases and punctuation resolve to the catalog's canonical names.
+"""
+
+import pytest
+
+from app.services.career_guidance import CareerGuidanceService
+from app.services.guidance_catalog import get_catalog
+from app.services.skill_vocabulary import skill_vocabulary
+
+# raw input -> expected canonical name (None: must stay unknown)
+LABELLED = {
+    "python": "Python", "Python3": "Python", "Python 3.11": "Python", " python ": "Python",
+    "PYTHON,": "Python", "py": "Python", "javascript": "JavaScript", "JS": "JavaScript",
+    "Java Script": "JavaScript", "ES6": "JavaScript", "typescript": "TypeScript", "TS": "TypeScript",
+    "ReactJS": "React", "React.js": "React", "react v18": "React", "NodeJS": "Node.js",
+    "node js": "Node.js", "Express": "Express.js", "nextjs": "Next.js", "html": "HTML/CSS",
+    "CSS3": "HTML/CSS", "HTML & CSS": "HTML/CSS", "mysql": "SQL", "Postgres": "PostgreSQL",
+    "mongo db": "MongoDB", "REST API": "REST APIs", "restful apis": "REST APIs", "git": "Git",
+    "GitHub": "GitHub", "k8s": "Kubernetes", "docker": "Docker", "AWS Cloud": "AWS",
+    "Amazon Web Services": "AWS", "ci/cd": "CI/CD", "CICD": "CI/CD", "golang": "Go",
+    "Go 1.21": "Go", "bash": "Shell Scripting", "ML": "Machine Learning",
+    "machine   learning": "Machine Learning", "sklearn": "Scikit-learn", "Tensor Flow": "TensorFlow",
+    "pytorch": "PyTorch", "numpy": "NumPy", "pandas": "Pandas", "PowerBI": "Power BI",
+    "ms excel": "Excel", "DSA": "Data Structures", "problem-solving": "Problem Solving",
+    "team work": "Teamwork", "communication skills": "Communication", "cpp": "C++",
+    "Java": "Java", "Java 8": "Java", "R": "R", "pen testing": "Penetration Testing",
+    ".NET": ".NET", ".net": ".NET", "dotnet": ".NET", ".NET Core": ".NET", "'.NET',": ".NET",
+    "C": "C", "c": "C", "C programming": "C", "C#": None,
+    "S3": None, "Web3": None, "Flask": None, "Figma": None, "": None,
+}
+
+
+@pytest.mark.parametrize("raw, expected", LABELLED.items())
+def test_canonical(raw, expected):
+    assert skill_vocabulary.canonical(raw) == expected
+
+
+def test_normalize_current_skills_drops_duplicates():
+    normalized = skill_vocabulary.normalize_current_skills({"technical": ["python", "Python3", "k8s"], "soft": [], "certifications": []})
+    assert normalized["technical"] == ["Python", "Kubernetes"]
+
+
+def test_normalize_keeps_dots_that_belong_to_the_name():
+    assert skill_vocabulary.normalize([" .NET,", "Node.js;", "ASP.NET", "C"]) == [".NET", "Node.js", "ASP.NET", "C"]
+
+
+def test_catalog_skills_are_canonical():
+    # analyze_skill_gaps compares catalog names with canonical names as strings
+    catalog = get_catalog()
+    for tracks in catalog.career_paths.values():
+        for path in tracks.values():
+            for skill in list(path["required_skills"]) + list(path["recommended_skills"]):
+                assert skill_vocabulary.canonical(skill) == skill
+
+
+def test_skill_gaps_match_unnormalized_spellings():
+    profile = {
+        "experience_level": "student",
+        "current_skills": {"technical": ["python3", "GIT", "Java Script"], "soft": ["problem-solving"]}
+    }
+    missing = CareerGuidanceService().analyze_skill_gaps(profile).missing_skills
+    assert not {"Python", "Git", "JavaScript", "Problem Solving"} & set(missing)
@@ -0,0 +1,88 @@
+"""
+Every storage backend behaves as the routers rely on, so they stay
+interchangeable. Supabase is left out: tests never touch a configured project.
+"""
+
+import asyncio
+import uuid
+
+import pytest
+
+from app.storage.memory import MemoryStorageBackend
+from app.storage.sqlite import SQLiteStorageBackend
+from app.utils.memory_storage import MemoryStorage
+
+
+def make_profile(i: int) -> dict:
+    return {
+        "education": {"degree": "B.Tech", "field": "Computer Science"},
+        "current_skills": {"technical": ["Python", "SQL"], "soft": ["Communication"]},
+        "career_goals": "software developer" if i % 2 else "data scientist",
+        "experience_level": "student"
+    }
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        backend = MemoryStorageBackend(MemoryStorage())
+    else:
+        backend = SQLiteStorageBackend(str(tmp_path / "conformance.db"))
+    yield backend
+    asyncio.run(backend.close())
+
+
+def test_profile_round_trip(backend):
+    async def check():
+        user_id = str(uuid.uuid4())
+        assert await backend.get_profile(user_id) is None
+
+        saved = await backend.save_profile(user_id, make_profile(0))
+        assert saved["user_id"] == user_id and saved["career_goals"] == "data scientist"
+        assert {"id", "created_at", "updated_at"} <= saved.keys()
+
+        fetched = await backend.get_profile(user_id)
+        assert fetched["current_skills"] == make_profile(0)["current_skills"]
+
+        await asyncio.sleep(0.01)
+        updated = await backend.save_profile(user_id, make_profile(1))
+        assert updated["id"] == saved["id"], "profile ID must be stable across updates"
+        assert updated["updated_at"] != saved["updated_at"], "updated_at must change on every save"
+    asyncio.run(check())
+
+
+def test_bulk_profiles(backend):
+    async def check():
+        user_ids = [str(uuid.uuid4()) for _ in range(3)]
+        bulk = await backend.save_profiles({user_id: make_profile(i) for i, user_id in enumerate(user_ids)})
+        assert len(bulk) == 3
+        found = await backend.get_profiles(user_ids + [str(uuid.uuid4())])
+        assert set(found) == set(user_ids)
+    asyncio.run(check())
+
+
+def test_dashboard(backend):
+    async def check():
+        user_id = str(uuid.uuid4())
+        saved = await backend.save_profile(user_id, make_profile(0))
+        dashboard = await backend.get_dashboard(user_id)
+        assert dashboard["user_profile"]["id"] == saved["id"]
+
+        if not backend.persists_analysis:
+            assert dashboard["analysis"] is None
+            return
+        jobs = [
+            {"user_id": user_id, "profile_id": saved["id"], "title": f"Job {score}", "match_score": score}
+            for score in (70, 90, 80)
+        ]
+        await backend.save_analysis(
+            user_id, saved["id"],
+            {"user_id": user_id, "career_path": "Software Engineer"},
+            {"user_id": user_id, "missing_skills": ["Docker"]},
+            jobs,
+            {"user_id": user_id, "strengths": ["Python"]}
+        )
+        analysis = (await backend.get_dashboard(user_id))["analysis"]
+        assert analysis["career_recommendations"]["career_path"] == "Software Engineer"
+        assert [job["match_score"] for job in analysis["job_recommendations"]] == [90, 80, 70]
+    asyncio.run(check())
@@ -11,6 +11,11 @@
 -- 5. job_recommendations - AI-suggested job opportunities
 -- 6. resume_guidance - AI-powered resume improvement suggestions
 --
+-- FUNCTIONS CREATED:
+-- get_dashboard(user_id) - whole dashboard payload in one JSON document
+-- save_analysis(...) - replaces all four analysis rows in one transaction
+-- save_analyses(analyses) - save_analysis for many users in one transaction
+--
 -- SETUP INSTRUCTIONS:
 -- 1. Go to your Supabase Dashboard
 -- 2. Navigate to SQL Editor
@@ -28,9 +33,13 @@ CREATE TABLE IF NOT EXISTS users (
     id UUID DEFAULT gen_random_uuid() PRIMARY KEY,
     email TEXT UNIQUE NOT NULL,
     name TEXT NOT NULL,
+    password_hash TEXT,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
+-- bcrypt hash checked at login; added here for databases created before it
+-- existed. Accounts without one set their password on their next login.
+ALTER TABLE users ADD COLUMN IF NOT EXISTS password_hash TEXT;
 
 -- User profiles table - stores user-entered details
 CREATE TABLE IF NOT EXISTS user_profiles (
@@ -67,6 +76,7 @@ CREATE TABLE IF NOT EXISTS career_recommendations (
     long_term_goals TEXT[] NOT NULL,   -- Array of long-term goals
     industry_trends TEXT[] NOT NULL,   -- Array of industry trends
     salary_potential TEXT NOT NULL,
+    certifications JSONB,              -- [{name, provider, link, ...}] the dashboard lists
 
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
@@ -108,6 +118,8 @@ CREATE TABLE IF NOT EXISTS job_recommendations (
     match_score INTEGER NOT NULL CHECK (match_score >= 0 AND match_score <= 100),
     required_skills TEXT[] NOT NULL,  -- Skills required for this job
     description TEXT NOT NULL,
+    apply_link TEXT,
+    linkedin_link TEXT,
 
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
@@ -115,6 +127,12 @@ CREATE TABLE IF NOT EXISTS job_recommendations (
     -- Note: Multiple job recommendations per user allowed
 );
 
+-- Added after the tables above first shipped; rows written before stay NULL
+-- and the backend fills them in from the catalog when reading
+ALTER TABLE career_recommendations ADD COLUMN IF NOT EXISTS certifications JSONB;
+ALTER TABLE job_recommendations ADD COLUMN IF NOT EXISTS apply_link TEXT;
+ALTER TABLE job_recommendations ADD COLUMN IF NOT EXISTS linkedin_link TEXT;
+
 -- Resume guidance table - stores AI-generated resume improvement suggestions
 CREATE TABLE IF NOT EXISTS resume_guidance (
     id UUID DEFAULT gen_random_uuid() PRIMARY KEY,
@@ -134,6 +152,12 @@ CREATE TABLE IF NOT EXISTS resume_guidance (
     UNIQUE(user_id)  -- One guidance per user
 );
 
+-- The profile's updated_at when the analysis was generated; the dashboard
+-- generates the analysis instead while it doesn't match the current profile
+ALTER TABLE career_recommendations ADD COLUMN IF NOT EXISTS profile_version TEXT;
+ALTER TABLE skill_gap_analysis ADD COLUMN IF NOT EXISTS profile_version TEXT;
+ALTER TABLE resume_guidance ADD COLUMN IF NOT EXISTS profile_version TEXT;
+
 -- Create indexes for better performance
 CREATE INDEX IF NOT EXISTS idx_user_profiles_user_id ON user_profiles(user_id);
 CREATE INDEX IF NOT EXISTS idx_career_recommendations_user_id ON career_recommendations(user_id);
@@ -237,4 +261,167 @@ CREATE TRIGGER update_resume_guidance_updated_at
     BEFORE UPDATE ON resume_guidance
     FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 
--- Note: job_recommendations doesn't have updated_at trigger as it's primarily insert-only
\ No newline at end of file
+-- Note: job_recommendations doesn't have updated_at trigger as it's primarily insert-only
+
+-- ============================================================================
+-- Dashboard read function
+-- ============================================================================
+-- Returns the whole dashboard payload for a user as one JSON document, so the
+-- backend loads a dashboard in a single round-trip instead of five:
+-- {user_profile, career_recommendations, skill_gap_analysis,
+--  job_recommendations[] (best match first), resume_guidance}
+-- SECURITY INVOKER keeps the Row Level Security policies above in effect.
+-- Called via PostgREST: POST /rest/v1/rpc/get_dashboard {"p_user_id": "..."}
+CREATE OR REPLACE FUNCTION get_dashboard(p_user_id UUID)
+RETURNS JSONB AS $$
+    SELECT jsonb_build_object(
+        'user_profile',
+            (SELECT to_jsonb(p) FROM user_profiles p WHERE p.user_id = p_user_id ORDER BY p.updated_at DESC LIMIT 1),
+        'career_recommendations',
+            (SELECT to_jsonb(c) FROM career_recommendations c WHERE c.user_id = p_user_id),
+        'skill_gap_analysis',
+            (SELECT to_jsonb(s) FROM skill_gap_analysis s WHERE s.user_id = p_user_id),
+        'job_recommendations',
+            COALESCE(
+                (SELECT jsonb_agg(to_jsonb(j) ORDER BY j.match_score DESC) FROM job_recommendations j WHERE j.user_id = p_user_id),
+                '[]'::jsonb
+            ),
+        'resume_guidance',
+            (SELECT to_jsonb(r) FROM resume_guidance r WHERE r.user_id = p_user_id)
+    );
+$$ LANGUAGE sql STABLE SECURITY INVOKER;
+
+
+-- ============================================================================
+-- Analysis write function
+-- ============================================================================
+-- Replaces a user's career recommendations, skill gap analysis, job
+-- recommendations and resume guidance in a single transaction: either all
+-- four are written or, on any error, the previous analysis is left intact.
+-- Called via PostgREST: POST /rest/v1/rpc/save_analysis
+-- {"p_user_id", "p_profile_id", "p_career", "p_skills", "p_jobs": [...], "p_resume"}
+
+-- Users may replace their own job recommendations
+DROP POLICY IF EXISTS "Users can delete their own job recommendations" ON job_recommendations;
+CREATE POLICY "Users can delete their own job recommendations" ON job_recommendations
+    FOR DELETE USING (auth.uid() = user_id);
+
+-- Convert a JSON array of strings to TEXT[] (empty array for NULL)
+CREATE OR REPLACE FUNCTION jsonb_text_array(p_value JSONB)
+RETURNS TEXT[] AS $$
+    SELECT ARRAY(SELECT jsonb_array_elements_text(COALESCE(p_value, '[]'::jsonb)));
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION save_analysis(
+    p_user_id UUID,
+    p_profile_id UUID,
+    p_career JSONB,
+    p_skills JSONB,
+    p_jobs JSONB,
+    p_resume JSONB
+)
+RETURNS VOID AS $$
+BEGIN
+    INSERT INTO career_recommendations (
+        user_id, profile_id, profile_version, career_path, short_term_goals, long_term_goals, industry_trends,
+        salary_potential, certifications
+    )
+    VALUES (
+        p_user_id, p_profile_id, p_career->>'profile_version',
+        p_career->>'career_path',
+        jsonb_text_array(p_career->'short_term_goals'),
+        jsonb_text_array(p_career->'long_term_goals'),
+        jsonb_text_array(p_career->'industry_trends'),
+        p_career->>'salary_potential',
+        COALESCE(p_career->'certifications', '[]'::jsonb)
+    )
+    ON CONFLICT (user_id) DO UPDATE SET
+        profile_id = EXCLUDED.profile_id,
+        profile_version = EXCLUDED.profile_version,
+        career_path = EXCLUDED.career_path,
+        short_term_goals = EXCLUDED.short_term_goals,
+        long_term_goals = EXCLUDED.long_term_goals,
+        industry_trends = EXCLUDED.industry_trends,
+        salary_potential = EXCLUDED.salary_potential,
+        certifications = EXCLUDED.certifications;
+
+    INSERT INTO skill_gap_analysis (
+        user_id, profile_id, profile_version, missing_skills, recommended_skills, skill_priority, time_to_acquire
+    )
+    VALUES (
+        p_user_id, p_profile_id, p_skills->>'profile_version',
+        jsonb_text_array(p_skills->'missing_skills'),
+        jsonb_text_array(p_skills->'recommended_skills'),
+        COALESCE(p_skills->'skill_priority', '{}'::jsonb),
+        COALESCE(p_skills->'time_to_acquire', '{}'::jsonb)
+    )
+    ON CONFLICT (user_id) DO UPDATE SET
+        profile_id = EXCLUDED.profile_id,
+        profile_version = EXCLUDED.profile_version,
+        missing_skills = EXCLUDED.missing_skills,
+        recommended_skills = EXCLUDED.recommended_skills,
+        skill_priority = EXCLUDED.skill_priority,
+        time_to_acquire = EXCLUDED.time_to_acquire;
+
+    DELETE FROM job_recommendations WHERE user_id = p_user_id;
+
+    INSERT INTO job_recommendations (
+        user_id, profile_id, title, company, location, salary_range, match_score, required_skills, description,
+        apply_link, linkedin_link
+    )
+    SELECT
+        p_user_id, p_profile_id,
+        job->>'title',
+        job->>'company',
+        job->>'location',
+        job->>'salary_range',
+        (job->>'match_score')::INTEGER,
+        jsonb_text_array(job->'required_skills'),
+        job->>'description',
+        job->>'apply_link',
+        job->>'linkedin_link'
+    FROM jsonb_array_elements(COALESCE(p_jobs, '[]'::jsonb)) AS job;
+
+    INSERT INTO resume_guidance (
+        user_id, profile_id, profile_version, strengths, areas_for_improvement, suggested_sections, keyword_suggestions,
+        ats_friendly_tips
+    )
+    VALUES (
+        p_user_id, p_profile_id, p_resume->>'profile_version',
+        jsonb_text_array(p_resume->'strengths'),
+        jsonb_text_array(p_resume->'areas_for_improvement'),
+        jsonb_text_array(p_resume->'suggested_sections'),
+        jsonb_text_array(p_resume->'keyword_suggestions'),
+        jsonb_text_array(p_resume->'ats_friendly_tips')
+    )
+    ON CONFLICT (user_id) DO UPDATE SET
+        profile_id = EXCLUDED.profile_id,
+        profile_version = EXCLUDED.profile_version,
+        strengths = EXCLUDED.strengths,
+        areas_for_improvement = EXCLUDED.areas_for_improvement,
+        suggested_sections = EXCLUDED.suggested_sections,
+        keyword_suggestions = EXCLUDED.keyword_suggestions,
+        ats_friendly_tips = EXCLUDED.ats_friendly_tips;
+END;
+$$ LANGUAGE plpgsql SECURITY INVOKER;
+
+-- Saves many users' analyses in a single transaction (bulk import).
+-- Called via PostgREST: POST /rest/v1/rpc/save_analyses
+-- {"p_analyses": [{"p_user_id", "p_profile_id", "p_career", "p_skills", "p_jobs", "p_resume"}, ...]}
+CREATE OR REPLACE FUNCTION save_analyses(p_analyses JSONB)
+RETURNS VOID AS $$
+DECLARE
+    analysis JSONB;
+BEGIN
+    FOR analysis IN SELECT * FROM jsonb_array_elements(COALESCE(p_analyses, '[]'::jsonb)) LOOP
+        PERFORM save_analysis(
+            (analysis->>'p_user_id')::UUID,
+            (analysis->>'p_profile_id')::UUID,
+            analysis->'p_career',
+            analysis->'p_skills',
+            analysis->'p_jobs',
+            analysis->'p_resume'
+        );
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql SECURITY INVOKER;